@@ -23,11 +23,13 @@ from homeassistant.helpers import area_registry, device_registry, entity_registr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
+    BASE_PLATFORMS,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
     async_set_domains_to_be_loaded,
     async_setup_component,
+    async_start_setup,
 )
 from homeassistant.util.async_ import gather_with_concurrency
 import homeassistant.util.dt as dt_util
@@ -440,6 +442,47 @@ async def async_setup_multi_components(
         )
 
 
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    integrations: dict[str, loader.Integration],
+    platforms: set[str],
+) -> None:
+    """Import integrations and their platforms in the executor.
+
+    An integration is imported once its dependencies are imported, so the
+    imports run in parallel in topological order. The import time is
+    tracked with the setup time of the integration.
+    """
+    loaded = hass.data.setdefault(loader.DATA_COMPONENTS, {})
+    import_tasks: dict[str, asyncio.Task] = {}
+
+    async def _async_preimport(integration: loader.Integration) -> None:
+        try:
+            dependencies = integration.all_dependencies
+        except RuntimeError:
+            dependencies = set()
+        if dependency_tasks := [
+            import_tasks[dep] for dep in dependencies if dep in import_tasks
+        ]:
+            await asyncio.wait(dependency_tasks)
+
+        with async_start_setup(hass, [integration.domain]):
+            try:
+                await hass.async_add_executor_job(integration.import_modules, platforms)
+            except Exception:  # pylint: disable=broad-except
+                # Setting up the integration imports it again and reports errors
+                _LOGGER.debug(
+                    "Unable to pre-import %s", integration.domain, exc_info=True
+                )
+
+    for domain, integration in integrations.items():
+        if domain not in loaded:
+            import_tasks[domain] = hass.async_create_task(_async_preimport(integration))
+
+    if import_tasks:
+        await asyncio.wait(import_tasks.values())
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -525,11 +568,20 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
-    # Load the registries
+    # Load the registries and import the integrations to be set up
     await asyncio.gather(
         device_registry.async_load(hass),
         entity_registry.async_load(hass),
         area_registry.async_load(hass),
+        _async_preimport_integrations(
+            hass,
+            {
+                domain: integration
+                for domain, integration in integration_cache.items()
+                if domain in stage_1_domains or domain in stage_2_domains
+            },
+            domains_to_setup & BASE_PLATFORMS,
+        ),
     )
 
     # Start setup
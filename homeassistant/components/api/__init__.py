@@ -13,6 +13,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     MATCH_ALL,
@@ -209,7 +210,14 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        try:
+            states_json = b",".join(state.as_dict_json() for state in states)
+        except (ValueError, TypeError):
+            # Let the generic path log the bad data and fail the request
+            return self.json(states)
+        return web.Response(
+            body=b"[" + states_json + b"]", content_type=CONTENT_TYPE_JSON
+        )
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -227,7 +235,11 @@ class APIEntityStateView(HomeAssistantView):
 
         state = request.app["hass"].states.get(entity_id)
         if state:
-            return self.json(state)
+            try:
+                state_json = state.as_dict_json()
+            except (ValueError, TypeError):
+                return self.json(state)
+            return web.Response(body=state_json, content_type=CONTENT_TYPE_JSON)
         return self.json_message("Entity not found.", HTTPStatus.NOT_FOUND)
 
     async def post(self, request, entity_id):
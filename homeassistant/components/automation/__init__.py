@@ -1,6 +1,7 @@
 """Allow to set up simple automation rules via the config file."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Awaitable, Callable, Dict, TypedDict, cast
 
@@ -45,6 +46,7 @@ from homeassistant.helpers import condition, extract_domain_configs, template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reload import config_fingerprint
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -262,8 +264,8 @@ async def async_setup(hass, config):
     )
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = await component.async_prepare_reload()
+        """Replace the automations of which the config changed."""
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
         async_get_blueprints(hass).async_reset_cache()
@@ -320,6 +322,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._blueprint_inputs = blueprint_inputs
         self._trace_config = trace_config
         self._attr_unique_id = automation_id
+        self.config_fingerprint = config_fingerprint(name, raw_config, blueprint_inputs)
 
     @property
     def extra_state_attributes(self):
@@ -623,10 +626,18 @@ async def _async_process_config(
 ) -> bool:
     """Process config and add automations.
 
+    Automations of which the config didn't change since they were added are
+    kept running, the other automations are removed.
+
     Returns if blueprints were used.
     """
     entities = []
     blueprints_used = False
+    unchanged: dict[str, list[AutomationEntity]] = {}
+    for entity in component.entities:
+        if entity.config_fingerprint is not None:
+            unchanged.setdefault(entity.config_fingerprint, []).append(entity)
+    kept: set[str] = set()
 
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: list[dict[str, Any] | blueprint.BlueprintInputs] = config[config_key]
@@ -659,6 +670,11 @@ async def _async_process_config(
             automation_id = config_block.get(CONF_ID)
             name = config_block.get(CONF_ALIAS) or f"{config_key} {list_no}"
 
+            fingerprint = config_fingerprint(name, raw_config, raw_blueprint_inputs)
+            if unchanged.get(fingerprint):
+                kept.add(unchanged[fingerprint].pop().entity_id)
+                continue
+
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
             action_script = Script(
@@ -712,6 +728,15 @@ async def _async_process_config(
 
             entities.append(entity)
 
+    if removed := [
+        entity.entity_id
+        for entity in component.entities
+        if entity.entity_id not in kept
+    ]:
+        await asyncio.gather(
+            *(component.async_remove_entity(entity_id) for entity_id in removed)
+        )
+
     if entities:
         await component.async_add_entities(entities)
 
@@ -64,7 +64,7 @@ from .const import (
     DOMAIN,
     SERVICE_RECORD,
 )
-from .img_util import scale_jpeg_camera_image
+from .img_util import ScaledImageCache, scale_jpeg_camera_image
 from .prefs import CameraPreferences
 
 # mypy: allow-untyped-calls
@@ -154,7 +154,37 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    Requests for the same size made while an image is
+    fetched share the fetch.
     """
+    # pylint: disable=protected-access
+    key = (width, height)
+    if (request := camera._image_requests.get(key)) is None:
+        request = camera._image_requests[key] = camera.hass.async_create_task(
+            _async_fetch_image(camera, timeout, width, height)
+        )
+
+        @callback
+        def _async_request_done(request: asyncio.Task) -> None:
+            """Forget the request once it is done."""
+            del camera._image_requests[key]
+            if not request.cancelled():
+                # The exception is retrieved by the callers still waiting
+                request.exception()
+
+        request.add_done_callback(_async_request_done)
+
+    return await asyncio.shield(request)
+
+
+async def _async_fetch_image(
+    camera: Camera,
+    timeout: int,
+    width: int | None,
+    height: int | None,
+) -> Image:
+    """Fetch a snapshot image from a camera and scale it."""
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
             # Calling inspect will be removed in 2022.1 after all
@@ -179,7 +209,8 @@ async def _async_get_image(
                     assert width is not None
                     assert height is not None
                     return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
+                        content_type,
+                        await _async_scale_image(camera, image, width, height),
                     )
 
                 return image
@@ -187,6 +218,19 @@ async def _async_get_image(
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_scale_image(
+    camera: Camera, image: Image, width: int, height: int
+) -> bytes:
+    """Scale an image in the executor, reusing recently scaled images."""
+    cache = camera._scaled_images  # pylint: disable=protected-access
+    if (scaled := cache.get(image.content, width, height)) is None:
+        scaled = await camera.hass.async_add_executor_job(
+            scale_jpeg_camera_image, image, width, height
+        )
+        cache.set(image.content, width, height, scaled)
+    return scaled
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -237,16 +281,7 @@ async def async_get_still_stream(
 
     async def write_to_mjpeg_stream(img_bytes: bytes) -> None:
         """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                "Content-Type: {}\r\n"
-                "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
+        await response.write(_mjpeg_frame(content_type, img_bytes))
 
     last_image = None
 
@@ -269,6 +304,115 @@ async def async_get_still_stream(
     return response
 
 
+def _mjpeg_frame(content_type: str, img_bytes: bytes) -> bytes:
+    """Return an image as a part of an MJPEG stream."""
+    return (
+        bytes(
+            "--frameboundary\r\n"
+            "Content-Type: {}\r\n"
+            "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
+            "utf-8",
+        )
+        + img_bytes
+        + b"\r\n"
+    )
+
+
+class StillStreamBroadcaster:
+    """Serve the same MJPEG stream of camera images to all its viewers.
+
+    One task fetches the images at the interval while there are viewers.
+    A new image is framed once and written to every viewer, viewers which
+    are too slow skip images. Viewers which disconnected are noticed after
+    the next image is fetched.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        content_type: str,
+        interval: float,
+    ) -> None:
+        """Initialize the broadcaster."""
+        self.hass = hass
+        self.image_cb = image_cb
+        self.content_type = content_type
+        self.interval = interval
+        self.viewers = 0
+        self._frame: bytes | None = None
+        self._sequence = 0
+        self._new_frame = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.done = False
+
+    async def async_serve(self, request: web.Request) -> web.StreamResponse:
+        """Serve the stream to a viewer until the stream ends or it disconnects."""
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
+
+        self.viewers += 1
+        if self._task is None:
+            self._task = self.hass.loop.create_task(self._async_fetch_images())
+        try:
+            await response.prepare(request)
+            sequence = 0
+            while True:
+                if request.transport is None or request.transport.is_closing():
+                    break
+                if sequence == self._sequence:
+                    if self.done:
+                        break
+                    await self._new_frame.wait()
+                    continue
+
+                frame = self._frame
+                assert frame is not None
+                await response.write(frame)
+                # Chrome seems to always ignore first picture,
+                # print it twice.
+                if not sequence:
+                    await response.write(frame)
+                sequence = self._sequence
+        finally:
+            self.viewers -= 1
+            if not self.viewers and not self.done:
+                assert self._task is not None
+                self.done = True
+                self._task.cancel()
+
+        return response
+
+    async def _async_fetch_images(self) -> None:
+        """Fetch the images while there are viewers."""
+        last_hash = None
+        try:
+            while True:
+                if not (img_bytes := await self.image_cb()):
+                    break
+
+                if (img_hash := hash(img_bytes)) != last_hash:
+                    last_hash = img_hash
+                    self._frame = _mjpeg_frame(self.content_type, img_bytes)
+                    self._sequence += 1
+                # Also wake up the viewers when the image didn't change, so
+                # viewers which disconnected are noticed
+                self._async_notify_viewers()
+
+                await asyncio.sleep(self.interval)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error fetching images for the MJPEG stream")
+        finally:
+            self.done = True
+            self._async_notify_viewers()
+
+    @callback
+    def _async_notify_viewers(self) -> None:
+        """Wake up the viewers waiting for a new image."""
+        new_frame, self._new_frame = self._new_frame, asyncio.Event()
+        new_frame.set()
+
+
 def _get_camera_from_entity_id(hass: HomeAssistant, entity_id: str) -> Camera:
     """Get camera component from entity_id."""
     component = hass.data.get(DOMAIN)
@@ -379,6 +523,11 @@ class Camera(Entity):
         self.content_type: str = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
         self._warned_old_signature = False
+        self._image_requests: dict[
+            tuple[int | None, int | None], asyncio.Task[Image]
+        ] = {}
+        self._scaled_images = ScaledImageCache()
+        self._still_streams: dict[float, StillStreamBroadcaster] = {}
         self.async_update_token()
 
     @property
@@ -472,10 +621,23 @@ class Camera(Entity):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        The images are fetched once for all the viewers of the stream at
+        an interval.
+        """
+        broadcaster = self._still_streams.get(interval)
+        if broadcaster is None or broadcaster.done:
+            broadcaster = self._still_streams[interval] = StillStreamBroadcaster(
+                self.hass, self.async_camera_image, self.content_type, interval
+            )
+        try:
+            return await broadcaster.async_serve(request)
+        finally:
+            if not broadcaster.viewers and self._still_streams.get(interval) is (
+                broadcaster
+            ):
+                del self._still_streams[interval]
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
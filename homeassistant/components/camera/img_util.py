@@ -1,6 +1,7 @@
 """Image processing for cameras."""
 from __future__ import annotations
 
+from collections import OrderedDict
 import logging
 from typing import TYPE_CHECKING, cast
 
@@ -10,6 +11,9 @@ _LOGGER = logging.getLogger(__name__)
 
 JPEG_QUALITY = 75
 
+# Bytes of scaled images kept for each camera
+SCALED_IMAGE_CACHE_BYTES = 1024 * 1024
+
 if TYPE_CHECKING:
     from turbojpeg import TurboJPEG
 
@@ -66,6 +70,45 @@ def scale_jpeg_camera_image(cam_image: Image, width: int, height: int) -> bytes:
     )
 
 
+class ScaledImageCache:
+    """Keep the most recently scaled images of a camera.
+
+    Scaled images are keyed by the hash and length of the source image and
+    the requested size. The least recently used images are dropped when the
+    cached images take more than max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = SCALED_IMAGE_CACHE_BYTES) -> None:
+        """Initialize the cache."""
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._images: OrderedDict[tuple[int, int, int, int], bytes] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, content: bytes, width: int, height: int) -> bytes | None:
+        """Return the scaled image of a source image."""
+        key = (hash(content), len(content), width, height)
+        if (scaled := self._images.get(key)) is None:
+            self.misses += 1
+            return None
+        self._images.move_to_end(key)
+        self.hits += 1
+        return scaled
+
+    def set(self, content: bytes, width: int, height: int, scaled: bytes) -> None:
+        """Store the scaled image of a source image."""
+        if len(scaled) > self.max_bytes:
+            return
+        key = (hash(content), len(content), width, height)
+        if (previous := self._images.pop(key, None)) is not None:
+            self._bytes -= len(previous)
+        self._images[key] = scaled
+        self._bytes += len(scaled)
+        while self._bytes > self.max_bytes:
+            self._bytes -= len(self._images.popitem(last=False)[1])
+
+
 class TurboJPEGSingleton:
     """
     Load TurboJPEG only once.
@@ -4,6 +4,8 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
+from itertools import islice
+import json
 import logging
 import time
 from typing import cast
@@ -20,7 +22,13 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
+from homeassistant.const import (
+    CONF_DOMAINS,
+    CONF_ENTITIES,
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
+)
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.deprecation import deprecated_class, deprecated_function
@@ -28,6 +36,7 @@ from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -37,6 +46,9 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "history"
 CONF_ORDER = "use_include_order"
 
+# Number of entities fetched at a time when streaming states
+STREAM_CHUNK_ENTITIES = 10
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -230,6 +242,10 @@ class HistoryPeriodView(HomeAssistantView):
         )
 
         minimal_response = "minimal_response" in request.query
+        # Reordering by the include order needs the whole result
+        stream = "stream" in request.query and not (
+            self.filters and self.use_include_order
+        )
 
         hass = request.app["hass"]
 
@@ -240,6 +256,18 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
+        if stream:
+            return await self._async_stream_significant_states_json(
+                request,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            )
+
         return cast(
             web.Response,
             await hass.async_add_executor_job(
@@ -300,6 +328,129 @@ class HistoryPeriodView(HomeAssistantView):
 
         return self.json(result)
 
+    async def _async_stream_significant_states_json(
+        self,
+        request,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+    ):
+        """Stream significant states from the database as json.
+
+        The states are fetched in the executor a few entities at a time and
+        written to the response in the event loop, so a slow client does not
+        hold a worker thread or a database session.
+        """
+        timer_start = time.perf_counter()
+        response = web.StreamResponse(headers={"Content-Type": CONTENT_TYPE_JSON})
+        response.enable_compression()
+        await response.prepare(request)
+
+        start_time_states = {}
+        if include_start_time_state:
+            start_time_states = await hass.async_add_executor_job(
+                self._start_time_states, hass, start_time, entity_ids
+            )
+
+        entity_count = 0
+        separator = b"["
+        after_entity_id = None
+        while True:
+            data, count, after_entity_id = await hass.async_add_executor_job(
+                self._significant_states_json_chunk,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                start_time_states,
+                significant_changes_only,
+                minimal_response,
+                after_entity_id,
+            )
+            if count:
+                await response.write(separator + data)
+                separator = b","
+                entity_count += count
+            if after_entity_id is None:
+                break
+
+        # Entities that only have a state at the start time come last
+        if start_time_states:
+            await response.write(
+                separator
+                + b",".join(
+                    _states_json([state]) for state in start_time_states.values()
+                )
+            )
+            entity_count += len(start_time_states)
+
+        await response.write(b"]" if entity_count else b"[]")
+        await response.write_eof()
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug(
+                "Streamed states of %d entities in %fs", entity_count, elapsed
+            )
+        return response
+
+    def _start_time_states(self, hass, start_time, entity_ids):
+        """Fetch the states at the start time from the database."""
+        with session_scope(hass=hass) as session:
+            return history.get_start_time_states_with_session(
+                hass, session, start_time, entity_ids, self.filters
+            )
+
+    def _significant_states_json_chunk(
+        self,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        start_time_states,
+        significant_changes_only,
+        minimal_response,
+        after_entity_id,
+    ):
+        """Fetch the significant states of the entities after after_entity_id.
+
+        Returns the json of the states of up to STREAM_CHUNK_ENTITIES entities,
+        the number of entities and the entity_id to continue after, which is
+        None once all entities are fetched.
+        """
+        chunk = []
+        with session_scope(hass=hass) as session:
+            states_by_entity = history.stream_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                start_time_states,
+                significant_changes_only,
+                minimal_response,
+                after_entity_id,
+            )
+            for after_entity_id, states in islice(
+                states_by_entity, STREAM_CHUNK_ENTITIES
+            ):
+                chunk.append(_states_json(states))
+            states_by_entity.close()
+
+        if len(chunk) < STREAM_CHUNK_ENTITIES:
+            after_entity_id = None
+        return b",".join(chunk), len(chunk), after_entity_id
+
+
+def _states_json(states):
+    """Return the states of an entity as json."""
+    return json.dumps(states, cls=JSONEncoder, allow_nan=False).encode("UTF-8")
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
@@ -11,11 +11,14 @@ from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -28,6 +31,7 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
@@ -48,7 +52,6 @@ from homeassistant.helpers.integration_platform import (
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
-ENTITY_ID_JSON_TEMPLATE = '"entity_id":"{}"'
 ENTITY_ID_JSON_EXTRACT = re.compile('"entity_id": ?"([^"]+)"')
 DOMAIN_JSON_EXTRACT = re.compile('"domain": ?"([^"]+)"')
 ICON_JSON_EXTRACT = re.compile('"icon": ?"([^"]+)"')
@@ -57,6 +60,7 @@ ATTR_MESSAGE = "message"
 CONTINUOUS_DOMAINS = ["proximity", "sensor"]
 
 DOMAIN = "logbook"
+DATA_FILTERS = "logbook_filters"
 
 GROUP_BY_MINUTES = 15
 
@@ -96,6 +100,9 @@ EVENT_COLUMNS = [
 
 SCRIPT_AUTOMATION_EVENTS = [EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED]
 
+# The number of contexts of live events kept to describe what caused an entry
+MAX_LIVE_CONTEXTS = 1000
+
 LOG_MESSAGE_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_NAME): cv.string,
@@ -159,7 +166,9 @@ async def async_setup(hass, config):
         filters = None
         entities_filter = None
 
+    hass.data[DATA_FILTERS] = (filters, entities_filter)
     hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    websocket_api.async_register_command(hass, ws_event_stream)
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -256,6 +265,161 @@ class LogbookView(HomeAssistantView):
         return await hass.async_add_executor_job(json_events)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/event_stream",
+        vol.Required("start_time"): str,
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+@websocket_api.async_response
+async def ws_event_stream(hass, connection, msg):
+    """Send the logbook entries since start_time and then the new entries.
+
+    The first event message holds the history, even when it is empty. The
+    entries of the events fired while the history is loaded follow it.
+    """
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time is None:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    entity_ids = msg.get("entity_ids")
+    filters, entities_filter = hass.data[DATA_FILTERS]
+    live_stream = LiveEventStream(hass, entity_ids, entities_filter)
+    pending = []
+    # The history ends before the subscription; events fired before that are
+    # only sent with the history, even when they are delivered late.
+    end_time = dt_util.utcnow()
+
+    @callback
+    def send_entries(entries):
+        """Send logbook entries to the websocket."""
+        if entries:
+            connection.send_message(websocket_api.event_message(msg["id"], entries))
+
+    @callback
+    def forward_event(event):
+        """Forward the entries of a live event."""
+        if pending is not None:
+            pending.append(event)
+        else:
+            send_entries(live_stream.humanify([event]))
+
+    connection.subscriptions[msg["id"]] = live_stream.async_subscribe(forward_event)
+    connection.send_result(msg["id"])
+
+    # The events fired before the subscription may not be committed yet
+    await hass.data[DATA_INSTANCE].async_block_till_done()
+
+    entries = await hass.async_add_executor_job(
+        _get_events,
+        hass,
+        dt_util.as_utc(start_time),
+        end_time,
+        entity_ids,
+        filters,
+        entities_filter,
+    )
+    if msg["id"] not in connection.subscriptions:
+        return
+
+    connection.send_message(websocket_api.event_message(msg["id"], entries))
+    events, pending = pending, None
+    send_entries(
+        live_stream.humanify(
+            [event for event in events if event.time_fired >= end_time]
+        )
+    )
+
+
+class LiveEventStream:
+    """Turn the events of the event bus into logbook entries.
+
+    The same rules as for the events from the database are applied to the
+    events, without querying the database.
+    """
+
+    def __init__(self, hass, entity_ids, entities_filter):
+        """Initialize the live event stream."""
+        self.hass = hass
+        self.entity_ids = entity_ids
+        if entity_ids is not None:
+            entities_filter = generate_filter([], entity_ids, [], [])
+        self.entities_filter = entities_filter
+        self.context_lookup = {}
+
+    @callback
+    def async_subscribe(self, event_cb):
+        """Call event_cb with the events which can become logbook entries."""
+        unsubs = [
+            self.hass.bus.async_listen(event_type, event_cb)
+            for event_type in {
+                *ALL_EVENT_TYPES,
+                *self.hass.data.get(DOMAIN, {}),
+            }
+        ]
+
+        @callback
+        def async_unsubscribe():
+            """Stop listening for events."""
+            for unsub in unsubs:
+                unsub()
+
+        return async_unsubscribe
+
+    def humanify(self, events):
+        """Return the logbook entries of events."""
+        return list(
+            humanify(
+                self.hass,
+                self._yield_events(events),
+                EntityAttributeCache(self.hass),
+                self.context_lookup,
+            )
+        )
+
+    def _yield_events(self, events):
+        """Yield the events which are not filtered away."""
+        for native_event in events:
+            if native_event.event_type == EVENT_STATE_CHANGED and (
+                not self._keep_state_change(native_event)
+            ):
+                continue
+
+            event = LiveEventPartialState(native_event)
+            self._add_context(event)
+            if event.event_type == EVENT_CALL_SERVICE:
+                continue
+            if event.event_type == EVENT_STATE_CHANGED or _keep_event(
+                self.hass, event, self.entities_filter
+            ):
+                yield event
+
+    def _keep_state_change(self, event):
+        """Return if a state change is kept like in the database query."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if old_state is None or new_state is None or old_state.state == new_state.state:
+            return False
+        if (
+            new_state.domain in CONTINUOUS_DOMAINS
+            and ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
+        ):
+            return False
+        if self.entity_ids is not None:
+            return new_state.entity_id in self.entity_ids
+        return self.entities_filter is None or self.entities_filter(new_state.entity_id)
+
+    def _add_context(self, event):
+        """Remember the first event of a context, forgetting the oldest."""
+        if event.context_id in self.context_lookup:
+            return
+        self.context_lookup[event.context_id] = event
+        if len(self.context_lookup) > MAX_LIVE_CONTEXTS:
+            del self.context_lookup[next(iter(self.context_lookup))]
+
+
 def humanify(hass, events, entity_attr_cache, context_lookup):
     """Generate a converted list of events into Entry objects.
 
@@ -493,6 +657,7 @@ def _generate_events_query(session):
         States.entity_id,
         States.domain,
         States.attributes,
+        StateAttributes.shared_attrs,
     )
 
 
@@ -503,6 +668,7 @@ def _generate_events_query_without_states(session):
         literal(value=None, type_=sqlalchemy.String).label("entity_id"),
         literal(value=None, type_=sqlalchemy.String).label("domain"),
         literal(value=None, type_=sqlalchemy.Text).label("attributes"),
+        literal(value=None, type_=sqlalchemy.Text).label("shared_attrs"),
     )
 
 
@@ -511,6 +677,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
@@ -525,6 +694,9 @@ def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
             | _missing_state_matcher(old_state)
@@ -554,7 +726,11 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(
+            sqlalchemy.func.coalesce(
+                States.attributes, StateAttributes.shared_attrs
+            ).contains(UNIT_OF_MEASUREMENT_JSON)
+        ),
     )
 
 
@@ -571,14 +747,7 @@ def _apply_event_types_filter(hass, query, event_types):
 
 
 def _apply_event_entity_id_matchers(events_query, entity_ids):
-    return events_query.filter(
-        sqlalchemy.or_(
-            *(
-                Events.event_data.contains(ENTITY_ID_JSON_TEMPLATE.format(entity_id))
-                for entity_id in entity_ids
-            )
-        )
-    )
+    return events_query.filter(Events.entity_id.in_(entity_ids))
 
 
 def _keep_event(hass, event, entities_filter):
@@ -714,7 +883,9 @@ class LazyEventPartialState:
         if self._attributes:
             return self._attributes.get(ATTR_ICON)
 
-        result = ICON_JSON_EXTRACT.search(self._row.attributes)
+        result = ICON_JSON_EXTRACT.search(
+            self._row.attributes or self._row.shared_attrs or EMPTY_JSON_OBJECT
+        )
         return result and result.group(1)
 
     @property
@@ -739,13 +910,11 @@ class LazyEventPartialState:
     def attributes(self):
         """State attributes."""
         if not self._attributes:
-            if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
-            ):
+            source = self._row.attributes or self._row.shared_attrs
+            if source is None or source == EMPTY_JSON_OBJECT:
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(source)
         return self._attributes
 
     @property
@@ -769,6 +938,73 @@ class LazyEventPartialState:
         return self._time_fired_isoformat
 
 
+class LiveEventPartialState:
+    """A core Event with the interface of LazyEventPartialState."""
+
+    __slots__ = [
+        "_event",
+        "_time_fired_isoformat",
+        "data",
+        "attributes",
+        "event_type",
+        "entity_id",
+        "state",
+        "domain",
+        "context_id",
+        "context_user_id",
+        "context_parent_id",
+        "time_fired_minute",
+    ]
+
+    def __init__(self, event):
+        """Init the event."""
+        self._event = event
+        self._time_fired_isoformat = None
+        self.data = event.data
+        self.event_type = event.event_type
+        self.context_id = event.context.id
+        self.context_user_id = event.context.user_id
+        self.context_parent_id = event.context.parent_id
+        self.time_fired_minute = event.time_fired.minute
+        if (
+            event.event_type == EVENT_STATE_CHANGED
+            and (new_state := event.data.get("new_state")) is not None
+        ):
+            self.entity_id = new_state.entity_id
+            self.state = new_state.state
+            self.domain = new_state.domain
+            self.attributes = new_state.attributes
+        else:
+            self.entity_id = self.state = self.domain = None
+            self.attributes = {}
+
+    @property
+    def attributes_icon(self):
+        """Return the icon of the state."""
+        return self.attributes.get(ATTR_ICON)
+
+    @property
+    def data_entity_id(self):
+        """Return the entity id of the event data."""
+        entity_id = self.data.get(ATTR_ENTITY_ID)
+        return entity_id if isinstance(entity_id, str) else None
+
+    @property
+    def data_domain(self):
+        """Return the domain of the event data."""
+        domain = self.data.get(ATTR_DOMAIN)
+        return domain if isinstance(domain, str) else None
+
+    @property
+    def time_fired_isoformat(self):
+        """Time event was fired in utc isoformat."""
+        if not self._time_fired_isoformat:
+            self._time_fired_isoformat = process_timestamp_to_utc_isoformat(
+                self._event.time_fired
+            )
+        return self._time_fired_isoformat
+
+
 class EntityAttributeCache:
     """A cache to lookup static entity_id attribute.
 
@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache, partial, wraps
+from collections import deque
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
 from operator import attrgetter
 import ssl
+import threading
 import time
 from typing import Any, Awaitable, Callable, Union, cast
 import uuid
@@ -81,6 +83,7 @@ from .models import (
     ReceiveMessage,
     ReceivePayloadType,
 )
+from .trie import TopicTrie
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -546,7 +549,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
@@ -570,6 +572,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscriptions_trie = TopicTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -578,6 +581,11 @@ class MQTT:
 
         self._pending_operations: dict[str, asyncio.Event] = {}
 
+        # Messages received by the paho thread which are not handled yet
+        self._pending_messages: deque = deque()
+        self._pending_messages_lock = threading.Lock()
+        self._drain_scheduled = False
+
         if self.hass.state == CoreState.running:
             self._ha_started.set()
         else:
@@ -745,11 +753,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscriptions_trie.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -762,7 +768,7 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._subscriptions_trie.remove(topic, subscription)
 
             if any(other.topic == topic for other in self.subscriptions):
                 # Other subscriptions on topic remaining - don't unsubscribe.
@@ -852,16 +858,35 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        Messages are queued and handed to the event loop in batches, only
+        waking up the event loop if no drain of the queue is pending yet.
+        """
+        self._pending_messages.append(msg)
+        with self._pending_messages_lock:
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._async_drain_messages)
+
+    @callback
+    def _async_drain_messages(self) -> None:
+        """Handle the messages received since the last drain."""
+        with self._pending_messages_lock:
+            self._drain_scheduled = False
+        pending_messages = self._pending_messages
+        for _ in range(len(pending_messages)):
+            msg = pending_messages.popleft()
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                # Don't let one failing subscriber hold back the rest of the batch
+                _LOGGER.exception("Error handling message on %s", msg.topic)
+
+    def _matching_subscriptions(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching the topic."""
+        return self._subscriptions_trie.matches(topic)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -973,16 +998,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
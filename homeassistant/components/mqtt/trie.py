@@ -0,0 +1,92 @@
+"""Topic trie to route MQTT messages to subscriptions."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+import itertools
+from typing import Any
+
+
+class _TrieNode:
+    """Node of a topic trie, one for each topic level."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TrieNode] = {}
+        self.values: list[tuple[int, Any]] = []
+
+
+class TopicTrie:
+    """Match topics against all topic filters at once.
+
+    Values are added for a topic filter which may contain the + and #
+    wildcards. Matching follows the MQTT specification, like paho's
+    MQTTMatcher, and returns the values in the order they were added.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TrieNode()
+        self._counter = itertools.count()
+
+    def add(self, topic_filter: str, value: Any) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            node = node.children.setdefault(level, _TrieNode())
+        node.values.append((next(self._counter), value))
+
+    def remove(self, topic_filter: str, value: Any) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        path = [self._root]
+        levels = topic_filter.split("/")
+        for level in levels:
+            if (child := path[-1].children.get(level)) is None:
+                raise KeyError(topic_filter)
+            path.append(child)
+
+        node = path[-1]
+        for index, (_, node_value) in enumerate(node.values):
+            if node_value is value:
+                del node.values[index]
+                break
+        else:
+            raise KeyError(topic_filter)
+
+        # Prune the nodes which are no longer used
+        for level, parent in zip(reversed(levels), reversed(path[:-1])):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def matches(self, topic: str) -> list[Any]:
+        """Return the values of all topic filters matching the topic."""
+        matched = list(
+            self._iter_match(self._root, topic.split("/"), 0, topic[:1] != "$")
+        )
+        if len(matched) > 1:
+            matched.sort(key=lambda item: item[0])
+        return [value for _, value in matched]
+
+    def _iter_match(
+        self, node: _TrieNode, levels: list[str], index: int, normal: bool
+    ) -> Iterator[tuple[int, Any]]:
+        """Yield the values of the topic filters matching levels from index on.
+
+        Wildcards don't match the first level of topics starting with $.
+        """
+        wildcards = normal or index > 0
+        if index == len(levels):
+            yield from node.values
+        else:
+            if (child := node.children.get(levels[index])) is not None:
+                yield from self._iter_match(child, levels, index + 1, normal)
+            if wildcards and (child := node.children.get("+")) is not None:
+                yield from self._iter_match(child, levels, index + 1, normal)
+        if wildcards and (child := node.children.get("#")) is not None:
+            yield from child.values
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from collections.abc import Callable
 import concurrent.futures
 from datetime import datetime, timedelta
@@ -56,6 +57,7 @@ from .models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -118,6 +120,10 @@ KEEPALIVE_TIME = 30
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The number of shared attributes ids kept in memory
+# so repeated attributes do not need a lookup
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
@@ -126,6 +132,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -154,6 +161,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(CONF_BULK_INSERT, default=False): cv.boolean,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -259,6 +267,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        bulk_insert=conf[CONF_BULK_INSERT],
     )
     instance.async_initialize()
     instance.start()
@@ -274,6 +283,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 async def _process_recorder_platform(hass, domain, platform):
     """Process a recorder platform."""
     hass.data[DOMAIN][domain] = platform
+    if hasattr(platform, "async_setup"):
+        platform.async_setup(hass)
 
 
 @callback
@@ -365,6 +376,12 @@ class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+class SynchronizeTask(NamedTuple):
+    """An object to insert into the recorder queue to commit and then set an event."""
+
+    event: asyncio.Event
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -379,6 +396,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        bulk_insert: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -400,12 +418,26 @@ class Recorder(threading.Thread):
 
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
+        self.bulk_insert = bulk_insert
 
         self._timechanges_seen = 0
         self._commits_without_expire = 0
         self._keepalive_count = 0
         self._old_states: dict[str, States] = {}
         self._pending_expunge: list[States] = []
+        self._old_state_rows: dict[str, dict[str, Any]] = {}
+        self._pending_event_rows: list[dict[str, Any]] = []
+        self._pending_state_rows: list[
+            tuple[
+                dict[str, Any],
+                dict[str, Any],
+                dict[str, Any] | None,
+                dict[str, Any] | None,
+            ]
+        ] = []
+        self._state_attributes_ids: OrderedDict[str, int] = OrderedDict()
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
+        self._pending_attributes_rows: dict[str, dict[str, Any]] = {}
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -750,6 +782,9 @@ class Recorder(threading.Thread):
 
     def _run_purge(self, purge_before, repack, apply_filter):
         """Purge the database."""
+        # Pending states may reference shared attributes
+        # that are only unreferenced in the database so far
+        self._commit_event_session_or_retry()
         if purge.purge_old_data(self, purge_before, repack, apply_filter):
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
@@ -761,6 +796,7 @@ class Recorder(threading.Thread):
 
     def _run_purge_entities(self, entity_filter):
         """Purge entities from the database."""
+        self._commit_event_session_or_retry()
         if purge.purge_entity_data(self, entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
@@ -798,6 +834,12 @@ class Recorder(threading.Thread):
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
+        if isinstance(event, SynchronizeTask):
+            try:
+                self._commit_event_session_or_retry()
+            finally:
+                self.hass.loop.call_soon_threadsafe(event.event.set)
+            return
         if event.event_type == EVENT_TIME_CHANGED:
             self._keepalive_count += 1
             if self._keepalive_count >= KEEPALIVE_TIME:
@@ -813,6 +855,18 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
 
+        if self.bulk_insert:
+            self._buffer_event_rows(event)
+        else:
+            self._add_event_to_session(event)
+
+        # If they do not have a commit interval
+        # than we commit right away
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+    def _add_event_to_session(self, event):
+        """Add the ORM objects for an event to the event session."""
         try:
             if event.event_type == EVENT_STATE_CHANGED:
                 dbevent = Events.from_event(event, event_data="{}")
@@ -836,6 +890,7 @@ class Recorder(threading.Thread):
                         dbstate.old_state = old_state
                 if not has_new_state:
                     dbstate.state = None
+                self._share_state_attributes(dbstate)
                 dbstate.event = dbevent
                 dbstate.created = event.time_fired
                 self.event_session.add(dbstate)
@@ -848,10 +903,194 @@ class Recorder(threading.Thread):
                     event.data.get("new_state"),
                 )
 
-        # If they do not have a commit interval
-        # than we commit right away
-        if not self.commit_interval:
-            self._commit_event_session_or_retry()
+    def _share_state_attributes(self, dbstate):
+        """Point a state at shared attributes instead of storing its own."""
+        shared_attrs = dbstate.attributes
+        dbstate.attributes = None
+        if pending := self._pending_state_attributes.get(shared_attrs):
+            dbstate.state_attributes = pending
+            return
+        if (attributes_id := self._find_shared_attrs_id(shared_attrs)) is not None:
+            dbstate.attributes_id = attributes_id
+            return
+        dbstate_attributes = StateAttributes(
+            **StateAttributes.row_from_shared_attrs(shared_attrs)
+        )
+        dbstate.state_attributes = dbstate_attributes
+        self._pending_state_attributes[shared_attrs] = dbstate_attributes
+        self.event_session.add(dbstate_attributes)
+
+    def _find_shared_attrs_id(self, shared_attrs):
+        """Return the id of stored attributes matching shared_attrs."""
+        if (attributes_id := self._state_attributes_ids.get(shared_attrs)) is not None:
+            self._state_attributes_ids.move_to_end(shared_attrs)
+            return attributes_id
+        # Pending states must not be flushed by the lookup
+        with self.event_session.no_autoflush:
+            row = (
+                self.event_session.query(StateAttributes.attributes_id)
+                .filter(
+                    StateAttributes.hash
+                    == StateAttributes.hash_shared_attrs(shared_attrs)
+                )
+                .filter(StateAttributes.shared_attrs == shared_attrs)
+                .first()
+            )
+        if row is None:
+            return None
+        self._cache_shared_attrs_id(shared_attrs, row.attributes_id)
+        return row.attributes_id
+
+    def _cache_shared_attrs_id(self, shared_attrs, attributes_id):
+        """Remember the id of stored attributes, evicting the oldest."""
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        if len(self._state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self._state_attributes_ids.popitem(last=False)
+
+    def evict_state_attributes_ids(self, attributes_ids):
+        """Forget shared attributes that have been purged."""
+        purged = set(attributes_ids)
+        for shared_attrs, attributes_id in list(self._state_attributes_ids.items()):
+            if attributes_id in purged:
+                del self._state_attributes_ids[shared_attrs]
+
+    def _buffer_event_rows(self, event):
+        """Buffer the rows for an event until the next commit.
+
+        The rows are inserted in bulk by _insert_pending_rows which
+        skips the ORM unit of work. The old_state_id of a state is
+        resolved at insert time since its old state may be buffered
+        as well.
+        """
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                event_row = Events.row_from_event(event, event_data="{}")
+            else:
+                event_row = Events.row_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+        event_row["created"] = event.time_fired
+        self._pending_event_rows.append(event_row)
+
+        if event.event_type != EVENT_STATE_CHANGED:
+            return
+
+        try:
+            state_row = States.row_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s", event.data.get("new_state")
+            )
+            return
+        entity_id = state_row["entity_id"]
+        has_new_state = event.data.get("new_state")
+        if not has_new_state:
+            state_row["state"] = None
+        state_row["created"] = event.time_fired
+        shared_attrs = state_row.pop("attributes")
+        attributes_id = None
+        attributes_row = self._pending_attributes_rows.get(shared_attrs)
+        if attributes_row is None:
+            attributes_id = self._find_shared_attrs_id(shared_attrs)
+            if attributes_id is None:
+                attributes_row = StateAttributes.row_from_shared_attrs(shared_attrs)
+                self._pending_attributes_rows[shared_attrs] = attributes_row
+        state_row["attributes_id"] = attributes_id
+        self._pending_state_rows.append(
+            (
+                state_row,
+                event_row,
+                self._old_state_rows.pop(entity_id, None),
+                attributes_row,
+            )
+        )
+        if has_new_state:
+            self._old_state_rows[entity_id] = state_row
+
+    def _insert_pending_rows(self):
+        """Insert the buffered event and state rows."""
+        self._insert_rows(Events, self._pending_event_rows)
+        if self._pending_attributes_rows:
+            self._insert_rows(
+                StateAttributes, list(self._pending_attributes_rows.values())
+            )
+        # States that replace a state from the same batch
+        # have to wait until their old state has an id
+        pending = self._pending_state_rows
+        while pending:
+            ready = []
+            waiting = []
+            for pending_rows in pending:
+                state_row, event_row, old_state_row, attributes_row = pending_rows
+                # Every row of an executemany needs the same columns
+                if old_state_row is None:
+                    state_row["old_state_id"] = None
+                elif "state_id" in old_state_row:
+                    state_row["old_state_id"] = old_state_row["state_id"]
+                else:
+                    waiting.append(pending_rows)
+                    continue
+                if attributes_row is not None:
+                    state_row["attributes_id"] = attributes_row["attributes_id"]
+                state_row["event_id"] = event_row["event_id"]
+                ready.append(state_row)
+            self._insert_rows(States, ready)
+            pending = waiting
+
+    def _insert_rows(self, table, rows):
+        """Insert rows and set their primary keys.
+
+        The rows are inserted with a single executemany when the new keys
+        can be matched to the rows afterwards, otherwise one at a time.
+        """
+        id_column = table.__table__.primary_key.columns[0]
+        insert = table.__table__.insert()
+        dialect = self.engine.dialect
+        if dialect.insert_executemany_returning:
+            result = self.event_session.execute(insert.return_defaults(), rows)
+            row_ids = result.inserted_primary_key_rows
+        elif dialect.name == "sqlite":
+            # New rowids are larger than all existing ones and no other
+            # writer can insert until the commit, so the rows hold the
+            # highest ids of the table in insertion order.
+            self.event_session.execute(insert, rows)
+            row_ids = reversed(
+                self.event_session.query(id_column)
+                .order_by(id_column.desc())
+                .limit(len(rows))
+                .all()
+            )
+        else:
+            row_ids = [
+                self.event_session.execute(insert, row).inserted_primary_key
+                for row in rows
+            ]
+        for row, (row_id,) in zip(rows, row_ids):
+            row[id_column.key] = row_id
+
+    def _commit_pending_rows(self):
+        """Insert and commit the buffered rows."""
+        try:
+            self._insert_pending_rows()
+            self.event_session.commit()
+        except Exception:
+            # The ids handed out in the failed transaction are gone,
+            # so the whole batch is inserted again on retry.
+            self.event_session.rollback()
+            for event_row in self._pending_event_rows:
+                event_row.pop("event_id", None)
+            for attributes_row in self._pending_attributes_rows.values():
+                attributes_row.pop("attributes_id", None)
+            for state_row, _, _, _ in self._pending_state_rows:
+                state_row.pop("state_id", None)
+            raise
+
+        for shared_attrs, attributes_row in self._pending_attributes_rows.items():
+            self._cache_shared_attrs_id(shared_attrs, attributes_row["attributes_id"])
+        self._pending_event_rows = []
+        self._pending_state_rows = []
+        self._pending_attributes_rows = {}
 
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
@@ -865,7 +1104,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self.event_session.new
+            and not self.event_session.dirty
+            and not self._pending_event_rows
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -888,6 +1131,9 @@ class Recorder(threading.Thread):
     def _commit_event_session(self):
         self._commits_without_expire += 1
 
+        if self._pending_event_rows:
+            self._commit_pending_rows()
+
         if self._pending_expunge:
             self.event_session.flush()
             for dbstate in self._pending_expunge:
@@ -898,6 +1144,10 @@ class Recorder(threading.Thread):
             self._pending_expunge = []
         self.event_session.commit()
 
+        for shared_attrs, attributes in self._pending_state_attributes.items():
+            self._cache_shared_attrs_id(shared_attrs, attributes.attributes_id)
+        self._pending_state_attributes = {}
+
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
         # do it after EXPIRE_AFTER_COMMITS commits
@@ -916,6 +1166,12 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._old_state_rows = {}
+        self._pending_event_rows = []
+        self._pending_state_rows = []
+        self._state_attributes_ids = OrderedDict()
+        self._pending_state_attributes = {}
+        self._pending_attributes_rows = {}
 
         if not self.event_session:
             return
@@ -964,6 +1220,15 @@ class Recorder(threading.Thread):
         self.queue.put(WaitTask())
         self._queue_watch.wait()
 
+    async def async_block_till_done(self):
+        """Wait till the events fired so far are committed to the database."""
+        if not self.is_alive():
+            return
+        event = asyncio.Event()
+        # Scheduled after the event listener calls of the events already fired
+        self.hass.loop.call_soon(self.queue.put, SynchronizeTask(event))
+        await event.wait()
+
     def _setup_connection(self):
         """Ensure database is ready to fly."""
         kwargs = {}
@@ -11,6 +11,7 @@ from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -48,12 +49,16 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "recorder_history_bakery"
 
+# Number of rows fetched at a time when streaming states
+STREAM_YIELD_PER = 1000
+
 
 def async_setup(hass):
     """Set up the history hooks."""
@@ -91,8 +96,110 @@ def get_significant_states_with_session(
     """
     timer_start = time.perf_counter()
 
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_dict(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+    )
+
+
+def get_start_time_states_with_session(
+    hass, session, start_time, entity_ids=None, filters=None
+):
+    """Return the states at start_time by entity_id as they start the history."""
+    start_time_states = {}
+    run = recorder.run_information_from_instance(hass, start_time)
+    for state in _get_states_with_session(
+        hass, session, start_time, entity_ids, run=run, filters=filters
+    ):
+        state.last_changed = start_time
+        state.last_updated = start_time
+        start_time_states[state.entity_id] = state
+    return start_time_states
+
+
+def stream_significant_states_with_session(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    start_time_states=None,
+    significant_changes_only=True,
+    minimal_response=False,
+    after_entity_id=None,
+):
+    """
+    Yield the significant states during UTC period start_time - end_time.
+
+    The states are the same as returned by get_significant_states_with_session
+    but yielded as (entity_id, states) one entity at a time while the rows are
+    fetched in batches, so only the states of a single entity are held in
+    memory. Entities are yielded in order of entity_id, starting after
+    after_entity_id.
+
+    The start time state of a yielded entity is popped from start_time_states,
+    entities that only have a state at the start time are left in it.
+    """
+    if start_time_states is None:
+        start_time_states = {}
+
+    query = _significant_states_query(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+        after_entity_id,
+    ).with_post_criteria(lambda q: q.yield_per(STREAM_YIELD_PER))
+
+    for ent_id, group in groupby(query, lambda state: state.entity_id):
+        ent_results = []
+        if (start_time_state := start_time_states.pop(ent_id, None)) is not None:
+            ent_results.append(start_time_state)
+        _append_entity_states(ent_results, ent_id, group, minimal_response)
+        yield ent_id, ent_results
+
+
+def _significant_states_query(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+    after_entity_id=None,
+):
+    """Query the significant states ordered by entity_id and last_updated."""
     baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+        lambda session: session.query(*QUERY_STATES).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
     )
 
     if significant_changes_only:
@@ -118,27 +225,18 @@ def get_significant_states_with_session(
     if end_time is not None:
         baked_query += lambda q: q.filter(States.last_updated < bindparam("end_time"))
 
-    baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
-
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
+    if after_entity_id is not None:
+        baked_query += lambda q: q.filter(
+            States.entity_id > bindparam("after_entity_id")
         )
-    )
 
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
+    baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    return _sorted_states_to_dict(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
+    return baked_query(session).params(
+        start_time=start_time,
+        end_time=end_time,
+        entity_ids=entity_ids,
+        after_entity_id=after_entity_id,
     )
 
 
@@ -146,7 +244,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
         baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
+            lambda session: session.query(*QUERY_STATES).outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
         )
 
         baked_query += lambda q: q.filter(
@@ -160,7 +260,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -182,12 +284,16 @@ def get_last_state_changes(hass, number_of_states, entity_id):
 
     with session_scope(hass=hass) as session:
         baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
+            lambda session: session.query(*QUERY_STATES).outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
         )
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -247,7 +353,9 @@ def _get_states_with_session(
 
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
 
     if entity_ids:
         # We got an include-list of entities, accelerate the query by filtering already
@@ -313,7 +421,9 @@ def _get_single_entity_states_with_session(hass, session, utc_point_in_time, ent
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
     baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+        lambda session: session.query(*QUERY_STATES).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
     )
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
@@ -371,53 +481,57 @@ def _sorted_states_to_dict(
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
 
-    # Called in a tight loop so cache the function
-    # here
-    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
-
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
-
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+        _append_entity_states(result[ent_id], ent_id, group, minimal_response)
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
 
 
+def _append_entity_states(ent_results, ent_id, group, minimal_response):
+    """Append the sorted database states of one entity to its results."""
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        ent_results.extend(LazyState(db_state) for db_state in group)
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        ent_results.append(LazyState(next(group)))
+
+    prev_state = ent_results[-1]
+    initial_state_count = len(ent_results)
+
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        ent_results.append(
+            {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    db_state.last_changed
+                ),
+            }
+        )
+        prev_state = db_state
+
+    if prev_state and len(ent_results) != initial_state_count:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        ent_results[-1] = LazyState(prev_state)
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
@@ -13,11 +13,16 @@ from sqlalchemy.exc import (
 )
 from sqlalchemy.schema import AddConstraint, DropConstraint
 
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers.json import json_loads
+
 from .models import (
     SCHEMA_VERSION,
     TABLE_STATES,
     Base,
+    Events,
     SchemaChanges,
+    StateAttributes,
     Statistics,
     StatisticsMeta,
     StatisticsRuns,
@@ -29,6 +34,9 @@ from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# The number of events of which the entity_id and domain are extracted at once
+EVENTS_BACKFILL_BATCH_SIZE = 10000
+
 
 def raise_if_exception_missing_str(ex, match_substrs):
     """Raise an exception if the exception and cause do not contain the match substrs."""
@@ -584,10 +592,62 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
                         sum=last_statistic.sum,
                     )
                 )
+    elif new_version == 23:
+        # Move repeated state attributes to a table shared by all states,
+        # existing states keep their attributes in the states table
+        StateAttributes.__table__.create(connection, checkfirst=True)
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 24:
+        # Extract the entity_id and domain of events into indexed columns
+        _add_columns(
+            connection,
+            "events",
+            ["entity_id VARCHAR(255)", "domain VARCHAR(64)"],
+        )
+        _backfill_events_entity_id_domain(session)
+        _create_index(connection, "events", "ix_events_entity_id_time_fired")
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
 
+def _backfill_events_entity_id_domain(session):
+    """Extract the entity_id and domain from the data of the stored events."""
+    _LOGGER.warning(
+        "Extracting the entity_id and domain of events. Note: this can take several "
+        "minutes on large databases and slow computers. Please be patient!"
+    )
+    last_event_id = 0
+    while rows := (
+        session.query(Events.event_id, Events.event_data)
+        .filter(Events.event_id > last_event_id)
+        .filter(Events.event_type != EVENT_STATE_CHANGED)
+        .order_by(Events.event_id)
+        .limit(EVENTS_BACKFILL_BATCH_SIZE)
+        .all()
+    ):
+        last_event_id = rows[-1].event_id
+        mappings = []
+        for event_id, event_data in rows:
+            if not event_data or (
+                '"entity_id"' not in event_data and '"domain"' not in event_data
+            ):
+                continue
+            try:
+                data = json_loads(event_data)
+            except ValueError:
+                continue
+            if not isinstance(data, dict):
+                continue
+            entity_id, domain = Events.ids_from_event_data(data)
+            if entity_id is not None or domain is not None:
+                mappings.append(
+                    {"event_id": event_id, "entity_id": entity_id, "domain": domain}
+                )
+        if mappings:
+            session.bulk_update_mappings(Events, mappings)
+
+
 def _inspect_schema_version(engine, session):
     """Determine the schema version by inspecting the db structure.
 
@@ -3,11 +3,12 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime, timedelta
-import json
 import logging
 from typing import TypedDict, overload
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -26,6 +27,8 @@ from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.orm.session import Session
 
 from homeassistant.const import (
+    ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     MAX_LENGTH_EVENT_CONTEXT_ID,
     MAX_LENGTH_EVENT_EVENT_TYPE,
     MAX_LENGTH_EVENT_ORIGIN,
@@ -34,14 +37,14 @@ from homeassistant.const import (
     MAX_LENGTH_STATE_STATE,
 )
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps, json_loads
 import homeassistant.util.dt as dt_util
 
 # SQLAlchemy Schema
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 22
+SCHEMA_VERSION = 24
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +52,7 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
@@ -58,6 +62,7 @@ TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 
 ALL_TABLES = [
     TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
     TABLE_EVENTS,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
@@ -85,6 +90,9 @@ class Events(Base):  # type: ignore
         # Used for fetching events at a specific time
         # see logbook
         Index("ix_events_event_type_time_fired", "event_type", "time_fired"),
+        # Used for fetching the events of entities
+        # see logbook
+        Index("ix_events_entity_id_time_fired", "entity_id", "time_fired"),
         {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
     __tablename__ = TABLE_EVENTS
@@ -97,6 +105,8 @@ class Events(Base):  # type: ignore
     context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
     context_user_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
     context_parent_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
+    entity_id = Column(String(MAX_LENGTH_STATE_ENTITY_ID))
+    domain = Column(String(MAX_LENGTH_STATE_DOMAIN))
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -110,16 +120,44 @@ class Events(Base):  # type: ignore
     @staticmethod
     def from_event(event, event_data=None):
         """Create an event database object from a native event."""
-        return Events(
-            event_type=event.event_type,
-            event_data=event_data
-            or json.dumps(event.data, cls=JSONEncoder, separators=(",", ":")),
-            origin=str(event.origin.value),
-            time_fired=event.time_fired,
-            context_id=event.context.id,
-            context_user_id=event.context.user_id,
-            context_parent_id=event.context.parent_id,
-        )
+        return Events(**Events.row_from_event(event, event_data))
+
+    @staticmethod
+    def row_from_event(event, event_data=None):
+        """Create the column values of an event row from a native event.
+
+        The entity_id and domain are only extracted from the data of events
+        which store their data, state changes are found by the states.
+        """
+        if event_data is None:
+            entity_id, domain = Events.ids_from_event_data(event.data)
+        else:
+            entity_id = domain = None
+        return {
+            "event_type": event.event_type,
+            "event_data": event_data or json_dumps(event.data),
+            "origin": str(event.origin.value),
+            "time_fired": event.time_fired,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+            "context_parent_id": event.context.parent_id,
+            "entity_id": entity_id,
+            "domain": domain,
+        }
+
+    @staticmethod
+    def ids_from_event_data(event_data):
+        """Return the entity_id and domain of event data if they fit the columns."""
+        entity_id = event_data.get(ATTR_ENTITY_ID)
+        if (
+            not isinstance(entity_id, str)
+            or len(entity_id) > MAX_LENGTH_STATE_ENTITY_ID
+        ):
+            entity_id = None
+        domain = event_data.get(ATTR_DOMAIN)
+        if not isinstance(domain, str) or len(domain) > MAX_LENGTH_STATE_DOMAIN:
+            domain = None
+        return entity_id, domain
 
     def to_native(self, validate_entity_id=True):
         """Convert to a native HA Event."""
@@ -131,13 +169,13 @@ class Events(Base):  # type: ignore
         try:
             return Event(
                 self.event_type,
-                json.loads(self.event_data),
+                json_loads(self.event_data),
                 EventOrigin(self.origin),
                 process_timestamp(self.time_fired),
                 context=context,
             )
         except ValueError:
-            # When json.loads fails
+            # When json_loads fails
             _LOGGER.exception("Error converting to event: %s", self)
             return None
 
@@ -164,8 +202,12 @@ class States(Base):  # type: ignore
     last_updated = Column(DATETIME_TYPE, default=dt_util.utcnow, index=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
     old_state_id = Column(Integer, ForeignKey("states.state_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
     event = relationship("Events", uselist=False)
     old_state = relationship("States", remote_side=[state_id])
+    state_attributes = relationship("StateAttributes")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -181,36 +223,44 @@ class States(Base):  # type: ignore
     @staticmethod
     def from_event(event):
         """Create object from a state_changed event."""
+        return States(**States.row_from_event(event))
+
+    @staticmethod
+    def row_from_event(event):
+        """Create the column values of a state row from a state_changed event."""
         entity_id = event.data["entity_id"]
         state = event.data.get("new_state")
 
-        dbstate = States(entity_id=entity_id)
-
         # State got deleted
         if state is None:
-            dbstate.state = ""
-            dbstate.domain = split_entity_id(entity_id)[0]
-            dbstate.attributes = "{}"
-            dbstate.last_changed = event.time_fired
-            dbstate.last_updated = event.time_fired
-        else:
-            dbstate.domain = state.domain
-            dbstate.state = state.state
-            dbstate.attributes = json.dumps(
-                dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
-            )
-            dbstate.last_changed = state.last_changed
-            dbstate.last_updated = state.last_updated
+            return {
+                "entity_id": entity_id,
+                "state": "",
+                "domain": split_entity_id(entity_id)[0],
+                "attributes": "{}",
+                "last_changed": event.time_fired,
+                "last_updated": event.time_fired,
+            }
 
-        return dbstate
+        return {
+            "entity_id": entity_id,
+            "state": state.state,
+            "domain": state.domain,
+            "attributes": json_dumps(dict(state.attributes)),
+            "last_changed": state.last_changed,
+            "last_updated": state.last_updated,
+        }
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        attributes = self.attributes
+        if attributes is None and self.state_attributes is not None:
+            attributes = self.state_attributes.shared_attrs
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                json_loads(attributes),
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
                 # Join the events table on event_id to get the context instead
@@ -219,11 +269,49 @@ class States(Base):  # type: ignore
                 validate_entity_id=validate_entity_id,
             )
         except ValueError:
-            # When json.loads fails
+            # When json_loads fails
             _LOGGER.exception("Error converting row to state: %s", self)
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attribute change history.
+
+    Attributes are stored once per distinct JSON text and shared by
+    all states that carry the same attributes.
+    """
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, Identity(), primary_key=True)
+    hash = Column(BigInteger, index=True)
+    shared_attrs = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StateAttributes("
+            f"id={self.attributes_id}, hash='{self.hash}', "
+            f"attributes='{self.shared_attrs}'"
+            f")>"
+        )
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs: str) -> int:
+        """Return the hash used to look up shared attributes."""
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+    @staticmethod
+    def row_from_shared_attrs(shared_attrs: str) -> dict[str, int | str]:
+        """Create the column values of an attributes row from the json text."""
+        return {
+            "hash": StateAttributes.hash_shared_attrs(shared_attrs),
+            "shared_attrs": shared_attrs,
+        }
+
+
 class StatisticResult(TypedDict):
     """Statistic result data class.
 
@@ -495,15 +583,25 @@ class LazyState(State):
         self._last_changed = None
         self._last_updated = None
         self._context = None
+        self._as_dict_json = None
 
     @property  # type: ignore
     def attributes(self):
         """State attributes."""
         if not self._attributes:
+            # Rows written before attributes were shared keep
+            # them in the states table
+            attributes = self._row.attributes
+            if attributes is None:
+                attributes = self._row.shared_attrs
+            if attributes is None:
+                # The attributes row is gone or the state has none
+                self._attributes = {}
+                return self._attributes
             try:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json_loads(attributes)
             except ValueError:
-                # When json.loads fails
+                # When json_loads fails
                 _LOGGER.exception("Error converting row to state: %s", self._row)
                 self._attributes = {}
         return self._attributes
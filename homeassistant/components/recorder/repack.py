@@ -31,5 +31,7 @@ def repack_database(instance: Recorder) -> None:
     # Optimize mysql / mariadb tables to free up space on disk
     if instance.engine.dialect.name == "mysql":
         _LOGGER.debug("Optimizing SQL DB to free space")
-        instance.engine.execute("OPTIMIZE TABLE states, events, recorder_runs")
+        instance.engine.execute(
+            "OPTIMIZE TABLE states, state_attributes, events, recorder_runs"
+        )
         return
@@ -358,6 +358,11 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
 
         session.add(StatisticsRuns(start=start))
 
+    # The statistics are saved, platforms can drop what they kept to compile them
+    for platform in instance.hass.data[DOMAIN].values():
+        if hasattr(platform, "statistics_compiled"):
+            platform.statistics_compiled(instance.hass, end)
+
     return True
 
 
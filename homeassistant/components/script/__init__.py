@@ -32,6 +32,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reload import config_fingerprint
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -178,7 +179,7 @@ async def async_setup(hass, config):
 
     async def reload_service(service):
         """Call a service to reload scripts."""
-        conf = await component.async_prepare_reload()
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
 
@@ -231,10 +232,18 @@ async def async_setup(hass, config):
 async def _async_process_config(hass, config, component) -> bool:
     """Process script configuration.
 
+    Scripts of which the config didn't change since they were added are kept
+    running, the other scripts are removed.
+
     Return true, if Blueprints were used.
     """
     entities = []
     blueprints_used = False
+    unchanged: dict[str, list[ScriptEntity]] = {}
+    for entity in component.entities:
+        if entity.config_fingerprint is not None:
+            unchanged.setdefault(entity.config_fingerprint, []).append(entity)
+    kept: set[str] = set()
 
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: dict[str, dict[str, Any] | BlueprintInputs] = config[config_key]
@@ -265,12 +274,28 @@ async def _async_process_config(hass, config, component) -> bool:
             else:
                 raw_config = cast(ScriptConfig, config_block).raw_config
 
+            fingerprint = config_fingerprint(
+                object_id, raw_config, raw_blueprint_inputs
+            )
+            if unchanged.get(fingerprint):
+                kept.add(unchanged[fingerprint].pop().entity_id)
+                continue
+
             entities.append(
                 ScriptEntity(
                     hass, object_id, config_block, raw_config, raw_blueprint_inputs
                 )
             )
 
+    if removed := [
+        entity.entity_id
+        for entity in component.entities
+        if entity.entity_id not in kept
+    ]:
+        await asyncio.gather(
+            *(component.async_remove_entity(entity_id) for entity_id in removed)
+        )
+
     await component.async_add_entities(entities)
 
     async def service_handler(service):
@@ -328,6 +353,9 @@ class ScriptEntity(ToggleEntity, RestoreEntity):
         self._raw_config = raw_config
         self._trace_config = cfg[CONF_TRACE]
         self._blueprint_inputs = blueprint_inputs
+        self.config_fingerprint = config_fingerprint(
+            object_id, raw_config, blueprint_inputs
+        )
 
     @property
     def should_poll(self):
@@ -7,6 +7,7 @@ import datetime
 import itertools
 import logging
 import math
+import threading
 
 from sqlalchemy.orm.session import Session
 
@@ -39,6 +40,7 @@ from homeassistant.const import (
     DEVICE_CLASS_POWER,
     ENERGY_KILO_WATT_HOUR,
     ENERGY_WATT_HOUR,
+    EVENT_STATE_CHANGED,
     POWER_KILO_WATT,
     POWER_WATT,
     PRESSURE_BAR,
@@ -53,7 +55,7 @@ from homeassistant.const import (
     VOLUME_CUBIC_FEET,
     VOLUME_CUBIC_METERS,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 import homeassistant.util.dt as dt_util
@@ -133,6 +135,113 @@ WARN_NEGATIVE = "sensor_warn_total_increasing_negative"
 # Keep track of entities for which a warning about unsupported unit has been logged
 WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
+# The states collected for statistics periods which are not compiled yet
+DATA_STATES_ACCUMULATOR = "sensor_states_accumulator"
+
+
+class StatesAccumulator:
+    """Collect sensor states from the state machine for statistics compilation.
+
+    Compiling statistics from the collected states avoids reading back states
+    from the database which passed through memory moments before. Periods
+    starting before the accumulator started, for example after a restart,
+    are compiled from the database.
+
+    Only states with a state class are collected since statistics are not
+    compiled for other sensors.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulator with the current sensor states."""
+        self.tracking_since = dt_util.utcnow()
+        self._lock = threading.Lock()
+        self._states: dict[str, list[State]] = {
+            state.entity_id: [state]
+            for state in hass.states.async_all(DOMAIN)
+            if state.attributes.get(ATTR_STATE_CLASS) in STATE_CLASSES
+        }
+
+    @callback
+    def async_state_changed(self, event: Event) -> None:
+        """Collect a changed sensor state."""
+        entity_id: str = event.data["entity_id"]
+        if not entity_id.startswith(f"{DOMAIN}."):
+            return
+        new_state: State | None = event.data["new_state"]
+        with self._lock:
+            if (
+                new_state is None
+                or new_state.attributes.get(ATTR_STATE_CLASS) not in STATE_CLASSES
+            ):
+                self._states.pop(entity_id, None)
+            else:
+                self._states.setdefault(entity_id, []).append(new_state)
+
+    def history(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        entities_full_history: list[str],
+        entities_significant_history: list[str],
+    ) -> dict[str, list[State]] | None:
+        """Return the states during start-end, or None if not collected.
+
+        Like the recorder history, the last state before start is included and
+        attribute only changes are skipped for entities_significant_history.
+        """
+        if start < self.tracking_since:
+            return None
+
+        history_list: dict[str, list[State]] = {}
+        significant_entities = set(entities_significant_history)
+        with self._lock:
+            for entity_id in itertools.chain(
+                entities_full_history, entities_significant_history
+            ):
+                if not (states := self._states.get(entity_id)):
+                    continue
+                significant_only = entity_id in significant_entities
+                start_state: State | None = None
+                entity_history: list[State] = []
+                for state in sorted(states, key=lambda state: state.last_updated):
+                    if state.last_updated < start:
+                        start_state = state
+                    elif state.last_updated < end and (
+                        not significant_only or state.last_changed == state.last_updated
+                    ):
+                        entity_history.append(state)
+                if start_state is not None:
+                    entity_history.insert(0, start_state)
+                if entity_history:
+                    history_list[entity_id] = entity_history
+
+        return history_list
+
+    def prune(self, end: datetime.datetime) -> None:
+        """Release the states before end once statistics until end are saved.
+
+        The last state before end is kept as the start state of the next period.
+        """
+        with self._lock:
+            for entity_id, states in self._states.items():
+                if released := [state for state in states if state.last_updated < end]:
+                    last_released = max(released, key=lambda state: state.last_updated)
+                    self._states[entity_id] = [last_released] + [
+                        state for state in states if state.last_updated >= end
+                    ]
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Start collecting sensor states for statistics compilation."""
+    accumulator = hass.data[DATA_STATES_ACCUMULATOR] = StatesAccumulator(hass)
+    hass.bus.async_listen(EVENT_STATE_CHANGED, accumulator.async_state_changed)
+
+
+def statistics_compiled(hass: HomeAssistant, end: datetime.datetime) -> None:
+    """Release the collected states only needed for statistics until end."""
+    if accumulator := hass.data.get(DATA_STATES_ACCUMULATOR):
+        accumulator.prune(end)
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -377,6 +486,37 @@ def _last_reset_as_utc_isoformat(
     return dt_util.as_utc(last_reset).isoformat()
 
 
+def _get_history_from_db(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    entities_full_history: list[str],
+    entities_significant_history: list[str],
+) -> dict[str, Iterable[State]]:
+    """Query the recorded states of the entities during start-end."""
+    history_list = {}
+    if entities_full_history:
+        history_list = history.get_significant_states_with_session(  # type: ignore
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=entities_full_history,
+            significant_changes_only=False,
+        )
+    if entities_significant_history:
+        _history_list = history.get_significant_states_with_session(  # type: ignore
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=entities_significant_history,
+        )
+        history_list = {**history_list, **_history_list}
+    return history_list
+
+
 def compile_statistics(
     hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
 ) -> list[StatisticResult]:
@@ -408,30 +548,26 @@ def _compile_statistics(  # noqa: C901
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list = {}
-    if entities_full_history:
-        history_list = history.get_significant_states_with_session(  # type: ignore
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
-        )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
-    if entities_significant_history:
-        _history_list = history.get_significant_states_with_session(  # type: ignore
+    history_list: dict[str, Iterable[State]] | None = None
+    if accumulator := hass.data.get(DATA_STATES_ACCUMULATOR):
+        history_list = accumulator.history(
+            start, end, entities_full_history, entities_significant_history
+        )
+    if history_list is None:
+        history_list = _get_history_from_db(
             hass,
             session,
-            start - datetime.timedelta.resolution,
+            start,
             end,
-            entity_ids=entities_significant_history,
+            entities_full_history,
+            entities_significant_history,
         )
-        history_list = {**history_list, **_history_list}
+
     # If there are no recent state changes, the sensor's state may already be pruned
     # from the recorder. Get the state from the state machine instead.
     for _state in sensor_states:
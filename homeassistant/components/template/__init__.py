@@ -14,17 +14,24 @@ from homeassistant.const import (
 from homeassistant.core import CoreState, Event, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
+    config_per_platform,
     discovery,
+    extract_domain_configs,
     trigger as trigger_helper,
     update_coordinator,
 )
-from homeassistant.helpers.reload import async_reload_integration_platforms
+from homeassistant.helpers.reload import (
+    async_reload_integration_platforms,
+    config_fingerprint,
+)
 from homeassistant.loader import async_get_integration
 
 from .const import CONF_TRIGGER, DOMAIN, PLATFORMS
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_RELOAD_FINGERPRINT = "template_reload_fingerprint"
+
 
 async def async_setup(hass, config):
     """Set up the template integration."""
@@ -39,17 +46,23 @@ async def async_setup(hass, config):
             _LOGGER.error(err)
             return
 
-        conf = await conf_util.async_process_component_config(
-            hass, unprocessed_conf, await async_get_integration(hass, DOMAIN)
-        )
+        # The template entities are kept when their config didn't change since
+        # the last reload
+        fingerprint = config_fingerprint(*_raw_template_configs(unprocessed_conf))
+        if fingerprint is None or fingerprint != hass.data.get(DATA_RELOAD_FINGERPRINT):
+            conf = await conf_util.async_process_component_config(
+                hass, unprocessed_conf, await async_get_integration(hass, DOMAIN)
+            )
 
-        if conf is None:
-            return
+            if conf is None:
+                return
 
-        await async_reload_integration_platforms(hass, DOMAIN, PLATFORMS)
+            await async_reload_integration_platforms(hass, DOMAIN, PLATFORMS)
 
-        if DOMAIN in conf:
-            await _process_config(hass, conf)
+            if DOMAIN in conf:
+                await _process_config(hass, conf)
+
+            hass.data[DATA_RELOAD_FINGERPRINT] = fingerprint
 
         hass.bus.async_fire(f"event_{DOMAIN}_reloaded", context=call.context)
 
@@ -60,6 +73,26 @@ async def async_setup(hass, config):
     return True
 
 
+def _raw_template_configs(unprocessed_conf):
+    """Return the unprocessed config of the template entities."""
+    return [
+        [
+            unprocessed_conf[config_key]
+            for config_key in extract_domain_configs(unprocessed_conf, DOMAIN)
+        ],
+        *(
+            [
+                p_config
+                for p_type, p_config in config_per_platform(
+                    unprocessed_conf, platform_domain
+                )
+                if p_type == DOMAIN
+            ]
+            for platform_domain in PLATFORMS
+        ),
+    ]
+
+
 async def _process_config(hass, hass_config):
     """Process config."""
     coordinators: list[TriggerUpdateCoordinator] | None = hass.data.pop(DOMAIN, None)
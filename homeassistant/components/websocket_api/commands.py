@@ -12,7 +12,7 @@ from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
-from homeassistant.core import Context, Event, HomeAssistant, callback
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -53,6 +53,7 @@ def async_register_commands(
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -113,6 +114,65 @@ def handle_subscribe_events(
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends the compressed states of the entities and
+    then only what changed for each state change.
+    """
+    entity_ids = set(msg["entity_ids"]) if "entity_ids" in msg else None
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Forward entity state changes to websocket."""
+        if not connection.user.permissions.check_entity(
+            event.data["entity_id"], POLICY_READ
+        ):
+            return
+
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+
+    # We must never await between sending the states and listening for
+    # state changed events or we will introduce a race condition
+    # where some states are missed
+    if entity_ids is None:
+        states = _async_get_allowed_states(hass, connection)
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, forward_entity_changes
+        )
+    else:
+        states = [
+            state
+            for state in _async_get_allowed_states(hass, connection)
+            if state.entity_id in entity_ids
+        ]
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED, forward_entity_changes, "entity_id", entity_ids
+        )
+
+    connection.send_message(messages.result_message(msg["id"]))
+    connection.send_message(
+        messages.event_message(
+            msg["id"],
+            {
+                messages.ENTITY_EVENT_ADD: {
+                    state.entity_id: messages.compressed_state(state)
+                    for state in states
+                }
+            },
+        )
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -228,17 +288,34 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
-    if connection.user.permissions.access_all_entities("read"):
-        states = hass.states.async_all()
-    else:
-        entity_perm = connection.user.permissions.check_entity
-        states = [
-            state
-            for state in hass.states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
+    states = _async_get_allowed_states(hass, connection)
+
+    # Reuse the JSON cached on each State. If a state can't be serialized
+    # the generic path logs the bad data and sends an error result.
+    try:
+        states_json = b",".join(state.as_dict_json() for state in states)
+    except (ValueError, TypeError):
+        connection.send_message(messages.result_message(msg["id"], states))
+        return
+
+    connection.send_message(
+        messages.construct_result_message(msg["id"], f"[{states_json.decode('utf-8')}]")
+    )
+
 
-    connection.send_message(messages.result_message(msg["id"], states))
+@callback
+def _async_get_allowed_states(
+    hass: HomeAssistant, connection: ActiveConnection
+) -> list[State]:
+    """Return the states the user of the connection may read."""
+    if connection.user.permissions.access_all_entities("read"):
+        return hass.states.async_all()
+    entity_perm = connection.user.permissions.check_entity
+    return [
+        state
+        for state in hass.states.async_all()
+        if entity_perm(state.entity_id, "read")
+    ]
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -7,8 +7,10 @@ from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import (
     find_paths_unserializable_data,
     format_unserializable_data,
@@ -31,12 +33,35 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
 
+STATE_CHANGED_DATA_KEYS: Final = {"entity_id", "old_state", "new_state"}
+
+# Keys of the entity events sent to subscribe_entities
+ENTITY_EVENT_ADD: Final = "a"
+ENTITY_EVENT_REMOVE: Final = "r"
+ENTITY_EVENT_CHANGE: Final = "c"
+
+# Keys of a compressed state
+COMPRESSED_STATE_STATE: Final = "s"
+COMPRESSED_STATE_ATTRIBUTES: Final = "a"
+COMPRESSED_STATE_CONTEXT: Final = "c"
+COMPRESSED_STATE_LAST_CHANGED: Final = "lc"
+COMPRESSED_STATE_LAST_UPDATED: Final = "lu"
+
+# Keys of a state diff
+STATE_DIFF_ADDITIONS: Final = "+"
+STATE_DIFF_REMOVALS: Final = "-"
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
 
+def construct_result_message(iden: int, payload: str) -> str:
+    """Construct a success result message JSON from an encoded result."""
+    return f'{{"id":{iden},"type":"{const.TYPE_RESULT}","success":true,"result":{payload}}}'
+
+
 def error_message(iden: int | None, code: str, message: str) -> dict[str, Any]:
     """Return an error result message."""
     return {
@@ -71,9 +96,125 @@ def _cached_event_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
+    if (
+        event.event_type == EVENT_STATE_CHANGED
+        and event.data.keys() == STATE_CHANGED_DATA_KEYS
+    ):
+        try:
+            return _state_changed_event_message_json(event)
+        except (ValueError, TypeError):
+            pass
     return message_to_json(event_message(IDEN_TEMPLATE, event))
 
 
+def _state_changed_event_message_json(event: Event) -> str:
+    """Serialize a state_changed event message.
+
+    The old and new states reuse the JSON cached on the State objects
+    so it is shared with get_states and every other consumer.
+    """
+    data = event.data
+    old_state_json = _state_json(data.get("old_state"))
+    new_state_json = _state_json(data.get("new_state"))
+    event_json = json_dumps(
+        {
+            "event_type": event.event_type,
+            "origin": str(event.origin.value),
+            "time_fired": event.time_fired.isoformat(),
+            "context": event.context.as_dict(),
+        }
+    )
+    return (
+        f'{{"id":{IDEN_JSON_TEMPLATE},"type":"event","event":{{"data":{{'
+        f'"entity_id":{json_dumps(data["entity_id"])},'
+        f'"old_state":{old_state_json},"new_state":{new_state_json}}},'
+        f"{event_json[1:]}}}"
+    )
+
+
+def cached_state_diff_message(iden: int, event: Event) -> str:
+    """Return an entity event message for a state_changed event.
+
+    Serialize to json once per message, see cached_event_message.
+    """
+    return _cached_state_diff_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+
+
+@lru_cache(maxsize=128)
+def _cached_state_diff_message(event: Event) -> str:
+    """Cache and serialize the state diff of the event to json.
+
+    The IDEN_TEMPLATE is used which will be replaced
+    with the actual iden in cached_state_diff_message
+    """
+    return message_to_json(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
+
+
+def _state_json(state: State | None) -> str:
+    """Return the cached JSON of a state or null."""
+    if state is None:
+        return "null"
+    return state.as_dict_json().decode("utf-8")
+
+
+def _state_diff_event(event: Event) -> dict[str, Any]:
+    """Convert a state_changed event to an entity event."""
+    if (new_state := event.data["new_state"]) is None:
+        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    if (old_state := event.data["old_state"]) is None:
+        return {ENTITY_EVENT_ADD: {new_state.entity_id: compressed_state(new_state)}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: state_diff(old_state, new_state)}
+    }
+
+
+def compressed_state(state: State) -> dict[str, Any]:
+    """Return a compact dict of a state for subscribe_entities."""
+    compressed = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: dict(state.attributes),
+        COMPRESSED_STATE_CONTEXT: _compressed_context(state),
+        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
+    }
+    if state.last_updated != state.last_changed:
+        compressed[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
+    return compressed
+
+
+def state_diff(old_state: State, new_state: State) -> dict[str, Any]:
+    """Return the fields of new_state that differ from old_state."""
+    additions: dict[str, Any] = {}
+    diff = {STATE_DIFF_ADDITIONS: additions}
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    elif old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+    if old_state.context != new_state.context:
+        additions[COMPRESSED_STATE_CONTEXT] = _compressed_context(new_state)
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    changed_attributes = {
+        key: value
+        for key, value in new_attributes.items()
+        if key not in old_attributes or old_attributes[key] != value
+    }
+    if changed_attributes:
+        additions[COMPRESSED_STATE_ATTRIBUTES] = changed_attributes
+    if removed := [key for key in old_attributes if key not in new_attributes]:
+        diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: removed}
+    return diff
+
+
+def _compressed_context(state: State) -> str | dict[str, Any]:
+    """Return the context id, or the whole context if it has more than an id."""
+    context = state.context
+    if context.parent_id is None and context.user_id is None:
+        return context.id
+    return context.as_dict()
+
+
 def message_to_json(message: dict[str, Any]) -> str:
     """Serialize a websocket message to json."""
     try:
@@ -57,6 +57,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform, extract_domain_configs
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration, IntegrationNotFound
 from homeassistant.requirements import (
@@ -65,15 +66,17 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, Secrets, load_yaml
+from homeassistant.util.yaml import SECRET_YAML, Secrets, YamlCache, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
 DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
+DATA_YAML_CACHE = "yaml_cache"
 RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+YAML_CACHE_FILE = "core.yaml_cache"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
 
@@ -359,14 +362,30 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
         load_yaml_config_file,
         hass.config.path(YAML_CONFIG_FILE),
         secrets,
+        async_get_yaml_cache(hass),
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
 
 
+@callback
+def async_get_yaml_cache(hass: HomeAssistant) -> YamlCache | None:
+    """Return the cache for parsing the YAML configuration.
+
+    Returns None if the configuration directory is not set.
+    """
+    if DATA_YAML_CACHE not in hass.data:
+        hass.data[DATA_YAML_CACHE] = (
+            None
+            if hass.config.config_dir is None
+            else YamlCache(hass.config.path(STORAGE_DIR, YAML_CACHE_FILE))
+        )
+    return hass.data[DATA_YAML_CACHE]  # type: ignore[no-any-return]
+
+
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str, secrets: Secrets | None = None, cache: YamlCache | None = None
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
@@ -374,7 +393,10 @@ def load_yaml_config_file(
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path, secrets)
+    if cache is None:
+        conf_dict = load_yaml(config_path, secrets)
+    else:
+        conf_dict = cache.load_yaml(config_path, secrets)
 
     if not isinstance(conf_dict, dict):
         msg = (
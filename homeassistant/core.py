@@ -18,7 +18,7 @@ import re
 import threading
 from time import monotonic
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, TypeVar, cast
 from urllib.parse import urlparse
 
 import attr
@@ -67,6 +67,7 @@ from homeassistant.util.async_ import (
     shutdown_run_callback_threadsafe,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_bytes
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
 import homeassistant.util.uuid as uuid_util
@@ -657,12 +658,43 @@ class Event:
         )
 
 
+class _KeyedEventFilter:
+    """Event filter that matches one event data key against a set of values.
+
+    The event bus indexes listeners with this filter by value so they
+    are matched with a dict lookup instead of being called for every event.
+    """
+
+    __slots__ = ("key", "values")
+
+    def __init__(self, key: str, values: Iterable[Any]) -> None:
+        """Initialize a keyed event filter."""
+        self.key = key
+        self.values = frozenset(values)
+
+    @callback
+    def __call__(self, event: Event) -> bool:
+        """Return True if the event matches the filter."""
+        try:
+            return event.data.get(self.key) in self.values
+        except TypeError:
+            return False
+
+
+_DispatchType = Tuple[
+    Tuple[Tuple[HassJob, Optional[Callable]], ...],
+    Tuple[Tuple[str, Dict[Any, Tuple[HassJob, ...]]], ...],
+]
+_EMPTY_DISPATCH: _DispatchType = ((), ())
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        self._dispatch: dict[str, _DispatchType] = {}
         self._hass = hass
 
     @callback
@@ -708,22 +740,19 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        if (dispatch := self._dispatch.get(event_type)) is None:
+            dispatch = self._async_build_dispatch(event_type)
+        filterable_jobs, keyed_jobs = dispatch
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
+        if not filterable_jobs and not keyed_jobs:
             return
 
-        for job, event_filter in listeners:
+        for job, event_filter in filterable_jobs:
             if event_filter is not None:
                 try:
                     if not event_filter(event):
@@ -733,6 +762,71 @@ class EventBus:
                     continue
             self._hass.async_add_hass_job(job, event)
 
+        for key, jobs_by_value in keyed_jobs:
+            try:
+                jobs = jobs_by_value.get(event.data.get(key))
+            except TypeError:
+                # Unhashable values can never match
+                continue
+            if jobs is None:
+                continue
+            for job in jobs:
+                self._hass.async_add_hass_job(job, event)
+
+    @callback
+    def _async_build_dispatch(self, event_type: str) -> _DispatchType:
+        """Build and cache the jobs to run when event_type is fired.
+
+        Listeners with a keyed filter are grouped by event data key and
+        indexed by value. The result is cached until the listeners of
+        event_type or MATCH_ALL change. Event types without listeners of
+        their own share the cached jobs of MATCH_ALL, so the cache does not
+        grow with every event type that is fired.
+        """
+        listeners = self._listeners.get(event_type)
+        match_all_listeners = self._listeners.get(MATCH_ALL)
+        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
+        if event_type == EVENT_HOMEASSISTANT_CLOSE:
+            match_all_listeners = None
+
+        if not listeners:
+            if not match_all_listeners:
+                return _EMPTY_DISPATCH
+            if (dispatch := self._dispatch.get(MATCH_ALL)) is not None:
+                return dispatch
+            event_type = MATCH_ALL
+            listeners = match_all_listeners
+        elif match_all_listeners:
+            listeners = match_all_listeners + listeners
+
+        filterable_jobs: list[tuple[HassJob, Callable | None]] = []
+        keyed_jobs: dict[str, dict[Any, list[HassJob]]] = {}
+        for job, event_filter in listeners:
+            if isinstance(event_filter, _KeyedEventFilter):
+                jobs_by_value = keyed_jobs.setdefault(event_filter.key, {})
+                for value in event_filter.values:
+                    jobs_by_value.setdefault(value, []).append(job)
+            else:
+                filterable_jobs.append((job, event_filter))
+
+        dispatch: _DispatchType = (
+            tuple(filterable_jobs),
+            tuple(
+                (key, {value: tuple(jobs) for value, jobs in jobs_by_value.items()})
+                for key, jobs_by_value in keyed_jobs.items()
+            ),
+        )
+        self._dispatch[event_type] = dispatch
+        return dispatch
+
+    @callback
+    def _async_invalidate_dispatch(self, event_type: str) -> None:
+        """Drop cached dispatch data affected by a listener change."""
+        if event_type == MATCH_ALL:
+            self._dispatch.clear()
+        else:
+            self._dispatch.pop(event_type, None)
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -773,11 +867,33 @@ class EventBus:
             event_type, (HassJob(listener), event_filter)
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        listener: Callable,
+        key: str,
+        values: Iterable[Any],
+    ) -> CALLBACK_TYPE:
+        """Listen for events where the event data key has one of the values.
+
+        This is equivalent to passing an event_filter that tests
+        ``event.data.get(key) in values``, but the listener is matched
+        with a dict lookup when the event is fired instead of calling
+        a filter for every event.
+
+        This method must be run in the event loop.
+        """
+        return self._async_listen_filterable_job(
+            event_type, (HassJob(listener), _KeyedEventFilter(key, values))
+        )
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: tuple[HassJob, Callable | None]
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_invalidate_dispatch(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -852,6 +968,8 @@ class EventBus:
             # delete event_type list if empty
             if not self._listeners[event_type]:
                 self._listeners.pop(event_type)
+
+            self._async_invalidate_dispatch(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -883,6 +1001,7 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
     ]
 
     def __init__(
@@ -918,6 +1037,7 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_dict_json: bytes | None = None
 
     @property
     def name(self) -> str:
@@ -950,6 +1070,18 @@ class State:
             }
         return self._as_dict
 
+    def as_dict_json(self) -> bytes:
+        """Return the JSON encoded dict representation of the State.
+
+        Async friendly.
+
+        The State is immutable, so the bytes are encoded once and shared
+        by every consumer that sends the same State.
+        """
+        if self._as_dict_json is None:
+            self._as_dict_json = json_bytes(self.as_dict(), allow_nan=False)
+        return self._as_dict_json
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
@@ -1009,6 +1141,7 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1032,13 +1165,13 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
-        ]
+        entity_ids: list[str] = []
+        for domain in dict.fromkeys(domain_filter):
+            if domain_index := self._domain_index.get(domain):
+                entity_ids.extend(domain_index)
+        return entity_ids
 
     @callback
     def async_entity_ids_count(
@@ -1052,10 +1185,11 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(self._domain_index.get(domain, ()))
+            for domain in dict.fromkeys(domain_filter)
         )
 
     def all(self, domain_filter: str | Iterable | None = None) -> list[State]:
@@ -1074,11 +1208,13 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), {}).values())
 
-        return [
-            state for state in self._states.values() if state.domain in domain_filter
-        ]
+        states: list[State] = []
+        for domain in dict.fromkeys(domain_filter):
+            if domain_index := self._domain_index.get(domain):
+                states.extend(domain_index.values())
+        return states
 
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
@@ -1121,6 +1257,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_index = self._domain_index[old_state.domain]
+        del domain_index[entity_id]
+        if not domain_index:
+            del self._domain_index[old_state.domain]
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1225,6 +1366,7 @@ class StateMachine:
             old_state is None,
         )
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -157,6 +157,8 @@ class DeviceRegistry:
     deleted_devices: dict[str, DeletedDeviceEntry]
     _registered_index: _DeviceIndex
     _deleted_index: _DeviceIndex
+    _area_index: dict[str, dict[str, DeviceEntry]]
+    _config_entry_index: dict[str, dict[str, DeviceEntry]]
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
@@ -204,6 +206,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices[device.id] = device
+            self._add_device_to_reverse_index(device)
 
         _add_device_to_index(devices_index, device)
 
@@ -215,6 +218,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices.pop(device.id)
+            self._update_reverse_index(device, None)
 
         _remove_device_from_index(devices_index, device)
 
@@ -225,17 +229,48 @@ class DeviceRegistry:
         devices_index = self._registered_index
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
+        self._update_reverse_index(old_device, new_device)
+
+    def _add_device_to_reverse_index(self, device: DeviceEntry) -> None:
+        """Add a device to the indexes by area and config entry."""
+        if device.area_id is not None:
+            self._area_index.setdefault(device.area_id, {})[device.id] = device
+        for config_entry_id in device.config_entries:
+            self._config_entry_index.setdefault(config_entry_id, {})[device.id] = device
+
+    def _update_reverse_index(
+        self, old_device: DeviceEntry, new_device: DeviceEntry | None
+    ) -> None:
+        """Update the indexes by area and config entry.
+
+        Devices keep their position for the keys which didn't change.
+        """
+        new_area_id = new_device.area_id if new_device else None
+        new_config_entries = new_device.config_entries if new_device else set()
+        if old_device.area_id is not None and old_device.area_id != new_area_id:
+            _remove_from_reverse_index(
+                self._area_index, old_device.area_id, old_device.id
+            )
+        for config_entry_id in old_device.config_entries - new_config_entries:
+            _remove_from_reverse_index(
+                self._config_entry_index, config_entry_id, old_device.id
+            )
+        if new_device is not None:
+            self._add_device_to_reverse_index(new_device)
 
     def _clear_index(self) -> None:
         """Clear the index."""
         self._registered_index = _DeviceIndex(identifiers={}, connections={})
         self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._area_index = {}
+        self._config_entry_index = {}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._registered_index, device)
+            self._add_device_to_reverse_index(device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._deleted_index, deleted_device)
 
@@ -576,8 +611,8 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
+        for device_id in list(self._config_entry_index.get(config_entry_id, {})):
+            self._async_update_device(device_id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
             if config_entry_id not in config_entries:
@@ -617,9 +652,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in list(self._area_index.get(area_id, {})):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @callback
@@ -647,7 +681,8 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    # pylint: disable-next=protected-access
+    return list(registry._area_index.get(area_id, {}).values())
 
 
 @callback
@@ -655,11 +690,8 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    # pylint: disable-next=protected-access
+    return list(registry._config_entry_index.get(config_entry_id, {}).values())
 
 
 @callback
@@ -807,6 +839,16 @@ def _add_device_to_index(
         devices_index.connections[connection] = device.id
 
 
+def _remove_from_reverse_index(
+    index: dict[str, dict[str, DeviceEntry]], key: str, device_id: str
+) -> None:
+    """Remove a device from an index by area or config entry."""
+    devices = index[key]
+    del devices[device_id]
+    if not devices:
+        del index[key]
+
+
 def _remove_device_from_index(
     devices_index: _DeviceIndex,
     device: DeviceEntry | DeletedDeviceEntry,
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
+from collections import Counter
 from collections.abc import Awaitable, Iterable, Mapping, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -35,6 +36,7 @@ from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entity_registry import RegistryEntry
+from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.event import Event, async_track_entity_registry_updated_event
 from homeassistant.helpers.typing import StateType
 from homeassistant.loader import bind_hass
@@ -43,6 +45,7 @@ from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_COALESCED_STATE_WRITES = "entity_coalesced_state_writes"
 SOURCE_CONFIG_ENTRY = "config_entry"
 SOURCE_PLATFORM_CONFIG = "platform_config"
 
@@ -58,6 +61,13 @@ def entity_sources(hass: HomeAssistant) -> dict[str, dict[str, str]]:
     return hass.data.get(DATA_ENTITY_SOURCE, {})
 
 
+@callback
+@bind_hass
+def coalesced_state_writes(hass: HomeAssistant) -> Counter[str]:
+    """Get the number of state writes collapsed into a later write per entity."""
+    return hass.data.get(DATA_COALESCED_STATE_WRITES, Counter())
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -230,9 +240,18 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _added = False
 
+    # Cached state attributes which don't depend on the state
+    _static_attributes: tuple[
+        EntityValues | None, Mapping[str, Any], dict[str, Any], Mapping[str, Any]
+    ] | None = None
+
+    # Scheduled state write of entities which coalesce their state writes
+    _pending_write: asyncio.TimerHandle | asyncio.Handle | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_available: bool = True
+    _attr_cache_static_attributes: bool = False
     _attr_context_recent_time: timedelta = timedelta(seconds=5)
     _attr_device_class: str | None
     _attr_device_info: DeviceInfo | None = None
@@ -244,6 +263,7 @@ class Entity(ABC):
     _attr_name: str | None
     _attr_should_poll: bool = True
     _attr_state: StateType = STATE_UNKNOWN
+    _attr_state_write_window: timedelta | None = None
     _attr_supported_features: int | None = None
     _attr_unique_id: str | None = None
     _attr_unit_of_measurement: str | None
@@ -388,6 +408,26 @@ class Entity(ABC):
         """Time that a context is considered recent."""
         return self._attr_context_recent_time
 
+    @property
+    def cache_static_attributes(self) -> bool:
+        """Return True if the state attributes which don't depend on the state are cached.
+
+        These are the capability attributes, unit of measurement, name, icon,
+        entity picture, supported features, device class and customizations.
+        The cache is cleared when the entity registry entry is updated or by
+        calling async_invalidate_static_attributes.
+        """
+        return self._attr_cache_static_attributes
+
+    @property
+    def state_write_window(self) -> timedelta | None:
+        """Return the window in which state writes are coalesced.
+
+        None writes the state immediately. A zero window coalesces the state
+        writes made during one iteration of the event loop.
+        """
+        return self._attr_state_write_window
+
     @property
     def entity_registry_enabled_default(self) -> bool:
         """Return if the entity should be enabled when first added to the entity registry."""
@@ -453,8 +493,80 @@ class Entity(ABC):
                 f"No entity id specified for entity {self.name}"
             )
 
+        if (window := self.state_write_window) is None or (
+            self.hass.states.get(self.entity_id) is None
+        ):
+            # The initial state is not coalesced so it is available once added
+            self._async_write_ha_state()
+            return
+
+        if self._pending_write is not None:
+            writes = self.hass.data.setdefault(DATA_COALESCED_STATE_WRITES, Counter())
+            writes[self.entity_id] += 1
+            return
+
+        if window:
+            self._pending_write = self.hass.loop.call_later(
+                window.total_seconds(), self._async_write_pending_ha_state
+            )
+        else:
+            self._pending_write = self.hass.loop.call_soon(
+                self._async_write_pending_ha_state
+            )
+
+    @callback
+    def _async_write_pending_ha_state(self) -> None:
+        """Write the state of a coalesced state write."""
+        self._pending_write = None
         self._async_write_ha_state()
 
+    @callback
+    def _async_calculate_static_attributes(
+        self, customize: EntityValues | None
+    ) -> tuple[
+        EntityValues | None, Mapping[str, Any], dict[str, Any], Mapping[str, Any]
+    ]:
+        """Calculate the state attributes which don't depend on the state.
+
+        Returns the customize values used, the capability attributes, the entity
+        attributes and the customized attributes.
+        """
+        capability_attr = self.capability_attributes or {}
+
+        attr: dict[str, Any] = {}
+        unit_of_measurement = self.unit_of_measurement
+        if unit_of_measurement is not None:
+            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        entry = self.registry_entry
+        # pylint: disable=consider-using-ternary
+        if (name := (entry and entry.name) or self.name) is not None:
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        if (icon := (entry and entry.icon) or self.icon) is not None:
+            attr[ATTR_ICON] = icon
+
+        if (entity_picture := self.entity_picture) is not None:
+            attr[ATTR_ENTITY_PICTURE] = entity_picture
+
+        if (supported_features := self.supported_features) is not None:
+            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+        if (device_class := self.device_class) is not None:
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        customize_attr = customize.get(self.entity_id) if customize is not None else {}
+
+        return customize, capability_attr, attr, customize_attr
+
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Invalidate the cached static state attributes.
+
+        Call this when a cached property changed, before writing the state.
+        """
+        self._static_attributes = None
+
     def _stringify_state(self) -> str:
         """Convert state to string."""
         if not self.available:
@@ -470,6 +582,11 @@ class Entity(ABC):
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if self._pending_write is not None:
+            # The state written now supersedes the scheduled write
+            self._pending_write.cancel()
+            self._pending_write = None
+
         if self.registry_entry and self.registry_entry.disabled_by:
             if not self._disabled_reported:
                 self._disabled_reported = True
@@ -483,8 +600,17 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        customize = self.hass.data.get(DATA_CUSTOMIZE)
+        if not self.cache_static_attributes:
+            static_attributes = self._async_calculate_static_attributes(customize)
+        elif (
+            static_attributes := self._static_attributes
+        ) is None or static_attributes[0] is not customize:
+            static_attributes = self._async_calculate_static_attributes(customize)
+            self._static_attributes = static_attributes
+        _, capability_attr, entity_attr, customize_attr = static_attributes
+
+        attr = dict(capability_attr)
 
         state = self._stringify_state()
         if self.available:
@@ -496,30 +622,11 @@ class Entity(ABC):
                 extra_state_attributes = self.device_state_attributes
             attr.update(extra_state_attributes or {})
 
-        unit_of_measurement = self.unit_of_measurement
-        if unit_of_measurement is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        entry = self.registry_entry
-        # pylint: disable=consider-using-ternary
-        if (name := (entry and entry.name) or self.name) is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        if (icon := (entry and entry.icon) or self.icon) is not None:
-            attr[ATTR_ICON] = icon
-
-        if (entity_picture := self.entity_picture) is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
+        attr.update(entity_attr)
 
         if assumed_state := self.assumed_state:
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
-        if (supported_features := self.supported_features) is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
-
-        if (device_class := self.device_class) is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
-
         end = timer()
 
         if end - start > 0.4 and not self._slow_reported:
@@ -534,8 +641,7 @@ class Entity(ABC):
             )
 
         # Overwrite properties that have been set in the config file.
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+        attr.update(customize_attr)
 
         # Convert temperature if we detect one
         try:
@@ -698,6 +804,9 @@ class Entity(ABC):
 
         self._added = False
 
+        if self._pending_write is not None:
+            self._async_write_ha_state()
+
         if self._on_remove is not None:
             while self._on_remove:
                 self._on_remove.pop()()
@@ -780,6 +889,7 @@ class Entity(ABC):
 
         ent_reg = await self.hass.helpers.entity_registry.async_get_registry()
         old = self.registry_entry
+        self._static_attributes = None
         self.registry_entry = ent_reg.async_get(data["entity_id"])
         assert self.registry_entry is not None
 
@@ -154,6 +154,9 @@ class EntityRegistry:
         self.hass = hass
         self.entities: dict[str, RegistryEntry]
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._area_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._config_entry_index: dict[str, dict[str, RegistryEntry]] = {}
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -472,9 +475,9 @@ class EntityRegistry:
         if not new_values:
             return old
 
-        self._remove_index(old)
         new = attr.evolve(old, **new_values)
-        self._register_entry(new)
+        self.entities[new.entity_id] = new
+        self._update_index(old, new)
 
         self.async_schedule_save()
 
@@ -564,19 +567,14 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(self._config_entry_index.get(config_entry, {})):
             self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entity_id in list(self._area_index.get(area_id, {})):
+            self._async_update_entity(entity_id, area_id=None)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
@@ -584,6 +582,9 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        for index, key in self._reverse_index_keys(entry):
+            if key is not None:
+                index.setdefault(key, {})[entry.entity_id] = entry
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -591,13 +592,56 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        for index, key in self._reverse_index_keys(entry):
+            if key is not None:
+                _remove_from_reverse_index(index, key, entry.entity_id)
+
+    def _update_index(self, old: RegistryEntry, new: RegistryEntry) -> None:
+        """Update the indexes for an updated entry.
+
+        Entries keep their position for the keys which didn't change.
+        """
+        del self._index[(old.domain, old.platform, old.unique_id)]
+        self._index[(new.domain, new.platform, new.unique_id)] = new.entity_id
+        for (index, old_key), (_, new_key) in zip(
+            self._reverse_index_keys(old), self._reverse_index_keys(new)
+        ):
+            if old_key is not None and (
+                old_key != new_key or old.entity_id != new.entity_id
+            ):
+                _remove_from_reverse_index(index, old_key, old.entity_id)
+            if new_key is not None:
+                index.setdefault(new_key, {})[new.entity_id] = new
+
+    def _reverse_index_keys(
+        self, entry: RegistryEntry
+    ) -> tuple[tuple[dict[str, dict[str, RegistryEntry]], str | None], ...]:
+        """Return the reverse indexes with the key of the entry in each."""
+        return (
+            (self._device_index, entry.device_id),
+            (self._area_index, entry.area_id),
+            (self._config_entry_index, entry.config_entry_id),
+        )
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._device_index = {}
+        self._area_index = {}
+        self._config_entry_index = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
 
+def _remove_from_reverse_index(
+    index: dict[str, dict[str, RegistryEntry]], key: str, entity_id: str
+) -> None:
+    """Remove an entity from a reverse index."""
+    entries = index[key]
+    del entries[entity_id]
+    if not entries:
+        del index[key]
+
+
 @callback
 def async_get(hass: HomeAssistant) -> EntityRegistry:
     """Get entity registry."""
@@ -625,12 +669,11 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    # pylint: disable-next=protected-access
+    entries = registry._device_index.get(device_id, {}).values()
+    if include_disabled_entities:
+        return list(entries)
+    return [entry for entry in entries if not entry.disabled_by]
 
 
 @callback
@@ -638,7 +681,8 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    # pylint: disable-next=protected-access
+    return list(registry._area_index.get(area_id, {}).values())
 
 
 @callback
@@ -646,11 +690,8 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    # pylint: disable-next=protected-access
+    return list(registry._config_entry_index.get(config_entry_id, {}).values())
 
 
 @callback
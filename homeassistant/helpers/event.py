@@ -7,6 +7,7 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
 import logging
 import time
 from typing import Any, Callable, List, cast
@@ -54,6 +55,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TIME_PATTERN_SCHEDULER = "track_time_pattern_scheduler"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -1351,6 +1354,130 @@ track_sunset = threaded_listener_factory(async_track_sunset)
 time_tracker_utcnow = dt_util.utcnow
 
 
+@attr.s(slots=True)
+class _TimePatternListener:
+    """A listener registered with the time pattern scheduler."""
+
+    job: HassJob = attr.ib()
+    seconds: list[int] = attr.ib()
+    minutes: list[int] = attr.ib()
+    hours: list[int] = attr.ib()
+    local: bool = attr.ib()
+    cancelled: bool = attr.ib(default=False)
+
+    def next_fire(self, now: datetime) -> datetime:
+        """Return the next UTC time at or after now that matches the pattern."""
+        localized_now = dt_util.as_local(now) if self.local else now
+        return dt_util.as_utc(
+            dt_util.find_next_time_expression_time(
+                localized_now, self.seconds, self.minutes, self.hours
+            )
+        )
+
+
+class _TimePatternScheduler:
+    """Run time pattern listeners from a heap with a single loop timer.
+
+    Only the listener that is due first has a timer on the event loop.
+    All listeners that are due when it fires run in the same wakeup
+    instead of each listener arming its own timer.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._heap: list[tuple[datetime, int, _TimePatternListener]] = []
+        self._sequence = 0
+        self._cancelled = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_fire: datetime | None = None
+
+    @callback
+    def async_add(self, listener: _TimePatternListener) -> None:
+        """Add a listener and make sure the timer fires in time for it."""
+        self._async_push(listener, listener.next_fire(dt_util.utcnow()))
+        self._async_schedule()
+
+    @callback
+    def async_remove(self, listener: _TimePatternListener) -> None:
+        """Remove a listener."""
+        if listener.cancelled:
+            return
+        listener.cancelled = True
+        self._cancelled += 1
+        # Compact the heap once cancelled listeners make up most of it
+        if self._cancelled * 2 > len(self._heap):
+            self._heap = [item for item in self._heap if not item[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+        self._async_schedule()
+
+    @callback
+    def _async_push(self, listener: _TimePatternListener, fire: datetime) -> None:
+        """Push a listener on the heap."""
+        self._sequence += 1
+        heapq.heappush(self._heap, (fire, self._sequence, listener))
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Arm the loop timer for the listener that is due first."""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+
+        if not self._heap:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = self._timer_fire = None
+            return
+
+        fire = self._heap[0][0]
+        if self._timer is not None:
+            if self._timer_fire == fire:
+                return
+            self._timer.cancel()
+
+        self._timer_fire = fire
+        self._timer = self.hass.loop.call_later(
+            fire.timestamp() - time.time(), self._async_run_due
+        )
+
+    @callback
+    def _async_run_due(self) -> None:
+        """Run all listeners that are due and rearm the timer."""
+        self._timer = self._timer_fire = None
+        now = time_tracker_utcnow()
+        after_now = now + timedelta(seconds=1)
+
+        # Depending on the available clock support we may be called a little
+        # bit too early as measured by utcnow(). In that case nothing is due
+        # yet and the timer is rearmed for the remaining time.
+        while self._heap and self._heap[0][0] <= now:
+            listener = heapq.heappop(self._heap)[2]
+            if listener.cancelled:
+                self._cancelled -= 1
+                continue
+            self._async_push(listener, listener.next_fire(after_now))
+            try:
+                self.hass.async_run_hass_job(
+                    listener.job, dt_util.as_local(now) if listener.local else now
+                )
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while processing time change at %s", now)
+
+        self._async_schedule()
+
+
+@callback
+def _async_get_time_pattern_scheduler(hass: HomeAssistant) -> _TimePatternScheduler:
+    """Return the time pattern scheduler."""
+    if (scheduler := hass.data.get(TRACK_TIME_PATTERN_SCHEDULER)) is None:
+        scheduler = hass.data[TRACK_TIME_PATTERN_SCHEDULER] = _TimePatternScheduler(
+            hass
+        )
+    return cast(_TimePatternScheduler, scheduler)
+
+
 @callback
 @bind_hass
 def async_track_utc_time_change(
@@ -1361,7 +1488,13 @@ def async_track_utc_time_change(
     second: Any | None = None,
     local: bool = False,
 ) -> CALLBACK_TYPE:
-    """Add a listener that will fire if time matches a pattern."""
+    """Add a listener that will fire if time matches a pattern.
+
+    Pattern listeners are kept by a shared scheduler that only wakes up
+    when one of them is due, so a pattern like ``minute=0, second=0``
+    costs nothing in between and listeners due at the same time run
+    from a single timer.
+    """
     job = HassJob(action)
     # We do not have to wrap the function with time pattern matching logic
     # if no pattern given
@@ -1374,42 +1507,20 @@ def async_track_utc_time_change(
 
         return hass.bus.async_listen(EVENT_TIME_CHANGED, time_change_listener)
 
-    matching_seconds = dt_util.parse_time_expression(second, 0, 59)
-    matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
-    matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-
-    def calculate_next(now: datetime) -> datetime:
-        """Calculate and set the next time the trigger should fire."""
-        localized_now = dt_util.as_local(now) if local else now
-        return dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
-        )
-
-    time_listener: CALLBACK_TYPE | None = None
-
-    @callback
-    def pattern_time_change_listener(_: datetime) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal time_listener
-
-        now = time_tracker_utcnow()
-        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
-
-        time_listener = async_track_point_in_utc_time(
-            hass,
-            pattern_time_change_listener,
-            calculate_next(now + timedelta(seconds=1)),
-        )
-
-    time_listener = async_track_point_in_utc_time(
-        hass, pattern_time_change_listener, calculate_next(dt_util.utcnow())
+    listener = _TimePatternListener(
+        job,
+        dt_util.parse_time_expression(second, 0, 59),
+        dt_util.parse_time_expression(minute, 0, 59),
+        dt_util.parse_time_expression(hour, 0, 23),
+        local,
     )
+    scheduler = _async_get_time_pattern_scheduler(hass)
+    scheduler.async_add(listener)
 
     @callback
     def unsub_pattern_time_change_listener() -> None:
         """Cancel the time listener."""
-        assert time_listener is not None
-        time_listener()
+        scheduler.async_remove(listener)
 
     return unsub_pattern_time_change_listener
 
@@ -0,0 +1,251 @@
+"""Schedule the polling of entities."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.loader import bind_hass
+
+from .singleton import singleton
+
+if TYPE_CHECKING:
+    from .entity import Entity
+    from .entity_platform import EntityPlatform
+
+DATA_POLLING_SCHEDULER = "polling_scheduler"
+
+# Size of the slots polls are spread over
+SLOT_SECONDS = 1
+# Polls are spread over the last part of the interval, up to this many slots
+SPREAD_FRACTION = 0.5
+MAX_SPREAD_SLOTS = 60
+
+# Entities are polled less often after this many failed polls in a row
+BACKOFF_FAILURES = 3
+MAX_BACKOFF_FACTOR = 8
+
+
+@dataclass
+class PollingStats:
+    """Statistics of the polls of an entity platform."""
+
+    polls: int = 0
+    failures: int = 0
+    overruns: int = 0
+    total_latency: float = 0
+    max_latency: float = 0
+
+    @property
+    def mean_latency(self) -> float:
+        """Return the mean duration of a poll."""
+        return self.total_latency / self.polls if self.polls else 0
+
+
+class _PolledEntity:
+    """Polling state of an entity."""
+
+    __slots__ = ("entity", "timer", "slot", "spread", "task", "failures")
+
+    def __init__(self, entity: Entity) -> None:
+        """Initialize the polling state."""
+        self.entity = entity
+        self.timer: asyncio.TimerHandle | None = None
+        self.slot = 0
+        self.spread = False
+        self.task: asyncio.Task | None = None
+        self.failures = 0
+
+
+@singleton(DATA_POLLING_SCHEDULER)
+@bind_hass
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Get the polling scheduler."""
+    return PollingScheduler(hass)
+
+
+@callback
+@bind_hass
+def async_get_polling_stats(hass: HomeAssistant) -> dict[str, PollingStats]:
+    """Get the polling statistics by domain and platform name."""
+    return async_get_polling_scheduler(hass).stats
+
+
+class PollingScheduler:
+    """Poll the entities of all entity platforms.
+
+    Each entity is polled on its own timer, one scan interval after it was
+    added and then every scan interval. The second poll of an entity is moved
+    to the slot with the fewest polls in the last part of the interval, so
+    entities added together don't keep polling at the same time.
+
+    A poll is skipped while the previous poll of the entity is still running,
+    and entities which keep failing are polled less often.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the polling scheduler."""
+        self.hass = hass
+        self.stats: dict[str, PollingStats] = {}
+        self._platforms: dict[EntityPlatform, dict[str, _PolledEntity]] = {}
+        self._slots: Counter[int] = Counter()
+
+    @callback
+    def async_schedule_platform(self, platform: EntityPlatform) -> CALLBACK_TYPE:
+        """Poll the entities of a platform which are not polled yet.
+
+        Returns a callback to stop polling the platform.
+        """
+        if (polled := self._platforms.get(platform)) is None:
+            polled = self._platforms[platform] = {}
+
+        delay = platform.scan_interval.total_seconds()
+        for entity_id, entity in platform.entities.items():
+            if (polled_entity := polled.get(entity_id)) is not None:
+                if polled_entity.entity is entity:
+                    continue
+                self._async_cancel(polled_entity)
+            polled[entity_id] = polled_entity = _PolledEntity(entity)
+            self._async_schedule(platform, polled_entity, delay)
+
+        @callback
+        def async_stop_polling() -> None:
+            """Stop polling the entities of the platform."""
+            for polled_entity in self._platforms.pop(platform, {}).values():
+                self._async_cancel(polled_entity)
+
+        return async_stop_polling
+
+    @callback
+    def _async_get_stats(self, platform: EntityPlatform) -> PollingStats:
+        """Return the statistics of a platform."""
+        key = f"{platform.domain}.{platform.platform_name}"
+        if (stats := self.stats.get(key)) is None:
+            stats = self.stats[key] = PollingStats()
+        return stats
+
+    @callback
+    def _async_schedule(
+        self,
+        platform: EntityPlatform,
+        polled_entity: _PolledEntity,
+        delay: float,
+        spread: bool = False,
+    ) -> None:
+        """Schedule the next poll of an entity.
+
+        When spread, the poll is moved up to the slot with the fewest polls.
+        """
+        when = self.hass.loop.time() + delay
+        slot = int(when // SLOT_SECONDS)
+
+        if spread and (
+            spread_slots := min(
+                int(delay * SPREAD_FRACTION // SLOT_SECONDS), MAX_SPREAD_SLOTS
+            )
+        ):
+            # Prefer the latest slot with the fewest polls
+            spread_slot = min(
+                range(slot, slot - spread_slots - 1, -1),
+                key=lambda candidate: self._slots[candidate],
+            )
+            when -= (slot - spread_slot) * SLOT_SECONDS
+            slot = spread_slot
+
+        polled_entity.slot = slot
+        self._slots[slot] += 1
+        polled_entity.timer = self.hass.loop.call_at(
+            when, self._async_poll_due, platform, polled_entity
+        )
+
+    @callback
+    def _async_cancel(self, polled_entity: _PolledEntity) -> None:
+        """Cancel the next poll of an entity."""
+        if polled_entity.timer is None:
+            return
+        polled_entity.timer.cancel()
+        polled_entity.timer = None
+        self._async_release_slot(polled_entity.slot)
+
+    @callback
+    def _async_release_slot(self, slot: int) -> None:
+        """Release a slot of a poll which ran or was cancelled."""
+        self._slots[slot] -= 1
+        if not self._slots[slot]:
+            del self._slots[slot]
+
+    @callback
+    def _async_poll_due(
+        self, platform: EntityPlatform, polled_entity: _PolledEntity
+    ) -> None:
+        """Poll an entity when its poll is due."""
+        self._async_release_slot(polled_entity.slot)
+        entity = polled_entity.entity
+        if platform.entities.get(entity.entity_id) is not entity:
+            # The entity was removed
+            polled_entity.timer = None
+            polled = self._platforms.get(platform, {})
+            if polled.get(entity.entity_id) is polled_entity:
+                del polled[entity.entity_id]
+            return
+
+        self._async_schedule(
+            platform,
+            polled_entity,
+            platform.scan_interval.total_seconds(),
+            not polled_entity.spread,
+        )
+        polled_entity.spread = True
+
+        if polled_entity.task is not None:
+            self._async_get_stats(platform).overruns += 1
+            platform.logger.warning(
+                "Updating %s took longer than the scheduled update interval %s",
+                entity.entity_id,
+                platform.scan_interval,
+            )
+            return
+
+        if entity.should_poll:
+            polled_entity.task = self.hass.async_create_task(
+                self._async_poll(platform, polled_entity)
+            )
+
+    async def _async_poll(
+        self, platform: EntityPlatform, polled_entity: _PolledEntity
+    ) -> None:
+        """Update an entity and write its state."""
+        entity = polled_entity.entity
+        stats = self._async_get_stats(platform)
+        start = self.hass.loop.time()
+        try:
+            await entity.async_device_update()
+        except Exception:  # pylint: disable=broad-except
+            platform.logger.exception("Update for %s fails", entity.entity_id)
+            stats.failures += 1
+            polled_entity.failures += 1
+        else:
+            polled_entity.failures = 0
+            if platform.entities.get(entity.entity_id) is entity:
+                entity.async_write_ha_state()
+        finally:
+            polled_entity.task = None
+
+        latency = self.hass.loop.time() - start
+        stats.polls += 1
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+
+        if polled_entity.failures >= BACKOFF_FAILURES and polled_entity.timer:
+            factor = min(
+                2 ** (polled_entity.failures - BACKOFF_FAILURES + 1),
+                MAX_BACKOFF_FACTOR,
+            )
+            self._async_cancel(polled_entity)
+            self._async_schedule(
+                platform,
+                polled_entity,
+                platform.scan_interval.total_seconds() * factor - latency,
+            )
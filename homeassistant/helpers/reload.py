@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Iterable
+import json
 import logging
 from typing import Any
 
@@ -12,6 +13,7 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform
 from homeassistant.helpers.entity_platform import EntityPlatform, async_get_platforms
+from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
@@ -21,6 +23,18 @@ from homeassistant.setup import async_setup_component
 _LOGGER = logging.getLogger(__name__)
 
 
+def config_fingerprint(*configs: Any) -> str | None:
+    """Return a fingerprint of configuration to tell if it changed on reload.
+
+    Returns None if no fingerprint can be made, which should be handled like
+    changed configuration.
+    """
+    try:
+        return json.dumps(configs, sort_keys=True, cls=ExtendedJSONEncoder)
+    except (TypeError, ValueError):
+        return None
+
+
 async def async_reload_integration_platforms(
     hass: HomeAssistant, integration_name: str, integration_platforms: Iterable[str]
 ) -> None:
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import suppress
 from datetime import datetime, timedelta
 import logging
+import os
 from typing import Any, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
@@ -12,7 +14,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry, start
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes, json_loads
 from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.storage import Store
 import homeassistant.util.dt as dt_util
@@ -23,10 +25,15 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
+STORAGE_JOURNAL_SUFFIX = ".journal"
 
-# How long between periodically saving the current states to disk
+# How long between periodically saving the changed states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between compacting the journal into a full dump of the states.
+# This keeps last_seen of the unchanged states well within STATE_EXPIRATION.
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -43,6 +50,21 @@ class StoredState:
         """Return a dict representation of the stored state."""
         return {"state": self.state.as_dict(), "last_seen": self.last_seen}
 
+    def as_json(self) -> bytes:
+        """Return the JSON of the stored state reusing the cached state JSON."""
+        try:
+            state_json = self.state.as_dict_json()
+        except ValueError:
+            # The cached JSON rejects NaN, which is fine to restore
+            return json_bytes(self.as_dict())
+        return (
+            b'{"state":'
+            + state_json
+            + b',"last_seen":'
+            + json_bytes(self.last_seen)
+            + b"}"
+        )
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> StoredState:
         """Initialize a stored state from a dict."""
@@ -78,7 +100,17 @@ class RestoreStateData:
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
-            _LOGGER.debug("Created cache with %s", list(data.last_states))
+
+        try:
+            journal = await hass.async_add_executor_job(
+                _load_journal, data.journal_path
+            )
+        except OSError as exc:
+            _LOGGER.error("Error loading last states journal", exc_info=exc)
+        else:
+            data.async_replay_journal(journal)
+
+        _LOGGER.debug("Created cache with %s", list(data.last_states))
 
         async def hass_start(hass: HomeAssistant) -> None:
             """Start the restore state task."""
@@ -102,6 +134,36 @@ class RestoreStateData:
         )
         self.last_states: dict[str, StoredState] = {}
         self.entity_ids: set[str] = set()
+        self.journal_path = f"{self.store.path}{STORAGE_JOURNAL_SUFFIX}"
+        # The states on disk, None until the first compaction of this run
+        self._dumped_states: dict[str, State] | None = None
+        self._journal_entries = 0
+        self._last_compact: datetime | None = None
+
+    @callback
+    def async_replay_journal(self, journal: list[dict[str, Any]]) -> None:
+        """Apply the journal entries written after the last compaction.
+
+        Entries older than the state in the store were written before
+        the store was compacted and are skipped.
+        """
+        for item in journal:
+            last_seen = dt_util.parse_datetime(item["last_seen"])
+            if last_seen is None:
+                continue
+            if "state" in item:
+                entity_id = item["state"]["entity_id"]
+            else:
+                entity_id = item["entity_id"]
+            if not valid_entity_id(entity_id):
+                continue
+            stored_state = self.last_states.get(entity_id)
+            if stored_state is not None and stored_state.last_seen > last_seen:
+                continue
+            if "state" in item:
+                self.last_states[entity_id] = StoredState.from_dict(item)
+            else:
+                self.last_states.pop(entity_id, None)
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -146,18 +208,68 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the states that changed since the last dump are appended to the
+        journal. The first dump of a run, and later dumps once the journal
+        has grown larger than the states or STATE_COMPACT_INTERVAL has
+        passed, rewrite the store and drop the journal.
+        """
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
+        now = dt_util.utcnow()
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
-        except HomeAssistantError as exc:
+            if (
+                self._last_compact is None
+                or self._journal_entries > len(stored_states)
+                or now - self._last_compact >= STATE_COMPACT_INTERVAL
+            ):
+                await self._async_compact(stored_states, now)
+            else:
+                await self._async_append_journal(stored_states, now)
+        except (HomeAssistantError, OSError, TypeError, ValueError) as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
+    async def _async_compact(
+        self, stored_states: list[StoredState], now: datetime
+    ) -> None:
+        """Write all states to the store and remove the journal."""
+        await self.store.async_save(
+            [stored_state.as_dict() for stored_state in stored_states]
+        )
+        self._dumped_states = {
+            stored_state.state.entity_id: stored_state.state
+            for stored_state in stored_states
+        }
+        self._journal_entries = 0
+        self._last_compact = now
+        await self.hass.async_add_executor_job(_remove_journal, self.journal_path)
+
+    async def _async_append_journal(
+        self, stored_states: list[StoredState], now: datetime
+    ) -> None:
+        """Append the states that changed since the last dump to the journal."""
+        assert self._dumped_states is not None
+        dumped_states = self._dumped_states
+        current_states: dict[str, State] = {}
+        entries: list[bytes] = []
+
+        for stored_state in stored_states:
+            state = stored_state.state
+            current_states[state.entity_id] = state
+            if dumped_states.get(state.entity_id) is not state:
+                entries.append(stored_state.as_json())
+
+        for entity_id in dumped_states.keys() - current_states.keys():
+            entries.append(json_bytes({"entity_id": entity_id, "last_seen": now}))
+
+        if entries:
+            await self.hass.async_add_executor_job(
+                _append_journal, self.journal_path, entries
+            )
+        self._dumped_states = current_states
+        self._journal_entries += len(entries)
+
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
@@ -206,6 +318,35 @@ class RestoreStateData:
         self.entity_ids.remove(entity_id)
 
 
+def _load_journal(path: str) -> list[dict[str, Any]]:
+    """Load the journal entries, skipping a partially written last line."""
+    if not os.path.isfile(path):
+        return []
+    entries = []
+    with open(path, "rb") as journal:
+        for line in journal:
+            try:
+                entries.append(json_loads(line))
+            except ValueError:
+                _LOGGER.warning("Skipping invalid restore state journal entry")
+    return entries
+
+
+def _append_journal(path: str, entries: list[bytes]) -> None:
+    """Append entries to the journal."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "ab") as journal:
+        journal.write(b"".join(entry + b"\n" for entry in entries))
+        journal.flush()
+        os.fsync(journal.fileno())
+
+
+def _remove_journal(path: str) -> None:
+    """Remove the journal after the store has been compacted."""
+    with suppress(FileNotFoundError):
+        os.unlink(path)
+
+
 def _encode(value: Any) -> Any:
     """Little helper to JSON encode a value."""
     try:
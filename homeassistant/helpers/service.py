@@ -355,26 +355,33 @@ async def async_extract_referenced_entity_ids(
 
     # Find devices for this area
     selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+    for area_id in selector.area_ids:
+        selected.referenced_devices.update(
+            device_entry.id
+            for device_entry in device_registry.async_entries_for_area(dev_reg, area_id)
+        )
 
     if not selector.area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
-        if (
-            # when area matches the target area
-            ent_entry.area_id in selector.area_ids
-            # when device matches a referenced devices with no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # when device matches target device
-            or ent_entry.device_id in selector.device_ids
+    # Entities where area matches the target area
+    for area_id in selector.area_ids:
+        selected.indirectly_referenced.update(
+            ent_entry.entity_id
+            for ent_entry in entity_registry.async_entries_for_area(ent_reg, area_id)
+        )
+
+    for device_id in selected.referenced_devices:
+        for ent_entry in entity_registry.async_entries_for_device(
+            ent_reg, device_id, include_disabled_entities=True
         ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+            if (
+                # when device matches a referenced devices with no explicitly set area
+                not ent_entry.area_id
+                # when device matches target device
+                or device_id in selector.device_ids
+            ):
+                selected.indirectly_referenced.add(ent_entry.entity_id)
 
     return selected
 
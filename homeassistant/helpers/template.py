@@ -4,6 +4,7 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import OrderedDict
 import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager, suppress
@@ -17,9 +18,10 @@ from operator import attrgetter
 import random
 import re
 import sys
-from typing import Any, cast
+import threading
+from types import CodeType
+from typing import Any, NamedTuple, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import pass_context
@@ -66,6 +68,9 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 
+# Number of compiled templates kept by the compiled code cache
+COMPILED_CACHE_SIZE = 4096
+
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -1656,7 +1661,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        # The compiled code only depends on the filters and tests of the
+        # environment, which are the same for all environments of a kind
+        self.kind = (hass is not None, bool(limited), bool(strict))
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1823,12 +1830,80 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
-
-        if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+        key = (self.kind, source)
+        if (cached := _COMPILED_CACHE.get(key)) is None:
+            cached = super().compile(source)
+            _COMPILED_CACHE.set(key, cached)
 
         return cached
 
 
+class CompiledCacheInfo(NamedTuple):
+    """Statistics of the compiled code cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _CompiledCache:
+    """Cache the compiled code of templates for all template environments.
+
+    Identical template strings are compiled once for each kind of environment,
+    the least recently used code is dropped when the cache is full.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._codes: OrderedDict[
+            tuple[tuple[bool, bool, bool], str], CodeType
+        ] = OrderedDict()
+        # Templates are also compiled in the executor
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[tuple[bool, bool, bool], str]) -> CodeType | None:
+        """Return the compiled code of a template."""
+        with self._lock:
+            if (code := self._codes.get(key)) is None:
+                self.misses += 1
+                return None
+            self._codes.move_to_end(key)
+            self.hits += 1
+            return code
+
+    def set(self, key: tuple[tuple[bool, bool, bool], str], code: CodeType) -> None:
+        """Store the compiled code of a template."""
+        with self._lock:
+            self._codes[key] = code
+            self._codes.move_to_end(key)
+            if len(self._codes) > self.maxsize:
+                self._codes.popitem(last=False)
+
+    def info(self) -> CompiledCacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CompiledCacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._codes)
+            )
+
+    def clear(self) -> None:
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._codes.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_COMPILED_CACHE = _CompiledCache(COMPILED_CACHE_SIZE)
+
+
+def compiled_cache_info() -> CompiledCacheInfo:
+    """Return the hits, misses and size of the compiled code cache."""
+    return _COMPILED_CACHE.info()
+
+
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
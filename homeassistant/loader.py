@@ -7,9 +7,11 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from contextlib import suppress
 import functools as ft
 import importlib
+import importlib.util
 import json
 import logging
 import pathlib
@@ -45,6 +47,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -58,6 +61,9 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_INDEX_VERSION = 1
+MANIFEST_INDEX_PATH = pathlib.Path(__file__).parent / "generated" / "manifests.json"
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -164,6 +170,45 @@ async def async_get_custom_components(
     return cast(Dict[str, "Integration"], reg_or_evt)
 
 
+def _load_manifest_index() -> dict[str, Manifest]:
+    """Load the index of built-in manifests generated by hassfest.
+
+    An empty index is returned if the file is missing or has another version.
+    The manifests are then read from the integrations instead.
+    """
+    try:
+        index = json.loads(MANIFEST_INDEX_PATH.read_text())
+    except (OSError, ValueError) as err:
+        _LOGGER.debug("Unable to load manifest index %s: %s", MANIFEST_INDEX_PATH, err)
+        return {}
+
+    if index.get("version") != MANIFEST_INDEX_VERSION:
+        _LOGGER.debug("Ignoring manifest index with version %s", index.get("version"))
+        return {}
+
+    return cast(Dict[str, Manifest], index["manifests"])
+
+
+async def async_get_manifest_index(hass: HomeAssistant) -> dict[str, Manifest]:
+    """Return cached index of built-in manifests."""
+    index_or_evt = hass.data.get(DATA_MANIFEST_INDEX)
+
+    if index_or_evt is None:
+        evt = hass.data[DATA_MANIFEST_INDEX] = asyncio.Event()
+
+        index = await hass.async_add_executor_job(_load_manifest_index)
+
+        hass.data[DATA_MANIFEST_INDEX] = index
+        evt.set()
+        return index
+
+    if isinstance(index_or_evt, asyncio.Event):
+        await index_or_evt.wait()
+        return cast(Dict[str, Manifest], hass.data.get(DATA_MANIFEST_INDEX))
+
+    return cast(Dict[str, Manifest], index_or_evt)
+
+
 async def async_get_config_flows(hass: HomeAssistant) -> set[str]:
     """Return cached list of config flows."""
     # pylint: disable=import-outside-toplevel
@@ -536,6 +581,19 @@ class Integration:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
 
+    def import_modules(self, platform_names: Iterable[str]) -> None:
+        """Import the component and the platforms it provides.
+
+        This runs in the executor. The modules are left in sys.modules so
+        get_component and get_platform find them without importing from
+        the event loop.
+        """
+        importlib.import_module(self.pkg_path)
+        for platform_name in platform_names:
+            full_name = f"{self.pkg_path}.{platform_name}"
+            if importlib.util.find_spec(full_name) is not None:
+                importlib.import_module(full_name)
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -587,6 +645,16 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
+    # Built-in integrations are served from the manifest index, which saves
+    # reading the manifest of every integration separately.
+    if manifest := (await async_get_manifest_index(hass)).get(domain):
+        return Integration(
+            hass,
+            f"{components.__name__}.{domain}",
+            pathlib.Path(components.__file__).parent / domain,
+            cast(Manifest, dict(manifest)),
+        )
+
     if integration := await hass.async_add_executor_job(
         Integration.resolve_from_root, hass, components, domain
     ):
@@ -9,14 +9,17 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+import random
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
 from typing import TypeVar
 
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSON_BACKEND, JSONEncoder, json_bytes, json_dumps
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -119,6 +122,61 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_listener_count(hass):
+    """Fire 10k events with 1, 100 and 10k filtered and keyed listeners."""
+    event_name = "benchmark_event"
+    events_to_fire = 10 ** 4
+    event_data = {"entity_id": "light.kitchen_0"}
+    runtime = 0
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+
+    for listener_count in (1, 100, 10000):
+        entity_ids = [f"light.kitchen_{idx}" for idx in range(listener_count)]
+
+        unsubs = []
+        for entity_id in entity_ids:
+
+            @core.callback
+            def event_filter(event, entity_id=entity_id):
+                """Filter event."""
+                return event.data.get("entity_id") == entity_id
+
+            unsubs.append(
+                hass.bus.async_listen(event_name, listener, event_filter=event_filter)
+            )
+
+        start = timer()
+        for _ in range(events_to_fire):
+            hass.bus.async_fire(event_name, event_data)
+        await hass.async_block_till_done()
+        filtered = timer() - start
+
+        for unsub in unsubs:
+            unsub()
+        unsubs = [
+            hass.bus.async_listen_keyed(event_name, listener, "entity_id", [entity_id])
+            for entity_id in entity_ids
+        ]
+
+        start = timer()
+        for _ in range(events_to_fire):
+            hass.bus.async_fire(event_name, event_data)
+        await hass.async_block_till_done()
+        keyed = timer() - start
+
+        for unsub in unsubs:
+            unsub()
+
+        print(f"{listener_count} listeners: filter {filtered:.4f}s, keyed {keyed:.4f}s")
+        runtime += keyed
+
+    return runtime
+
+
 @benchmark
 async def time_changed_helper(hass):
     """Run a million events through time changed helper."""
@@ -391,6 +449,244 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_backends(hass):
+    """Serialize 10k realistic states with the stdlib and the facade backend."""
+    now = dt_util.utcnow()
+    states = [
+        core.State(
+            f"sensor.sensor_{idx}",
+            str(idx * 0.5),
+            {
+                "friendly_name": f"Sensor {idx}",
+                "unit_of_measurement": "°C",
+                "device_class": "temperature",
+                "state_class": "measurement",
+                "last_reset": now,
+                "supported_features": 0,
+            },
+            now,
+            now,
+        )
+        for idx in range(10 ** 4)
+    ]
+
+    start = timer()
+    for state in states:
+        json.dumps(state, cls=JSONEncoder, allow_nan=False)
+    stdlib = timer() - start
+
+    start = timer()
+    for state in states:
+        json_dumps(state)
+    facade = timer() - start
+
+    print(f"json: {stdlib:.4f}s, {JSON_BACKEND}: {facade:.4f}s")
+    return facade
+
+
+@benchmark
+async def state_json_cache(hass):
+    """Serialize 10k states for 10 consumers with and without the JSON cache."""
+    consumers = 10
+    now = dt_util.utcnow()
+    states = [
+        core.State(
+            f"sensor.sensor_{idx}",
+            str(idx * 0.5),
+            {
+                "friendly_name": f"Sensor {idx}",
+                "unit_of_measurement": "°C",
+                "device_class": "temperature",
+                "state_class": "measurement",
+            },
+            now,
+            now,
+        )
+        for idx in range(10 ** 4)
+    ]
+
+    start = timer()
+    for _ in range(consumers):
+        for state in states:
+            json_bytes(state.as_dict())
+    uncached = timer() - start
+
+    tracemalloc.start()
+    start = timer()
+    for _ in range(consumers):
+        for state in states:
+            state.as_dict_json()
+    cached = timer() - start
+    cache_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"uncached: {uncached:.4f}s, cached: {cached:.4f}s, "
+        f"cache memory: {cache_size / 1024:.0f} KiB"
+    )
+    return cached
+
+
+@benchmark
+async def mqtt_topic_routing(hass):
+    """Route a Zigbee2MQTT like message stream to 2k subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.trie import TopicTrie
+
+    devices = [f"0x{idx:016x}" for idx in range(500)]
+    topic_filters = ["homeassistant/+/+/config", "zigbee2mqtt/bridge/#"]
+    for device in devices:
+        topic_filters.extend(
+            (
+                f"zigbee2mqtt/{device}",
+                f"zigbee2mqtt/{device}/availability",
+                f"zigbee2mqtt/{device}/+/state",
+                f"homeassistant/sensor/{device}/#",
+            )
+        )
+
+    # Replay the same pseudo random stream of state, availability and
+    # bridge messages on every run.
+    rnd = random.Random(1)
+    messages = []
+    for _ in range(10 ** 5):
+        device = rnd.choice(devices)
+        messages.append(
+            rnd.choice(
+                (
+                    f"zigbee2mqtt/{device}",
+                    f"zigbee2mqtt/{device}",
+                    f"zigbee2mqtt/{device}",
+                    f"zigbee2mqtt/{device}/availability",
+                    f"zigbee2mqtt/{device}/l1/state",
+                    "zigbee2mqtt/bridge/logging",
+                )
+            )
+        )
+
+    trie = TopicTrie()
+    # One trie per subscription like matching each subscription in turn
+    matchers = []
+    for topic_filter in topic_filters:
+        trie.add(topic_filter, topic_filter)
+        matcher = TopicTrie()
+        matcher.add(topic_filter, topic_filter)
+        matchers.append(matcher)
+
+    start = timer()
+    for topic in messages[:1000]:
+        [matcher for matcher in matchers if matcher.matches(topic)]
+    scan = (timer() - start) * len(messages) / 1000
+
+    start = timer()
+    for topic in messages:
+        trie.matches(topic)
+    routed = timer() - start
+
+    print(
+        f"{len(topic_filters)} subscriptions, {len(messages)} messages: "
+        f"scan {scan:.4f}s (extrapolated), trie {routed:.4f}s"
+    )
+    return routed
+
+
+@benchmark
+async def filter_states_by_domain(hass):
+    """Look up one domain a thousand times with 1k, 10k and 50k states."""
+    domains = ["light", "switch", "sensor", "binary_sensor", "media_player"]
+    lookups = 1000
+    runtime = 0
+
+    for size in (1000, 10000, 50000):
+        for idx in range(size):
+            hass.states.async_set(f"{domains[idx % len(domains)]}.entity_{idx}", "on")
+
+        start = timer()
+        for _ in range(lookups):
+            hass.states.async_all("light")
+        indexed = timer() - start
+
+        start = timer()
+        for _ in range(lookups):
+            [state for state in hass.states.async_all() if state.domain == "light"]
+        scanned = timer() - start
+
+        print(f"{size} states: index {indexed:.4f}s, full scan {scanned:.4f}s")
+        runtime += indexed
+
+    return runtime
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Record 50k state changes to SQLite with ORM and bulk inserts."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    events_to_record = 5 * 10 ** 4
+    runtime = 0
+
+    for bulk_insert in (False, True):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            instance = recorder.Recorder(
+                hass,
+                auto_purge=False,
+                keep_days=1,
+                commit_interval=1,
+                uri=f"sqlite:///{tmpdir}/benchmark.db",
+                db_max_retries=1,
+                db_retry_wait=1,
+                entity_filter=lambda entity_id: True,
+                exclude_t=[],
+                bulk_insert=bulk_insert,
+            )
+            elapsed = await hass.async_add_executor_job(
+                _record_state_changes, instance, events_to_record
+            )
+
+        mode = "bulk" if bulk_insert else "orm"
+        print(f"{mode}: {events_to_record / elapsed:.0f} events/s")
+        runtime += elapsed
+
+    return runtime
+
+
+def _record_state_changes(instance, events_to_record):
+    """Feed state changes through the recorder write path and time it."""
+    # pylint: disable=protected-access
+    events_per_commit = 500
+    time_changed = core.Event(EVENT_TIME_CHANGED)
+
+    instance._setup_connection()
+    instance._setup_run()
+
+    old_states = {}
+    start = timer()
+    for idx in range(events_to_record):
+        entity_id = f"sensor.benchmark_{idx % 1000}"
+        new_state = core.State(entity_id, str(idx), {"unit": "W"})
+        instance._process_one_event(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_states.get(entity_id),
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_states[entity_id] = new_state
+        if idx % events_per_commit == 0:
+            instance._process_one_event(time_changed)
+    instance._process_one_event(time_changed)
+    elapsed = timer() - start
+
+    instance._end_session()
+    instance._close_connection()
+    return elapsed
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
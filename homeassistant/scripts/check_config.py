@@ -12,7 +12,7 @@ from typing import Any
 from unittest.mock import patch
 
 from homeassistant import core
-from homeassistant.config import get_default_config_dir
+from homeassistant.config import DATA_YAML_CACHE, get_default_config_dir
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import area_registry, device_registry, entity_registry
 from homeassistant.helpers.check_config import async_check_ha_config_file
@@ -230,6 +230,8 @@ async def async_check_config(config_dir):
     """Check the HA config."""
     hass = core.HomeAssistant()
     hass.config.config_dir = config_dir
+    # Parse every file to report the files and secrets loaded
+    hass.data[DATA_YAML_CACHE] = None
     await area_registry.async_load(hass)
     await device_registry.async_load(hass)
     await entity_registry.async_load(hass)
@@ -3,17 +3,25 @@ from __future__ import annotations
 
 from collections import deque
 from collections.abc import Callable
+from datetime import datetime
 import json
 import logging
+import math
 import os
 import tempfile
-from typing import Any
+from typing import Any, Final
 
-from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
+JSON_BACKEND: Final = "orjson" if orjson is not None else "json"
+
 
 class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
@@ -23,6 +31,83 @@ class WriteError(HomeAssistantError):
     """Error writing the data."""
 
 
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects.
+
+    Raise TypeError for other objects like json.JSONEncoder.default.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """Return True if obj holds a NaN or infinite float."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple, set)):
+        return any(_has_non_finite_float(value) for value in obj)
+    if hasattr(obj, "as_dict"):
+        return _has_non_finite_float(obj.as_dict())
+    return False
+
+
+if orjson is not None:
+
+    def json_bytes(data: Any, *, allow_nan: bool = True) -> bytes:
+        """Dump json bytes, supporting Home Assistant objects.
+
+        NaN and infinite floats are written as null, unless allow_nan is
+        False and they raise ValueError like the json module.
+        """
+        result: bytes = orjson.dumps(
+            data, option=orjson.OPT_NON_STR_KEYS, default=json_encoder_default
+        )
+        # Only look for the floats if they may have been written
+        if not allow_nan and b"null" in result and _has_non_finite_float(data):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return result
+
+    def json_dumps(data: Any, *, allow_nan: bool = True) -> str:
+        """Dump a compact json string, supporting Home Assistant objects."""
+        return json_bytes(data, allow_nan=allow_nan).decode("utf-8")
+
+    def json_loads(data: bytes | str) -> Any:
+        """Load json.
+
+        Fall back to the json module for the NaN and Infinity it writes,
+        which orjson rejects.
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+
+else:
+
+    def json_dumps(data: Any, *, allow_nan: bool = True) -> str:
+        """Dump a compact json string, supporting Home Assistant objects."""
+        return json.dumps(
+            data,
+            default=json_encoder_default,
+            allow_nan=allow_nan,
+            separators=(",", ":"),
+        )
+
+    def json_bytes(data: Any, *, allow_nan: bool = True) -> bytes:
+        """Dump json bytes, supporting Home Assistant objects."""
+        return json_dumps(data, allow_nan=allow_nan).encode("utf-8")
+
+    json_loads = json.loads
+
+
 def load_json(filename: str, default: list | dict | None = None) -> list | dict:
     """Load JSON data from a file and return as dict or list.
 
@@ -30,7 +115,7 @@ def load_json(filename: str, default: list | dict | None = None) -> list | dict:
     """
     try:
         with open(filename, encoding="utf-8") as fdesc:
-            return json.loads(fdesc.read())  # type: ignore
+            return json_loads(fdesc.read())  # type: ignore
     except FileNotFoundError:
         # This is not a fatal error
         _LOGGER.debug("JSON file not found: %s", filename)
@@ -101,6 +186,10 @@ def find_paths_unserializable_data(
 
     This method is slow! Only use for error handling.
     """
+    # homeassistant.core encodes states with this module
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.core import Event, State
+
     to_process = deque([(bad_data, "$")])
     invalid = {}
 
@@ -1,4 +1,5 @@
 """YAML utility functions."""
+from .cache import YamlCache
 from .const import SECRET_YAML
 from .dumper import dump, save_yaml
 from .input import UndefinedSubstitution, extract_inputs, substitute
@@ -13,6 +14,7 @@ __all__ = [
     "Secrets",
     "load_yaml",
     "secret_yaml",
+    "YamlCache",
     "parse_yaml",
     "UndefinedSubstitution",
     "extract_inputs",
@@ -0,0 +1,369 @@
+"""Cache of parsed YAML files."""
+from __future__ import annotations
+
+import base64
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any
+
+import yaml
+
+from . import loader as yaml_loader
+from .loader import JSON_TYPE, FastSafeLoader, SafeLineLoader, Secrets
+from .objects import Input, NodeListClass, NodeStrClass
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+
+# Files modified this recently are not cached, as another change within the
+# resolution of the modification time might keep the same size.
+RECENTLY_MODIFIED_NS = 2_000_000_000
+
+# Tags which depend on other files or the environment. They are stored
+# unresolved in the cache and resolved each time the file is loaded.
+DEFERRED_TAGS = (
+    "!env_var",
+    "!include",
+    "!include_dir_list",
+    "!include_dir_merge_list",
+    "!include_dir_named",
+    "!include_dir_merge_named",
+    "!secret",
+)
+
+
+@dataclass(frozen=True)
+class _DeferredTag:
+    """Tag of a cached YAML file that is resolved when loading it."""
+
+    tag: str
+    value: str
+    line: int
+    column: int
+
+
+def _defer_tag(loader: SafeLineLoader, node: yaml.nodes.Node) -> _DeferredTag:
+    """Keep a tag to resolve it when the file is loaded."""
+    return _DeferredTag(
+        node.tag, node.value, node.start_mark.line, node.start_mark.column
+    )
+
+
+def _encode(obj: Any, fname: str) -> Any:
+    """Encode a parsed YAML object of fname to JSON.
+
+    Objects which are not JSON types are wrapped in an object with their
+    type as the only key, and the line of the node if it has one. Raise
+    TypeError for objects which can't be cached.
+    """
+    if obj is None or type(obj) in (bool, int, float, str):
+        return obj
+    encoded: dict[str, Any]
+    if isinstance(obj, dict):
+        encoded = {
+            "map": [[_encode(k, fname), _encode(v, fname)] for k, v in obj.items()]
+        }
+    elif isinstance(obj, list):
+        encoded = {"seq": [_encode(item, fname) for item in obj]}
+    elif isinstance(obj, tuple):
+        encoded = {"tuple": [_encode(item, fname) for item in obj]}
+    elif isinstance(obj, set):
+        encoded = {"set": [_encode(item, fname) for item in obj]}
+    elif isinstance(obj, NodeStrClass):
+        encoded = {"str": str(obj)}
+    elif isinstance(obj, datetime):
+        encoded = {"datetime": obj.isoformat()}
+    elif isinstance(obj, date):
+        encoded = {"date": obj.isoformat()}
+    elif isinstance(obj, bytes):
+        encoded = {"bytes": base64.b64encode(obj).decode("ascii")}
+    elif isinstance(obj, Input):
+        encoded = {"input": obj.name}
+    elif isinstance(obj, _DeferredTag):
+        encoded = {"deferred": [obj.tag, obj.value, obj.line, obj.column]}
+    else:
+        raise TypeError(f"Can't cache {type(obj).__name__}")
+
+    if (line := getattr(obj, "__line__", None)) is not None:
+        # The file of the nodes is the cached file
+        if getattr(obj, "__config_file__", None) != fname:
+            raise TypeError(f"Can't cache node of {obj.__config_file__}")
+        encoded["line"] = line
+    return encoded
+
+
+def _decode(obj: Any, fname: str) -> Any:
+    """Decode a parsed YAML object of fname from JSON.
+
+    Raise ValueError, or TypeError for unhashable keys, if it is not the JSON
+    written by _encode.
+    """
+    if obj is None or type(obj) in (bool, int, float, str):
+        return obj
+    if type(obj) is not dict or not 1 <= len(obj) <= 2:
+        raise ValueError(f"Invalid cached object {obj!r}")
+    line = obj.get("line")
+    if line is not None and type(line) is not int:
+        raise ValueError(f"Invalid cached line {line!r}")
+    kinds = [kind for kind in obj if kind != "line"]
+    if len(kinds) != 1:
+        raise ValueError(f"Invalid cached object {obj!r}")
+    kind = kinds[0]
+    value = obj[kind]
+    if line is not None and kind not in ("map", "seq", "str"):
+        raise ValueError(f"Invalid cached {kind} with a line")
+
+    decoded: Any
+    if kind in ("seq", "tuple", "set", "map"):
+        if type(value) is not list:
+            raise ValueError(f"Invalid cached {kind} {value!r}")
+        if kind == "map":
+            if not all(type(item) is list and len(item) == 2 for item in value):
+                raise ValueError(f"Invalid cached map {value!r}")
+            decoded = OrderedDict(
+                (_decode(key, fname), _decode(item, fname)) for key, item in value
+            )
+        else:
+            items = [_decode(item, fname) for item in value]
+            if kind == "seq":
+                decoded = NodeListClass(items) if line is not None else items
+            elif kind == "tuple":
+                decoded = tuple(items)
+            else:
+                decoded = set(items)
+    elif kind == "deferred":
+        if (
+            type(value) is not list
+            or [type(item) for item in value] != [str, str, int, int]
+            or value[0] not in DEFERRED_TAGS
+        ):
+            raise ValueError(f"Invalid cached tag {value!r}")
+        decoded = _DeferredTag(*value)
+    else:
+        if type(value) is not str:
+            raise ValueError(f"Invalid cached {kind} {value!r}")
+        if kind == "str":
+            decoded = NodeStrClass(value)
+        elif kind == "datetime":
+            decoded = datetime.fromisoformat(value)
+        elif kind == "date":
+            decoded = date.fromisoformat(value)
+        elif kind == "bytes":
+            decoded = base64.b64decode(value, validate=True)
+        elif kind == "input":
+            decoded = Input(value)
+        else:
+            raise ValueError(f"Invalid cached object {obj!r}")
+
+    if line is not None:
+        setattr(decoded, "__config_file__", fname)
+        setattr(decoded, "__line__", line)
+    return decoded
+
+
+class _CachingLoader(FastSafeLoader):  # type: ignore[misc,valid-type]
+    """Loader class which keeps the deferred tags unresolved."""
+
+
+for _tag in DEFERRED_TAGS:
+    _CachingLoader.add_constructor(_tag, _defer_tag)
+
+
+class _ReplayLoader:
+    """Resolve the deferred tags of a cached file.
+
+    The tags are resolved by the constructors of SafeLineLoader, which get
+    this object in place of the loader.
+    """
+
+    def __init__(self, cache: YamlCache, name: str, secrets: Secrets | None) -> None:
+        """Initialize the loader."""
+        self.cache = cache
+        self.name = name
+        self.secrets = secrets
+        self.resolved = 0
+
+    def load_include(self, fname: str) -> JSON_TYPE:
+        """Load a YAML file included by the file being loaded."""
+        return self.cache.load_include(fname, self.secrets)
+
+    def construct(self, deferred: _DeferredTag) -> Any:
+        """Resolve a deferred tag."""
+        self.resolved += 1
+        node = yaml.ScalarNode(
+            deferred.tag,
+            deferred.value,
+            start_mark=yaml.Mark(
+                self.name, 0, deferred.line, deferred.column, None, None
+            ),
+        )
+        return SafeLineLoader.yaml_constructors[deferred.tag](self, node)
+
+    def resolve(self, obj: Any) -> Any:
+        """Resolve the deferred tags in a loaded object."""
+        if isinstance(obj, _DeferredTag):
+            return self.construct(obj)
+        if isinstance(obj, dict):
+            deferred_keys = False
+            for key, value in obj.items():
+                deferred_keys = deferred_keys or isinstance(key, _DeferredTag)
+                if (resolved := self.resolve(value)) is not value:
+                    obj[key] = resolved
+            if deferred_keys:
+                items = [(self.resolve(key), value) for key, value in obj.items()]
+                obj.clear()
+                obj.update(items)
+        elif isinstance(obj, list):
+            for index, item in enumerate(obj):
+                if (resolved := self.resolve(item)) is not item:
+                    obj[index] = resolved
+        return obj
+
+
+class YamlCache:
+    """Cache the parsed content of YAML files in a file.
+
+    Files are cached by path, modification time and size. The unresolved
+    !include, !secret and !env_var tags are stored, so a file is only parsed
+    again when it changed itself, while secrets and the environment are
+    looked up on every load like without the cache.
+
+    The cache is stored as JSON holding only the types the YAML loader
+    creates, an entry which doesn't decode to them is parsed again.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._files: dict[str, tuple[int, int, bool, Any]] | None = None
+        self._used: set[str] = set()
+        self._dirty = False
+
+    def load_yaml(self, fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
+        """Load a YAML file and the files it includes.
+
+        This method needs to run in an executor.
+        """
+        with self._lock:
+            if self._files is None:
+                self._files = self._load_cache()
+            self._used = set()
+            try:
+                return self.load_include(fname, secrets)
+            finally:
+                if self._dirty or self._used != self._files.keys():
+                    self._save_cache()
+
+    def load_include(self, fname: str, secrets: Secrets | None) -> JSON_TYPE:
+        """Load a YAML file from the cache or parse it."""
+        assert self._files is not None
+        try:
+            stat = os.stat(fname)
+        except OSError:
+            # Let the loader raise the error
+            return yaml_loader.load_yaml(fname, secrets)
+
+        self._used.add(fname)
+        entry = self._files.get(fname)
+        if (
+            entry is not None
+            and entry[0] == stat.st_mtime_ns
+            and entry[1] == stat.st_size
+        ):
+            try:
+                data = _decode(entry[3], fname)
+            except (RecursionError, TypeError, ValueError) as err:
+                _LOGGER.debug("Invalid cache of %s: %s", fname, err)
+            else:
+                if entry[2]:
+                    data = _ReplayLoader(self, fname, secrets).resolve(data)
+                return data  # type: ignore[no-any-return]
+
+        _LOGGER.debug("Parsing %s", fname)
+        # pylint: disable-next=protected-access
+        data = yaml_loader._load_yaml(_CachingLoader, fname)
+        try:
+            encoded = _encode(data, fname)
+        except TypeError as err:
+            _LOGGER.debug("Not caching %s: %s", fname, err)
+            encoded = None
+        replay = _ReplayLoader(self, fname, secrets)
+        data = replay.resolve(data)
+        if encoded is None or time.time_ns() - stat.st_mtime_ns < RECENTLY_MODIFIED_NS:
+            self._files.pop(fname, None)
+        else:
+            self._files[fname] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                replay.resolved > 0,
+                encoded,
+            )
+        self._dirty = True
+        return data
+
+    def _load_cache(self) -> dict[str, tuple[int, int, bool, Any]]:
+        """Load the cache file."""
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                cache = json.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, RecursionError, ValueError) as err:
+            _LOGGER.warning("Unable to load YAML cache %s: %s", self.path, err)
+            return {}
+
+        if (
+            not isinstance(cache, dict)
+            or cache.get("version") != CACHE_VERSION
+            or cache.get("pyyaml") != yaml.__version__
+            or not isinstance(files := cache.get("files"), dict)
+        ):
+            return {}
+        return {
+            fname: tuple(entry)  # type: ignore[misc]
+            for fname, entry in files.items()
+            if isinstance(entry, list)
+            and len(entry) == 4
+            and [type(value) for value in entry[:3]] == [int, int, bool]
+        }
+
+    def _save_cache(self) -> None:
+        """Save the files used by the last load to the cache file."""
+        assert self._files is not None
+        self._files = {
+            fname: entry for fname, entry in self._files.items() if fname in self._used
+        }
+        self._dirty = False
+
+        tmp_filename = ""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # Modern versions of Python tempfile create this file with mode 0o600
+            with tempfile.NamedTemporaryFile(
+                mode="w", encoding="utf-8", dir=os.path.dirname(self.path), delete=False
+            ) as cache_file:
+                tmp_filename = cache_file.name
+                json.dump(
+                    {
+                        "version": CACHE_VERSION,
+                        "pyyaml": yaml.__version__,
+                        "files": self._files,
+                    },
+                    cache_file,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_filename, self.path)
+        except OSError as err:
+            _LOGGER.warning("Unable to save YAML cache %s: %s", self.path, err)
+        finally:
+            if tmp_filename and os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
@@ -11,6 +11,13 @@ from typing import Any, TextIO, TypeVar, Union, overload
 
 import yaml
 
+try:
+    from yaml.cyaml import CParser
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -103,12 +110,53 @@ class SafeLineLoader(yaml.SafeLoader):
         node.__line__ = last_line + 1  # type: ignore
         return node
 
+    def load_include(self, fname: str) -> JSON_TYPE:
+        """Load a YAML file included by the file being loaded."""
+        return load_yaml(fname, self.secrets)
+
+
+if HAS_C_LOADER:
+
+    class FastSafeLoader(CParser, SafeLineLoader):  # type: ignore[misc]
+        """Loader class parsing with libyaml.
+
+        Shares the constructors of SafeLineLoader. Line numbers are taken from
+        the marks of the nodes, which libyaml provides as well.
+        """
+
+        def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+            """Initialize a safe loader using libyaml."""
+            CParser.__init__(self, stream)
+            yaml.constructor.SafeConstructor.__init__(self)
+            yaml.resolver.Resolver.__init__(self)
+            self.secrets = secrets
+            # Attributes which the pure Python reader provides
+            if isinstance(stream, (str, bytes)):
+                self.stream = None
+                self.name = (
+                    "<unicode string>" if isinstance(stream, str) else "<byte string>"
+                )
+            else:
+                self.stream = stream
+                self.name = getattr(stream, "name", "<file>")
+
+
+else:
+    FastSafeLoader = SafeLineLoader  # type: ignore[misc]
+
 
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
+    return _load_yaml(FastSafeLoader, fname, secrets)
+
+
+def _load_yaml(
+    loader: type[SafeLineLoader], fname: str, secrets: Secrets | None = None
+) -> JSON_TYPE:
+    """Load a YAML file with the given loader class."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            return _parse_yaml(loader, conf_file, secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
@@ -116,11 +164,20 @@ def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
 
 def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
+    return _parse_yaml(FastSafeLoader, content, secrets)
+
+
+def _parse_yaml(
+    loader: type[SafeLineLoader],
+    content: str | TextIO,
+    secrets: Secrets | None = None,
+) -> JSON_TYPE:
+    """Load a YAML file with the given loader class."""
     try:
         # If configuration file is empty YAML returns None
         # We convert that to an empty dict
         return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
+            yaml.load(content, Loader=lambda stream: loader(stream, secrets))
             or OrderedDict()
         )
     except yaml.YAMLError as exc:
@@ -169,7 +226,7 @@ def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.name), node.value)
     try:
-        return _add_reference(load_yaml(fname, loader.secrets), loader, node)
+        return _add_reference(loader.load_include(fname), loader, node)
     except FileNotFoundError as exc:
         raise HomeAssistantError(
             f"{node.start_mark}: Unable to read file {fname}."
@@ -201,7 +258,7 @@ def _include_dir_named_yaml(
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        mapping[filename] = load_yaml(fname, loader.secrets)
+        mapping[filename] = loader.load_include(fname)
     return _add_reference(mapping, loader, node)
 
 
@@ -214,7 +271,7 @@ def _include_dir_merge_named_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = loader.load_include(fname)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference(mapping, loader, node)
@@ -226,7 +283,7 @@ def _include_dir_list_yaml(
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     return [
-        load_yaml(f, loader.secrets)
+        loader.load_include(f)
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
     ]
@@ -241,7 +298,7 @@ def _include_dir_merge_list_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = loader.load_include(fname)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
@@ -34,7 +34,7 @@ from homeassistant.components.device_automation import (  # noqa: F401
     _async_get_device_automation_capabilities as async_get_device_automation_capabilities,
 )
 from homeassistant.components.mqtt.models import ReceiveMessage
-from homeassistant.config import async_process_component_config
+from homeassistant.config import DATA_YAML_CACHE, async_process_component_config
 from homeassistant.const import (
     DEVICE_DEFAULT_NAME,
     EVENT_HOMEASSISTANT_CLOSE,
@@ -273,6 +273,7 @@ async def async_test_home_assistant(loop, load_registries=True):
     )
 
     hass.data[loader.DATA_CUSTOM_COMPONENTS] = {}
+    hass.data[DATA_YAML_CACHE] = None
 
     hass.config.location_name = "test home"
     hass.config.config_dir = get_test_config_dir()
@@ -1033,6 +1034,19 @@ def mock_storage(data=None):
         """Remove data."""
         data.pop(store.key, None)
 
+    def mock_load_journal(path):
+        """Mock version of loading a restore state journal."""
+        return list(data.get(os.path.basename(path), []))
+
+    def mock_append_journal(path, entries):
+        """Mock version of appending to a restore state journal."""
+        journal = data.setdefault(os.path.basename(path), [])
+        journal.extend(json.loads(entry) for entry in entries)
+
+    def mock_remove_journal(path):
+        """Mock version of removing a restore state journal."""
+        data.pop(os.path.basename(path), None)
+
     with patch(
         "homeassistant.helpers.storage.Store._async_load",
         side_effect=mock_async_load,
@@ -1045,6 +1059,15 @@ def mock_storage(data=None):
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.restore_state._load_journal",
+        side_effect=mock_load_journal,
+    ), patch(
+        "homeassistant.helpers.restore_state._append_journal",
+        side_effect=mock_append_journal,
+    ), patch(
+        "homeassistant.helpers.restore_state._remove_journal",
+        side_effect=mock_remove_journal,
     ):
         yield data
 
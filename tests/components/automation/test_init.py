@@ -551,6 +551,58 @@ async def test_reload_config_service(hass, calls, hass_admin_user, hass_read_onl
     assert calls[1].data.get("event") == "test_event2"
 
 
+async def test_reload_keeps_unchanged_automations(hass, calls):
+    """Test reloading only replaces the automations of which the config changed."""
+
+    def _automation(alias, event_type):
+        return {
+            "alias": alias,
+            "trigger": {"platform": "event", "event_type": event_type},
+            "action": {"service": "test.automation"},
+        }
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                _automation("hello", "test_event"),
+                _automation("bye", "test_event2"),
+            ]
+        },
+    )
+    component = hass.data[automation.DOMAIN]
+    hello = component.get_entity("automation.hello")
+    bye = component.get_entity("automation.bye")
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            automation.DOMAIN: [
+                _automation("hello", "test_event"),
+                _automation("bye", "test_event3"),
+                _automation("new", "test_event4"),
+            ]
+        },
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert component.get_entity("automation.hello") is hello
+    assert component.get_entity("automation.bye") is not bye
+    assert component.get_entity("automation.new") is not None
+    listeners = hass.bus.async_listeners()
+    assert listeners.get("test_event") == 1
+    assert listeners.get("test_event2") is None
+    assert listeners.get("test_event3") == 1
+    assert listeners.get("test_event4") == 1
+
+    for event_type in ("test_event", "test_event2", "test_event3", "test_event4"):
+        hass.bus.async_fire(event_type)
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+
 async def test_reload_config_when_invalid_config(hass, calls):
     """Test the reload config service handling invalid config."""
     with assert_setup_component(1, automation.DOMAIN):
@@ -627,7 +679,9 @@ async def test_reload_config_handles_load_fails(hass, calls):
     assert len(calls) == 2
 
 
-@pytest.mark.parametrize("service", ["turn_off_stop", "turn_off_no_stop", "reload"])
+@pytest.mark.parametrize(
+    "service", ["turn_off_stop", "turn_off_no_stop", "reload", "reload_unchanged"]
+)
 async def test_automation_stops(hass, calls, service):
     """Test that turning off / reloading stops any running actions as appropriate."""
     entity_id = "automation.hello"
@@ -673,6 +727,13 @@ async def test_automation_stops(hass, calls, service):
             blocking=True,
         )
     else:
+        if service == "reload":
+            config = {
+                automation.DOMAIN: {
+                    **config[automation.DOMAIN],
+                    "description": "Changed",
+                }
+            }
         with patch(
             "homeassistant.config.load_yaml_config_file",
             autospec=True,
@@ -685,7 +746,9 @@ async def test_automation_stops(hass, calls, service):
     hass.states.async_set(test_entity, "goodbye")
     await hass.async_block_till_done()
 
-    assert len(calls) == (1 if service == "turn_off_no_stop" else 0)
+    assert len(calls) == (
+        1 if service in ("turn_off_no_stop", "reload_unchanged") else 0
+    )
 
 
 async def test_automation_restore_state(hass):
@@ -6,6 +6,7 @@ from turbojpeg import TurboJPEG
 
 from homeassistant.components.camera import Image
 from homeassistant.components.camera.img_util import (
+    ScaledImageCache,
     TurboJPEGSingleton,
     find_supported_scaling_factor,
     scale_jpeg_camera_image,
@@ -116,3 +117,21 @@ def test_find_supported_scaling_factor(
         )
         == scaling_factor
     )
+
+
+def test_scaled_image_cache():
+    """Test the scaled image cache drops the least recently used images."""
+    cache = ScaledImageCache(max_bytes=10)
+    cache.set(b"source1", 4, 3, b"12345")
+    cache.set(b"source2", 4, 3, b"12345")
+    assert cache.get(b"source1", 4, 3) == b"12345"
+    assert cache.get(b"source1", 8, 6) is None
+
+    cache.set(b"source3", 4, 3, b"1")
+    assert cache.get(b"source2", 4, 3) is None
+    assert cache.get(b"source1", 4, 3) == b"12345"
+    assert cache.get(b"source3", 4, 3) == b"1"
+
+    cache.set(b"source4", 4, 3, b"too large image")
+    assert cache.get(b"source4", 4, 3) is None
+    assert (cache.hits, cache.misses) == (3, 3)
@@ -167,6 +167,149 @@ async def test_get_image_from_camera_not_jpeg(hass, image_mock_url):
     assert image.content == b"png"
 
 
+async def test_get_image_scaled_in_executor_and_cached(hass, image_mock_url):
+    """Test scaled images are scaled in the executor and reused."""
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ), patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Valid jpeg",
+    ), patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor:
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=4, height=3
+        )
+        image2 = await camera.async_get_image(
+            hass, "camera.demo_camera", width=4, height=3
+        )
+
+    assert image.content == image2.content == EMPTY_8_6_JPEG
+    assert len(turbo_jpeg.scale_with_quality.mock_calls) == 1
+    assert any(
+        call[1][0] is camera.img_util.scale_jpeg_camera_image
+        for call in mock_executor.mock_calls
+    )
+
+
+async def test_get_image_shares_fetch(hass, image_mock_url):
+    """Test concurrent requests for the same image share the fetch."""
+    fetched = asyncio.Event()
+    calls = []
+
+    async def _async_camera_image(self, width=None, height=None):
+        calls.append((width, height))
+        await fetched.wait()
+        return b"Image"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        new=_async_camera_image,
+    ):
+        requests = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*requests)
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+
+    assert [image.content for image in images] == [b"Image"] * 3
+    assert image.content == b"Image"
+    assert calls == [(None, None), (None, None)]
+
+
+async def test_still_stream_shared_by_viewers(hass, image_mock_url, hass_client):
+    """Test the viewers of an MJPEG still stream share the fetched images."""
+    client = await hass_client()
+    images = asyncio.Queue()
+    calls = 0
+
+    async def _async_camera_image(self, width=None, height=None):
+        nonlocal calls
+        calls += 1
+        return await images.get()
+
+    def _part(image):
+        return (
+            b"--frameboundary\r\nContent-Type: image/jpg\r\n"
+            b"Content-Length: %d\r\n\r\n%s\r\n" % (len(image), image)
+        )
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        new=_async_camera_image,
+    ), patch(
+        "homeassistant.components.demo.camera.DemoCamera.frame_interval",
+        PropertyMock(return_value=0),
+    ):
+        responses = [
+            await client.get("/api/camera_proxy_stream/camera.demo_camera")
+            for _ in range(2)
+        ]
+        demo_camera = hass.data[DOMAIN].get_entity("camera.demo_camera")
+        assert len(demo_camera._still_streams) == 1
+
+        await images.put(b"Image1")
+        for response in responses:
+            assert await response.content.readexactly(
+                2 * len(_part(b"Image1"))
+            ) == 2 * _part(b"Image1")
+
+        await images.put(b"Image1")
+        await images.put(b"Image2")
+        for response in responses:
+            assert await response.content.readexactly(len(_part(b"Image2"))) == _part(
+                b"Image2"
+            )
+
+        await images.put(None)
+        for response in responses:
+            assert await response.content.read() == b""
+
+    assert calls == 4
+    assert not demo_camera._still_streams
+
+
+async def test_still_stream_stops_without_viewers(hass, image_mock_url, hass_client):
+    """Test fetching images stops when the last viewer disconnects."""
+    client = await hass_client()
+    calls = 0
+
+    async def _async_camera_image(self, width=None, height=None):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"Image1"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        new=_async_camera_image,
+    ), patch(
+        "homeassistant.components.demo.camera.DemoCamera.frame_interval",
+        PropertyMock(return_value=0),
+    ):
+        response = await client.get("/api/camera_proxy_stream/camera.demo_camera")
+        assert await response.content.readuntil(b"Image1\r\n")
+        demo_camera = hass.data[DOMAIN].get_entity("camera.demo_camera")
+        broadcaster = demo_camera._still_streams[0]
+        response.close()
+
+        while demo_camera._still_streams:
+            await asyncio.sleep(0.01)
+        assert broadcaster.done
+        calls_after_close = calls
+        await asyncio.sleep(0.05)
+
+    assert calls == calls_after_close
+
+
 async def test_get_stream_source_from_camera(hass, mock_camera):
     """Fetch stream source from camera entity."""
 
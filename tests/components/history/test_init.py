@@ -613,6 +613,54 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == 200
 
 
+async def test_fetch_period_api_with_stream(hass, hass_client):
+    """Test the fetch period view for history streams the same states."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.cow", "on")
+    hass.states.async_set("light.cow", "off")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    for chunk_entities in (1, 10):
+        for params in ({}, {"minimal_response": ""}, {"skip_initial_state": ""}):
+            response = await client.get(
+                f"/api/history/period/{start.isoformat()}", params=params
+            )
+            assert response.status == 200
+            expected = await response.json()
+            with patch.object(history, "STREAM_CHUNK_ENTITIES", chunk_entities):
+                response = await client.get(
+                    f"/api/history/period/{start.isoformat()}",
+                    params={**params, "stream": ""},
+                )
+                assert response.status == 200
+                streamed = await response.json()
+            assert sorted(
+                streamed, key=lambda states: states[0]["entity_id"]
+            ) == sorted(expected, key=lambda states: states[0]["entity_id"])
+            if not params:
+                # Entities with only a start time state come last
+                assert [states[0]["entity_id"] for states in streamed] == [
+                    "light.cow",
+                    "light.kitchen",
+                    "sensor.power",
+                ]
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
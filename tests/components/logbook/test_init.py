@@ -2,6 +2,7 @@
 # pylint: disable=protected-access,invalid-name
 import collections
 from datetime import datetime, timedelta
+from functools import partial
 import json
 from unittest.mock import Mock, patch
 
@@ -35,6 +36,7 @@ import homeassistant.core as ha
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component, setup_component
+from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
 from tests.common import get_test_home_assistant, init_recorder_component, mock_platform
@@ -1873,6 +1875,192 @@ async def test_context_filter(hass, hass_client):
     assert response.status == 400
 
 
+async def test_event_stream(hass, hass_ws_client):
+    """Test the logbook event stream sends the history and then live entries."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.a", STATE_ON)
+    hass.states.async_set("switch.a", STATE_OFF)
+    await _async_commit_and_wait(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response["id"] == 1
+    assert len(response["event"]) == 1
+    _assert_entry(response["event"][0], entity_id="switch.a", state=STATE_OFF)
+
+    context = ha.Context(user_id="b400facee45711eaa9308bfd3d19e474")
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "switch", ATTR_SERVICE: "turn_on"},
+        context=context,
+    )
+    hass.states.async_set("switch.a", STATE_ON, context=context)
+    hass.states.async_set("switch.a", STATE_ON, {"icon": "mdi:a"})
+    hass.states.async_set("sensor.temperature", "10", {"unit_of_measurement": "C"})
+    logbook.async_log_entry(hass, "Alarm", "is triggered", "switch")
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    assert len(response["event"]) == 1
+    entry = response["event"][0]
+    _assert_entry(entry, entity_id="switch.a", state=STATE_ON)
+    assert entry["context_user_id"] == "b400facee45711eaa9308bfd3d19e474"
+    assert entry["context_domain"] == "switch"
+    assert entry["context_service"] == "turn_on"
+
+    response = await client.receive_json()
+    _assert_entry(
+        response["event"][0], name="Alarm", message="is triggered", domain="switch"
+    )
+
+
+async def test_event_stream_uncommitted_history(hass, hass_ws_client):
+    """Test events not committed when subscribing are sent with the history."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.a", STATE_ON)
+    await _async_commit_and_wait(hass)
+    hass.states.async_set("switch.a", STATE_OFF)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert len(response["event"]) == 1
+    _assert_entry(response["event"][0], entity_id="switch.a", state=STATE_OFF)
+
+
+async def test_event_stream_event_while_loading_history(hass, hass_ws_client):
+    """Test events recorded while the history loads are only sent once."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.a", STATE_ON)
+    await _async_commit_and_wait(hass)
+    fired_before_subscribing = dt_util.utcnow()
+
+    get_events = logbook._get_events
+
+    def _get_events_after_recording(*args):
+        run_callback_threadsafe(
+            hass.loop, hass.states.async_set, "switch.a", STATE_OFF
+        ).result()
+        run_callback_threadsafe(
+            hass.loop,
+            partial(
+                hass.bus.async_fire,
+                logbook.EVENT_LOGBOOK_ENTRY,
+                {
+                    ATTR_NAME: "Late",
+                    logbook.ATTR_MESSAGE: "is delivered late",
+                    ATTR_DOMAIN: "switch",
+                },
+                time_fired=fired_before_subscribing,
+            ),
+        ).result()
+        trigger_db_commit(hass)
+        run_callback_threadsafe(hass.loop, Mock()).result()
+        hass.data[recorder.DATA_INSTANCE].block_till_done()
+        return get_events(*args)
+
+    client = await hass_ws_client()
+    with patch.object(logbook, "_get_events", _get_events_after_recording):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/event_stream",
+                "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert len(response["event"]) == 1
+        _assert_entry(
+            response["event"][0],
+            name="Late",
+            message="is delivered late",
+            domain="switch",
+        )
+
+    response = await client.receive_json()
+    assert len(response["event"]) == 1
+    _assert_entry(response["event"][0], entity_id="switch.a", state=STATE_OFF)
+
+    logbook.async_log_entry(hass, "Alarm", "is triggered", "switch")
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    _assert_entry(
+        response["event"][0], name="Alarm", message="is triggered", domain="switch"
+    )
+
+
+async def test_event_stream_entity_ids(hass, hass_ws_client):
+    """Test the logbook event stream of entities."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": dt_util.utcnow().isoformat(),
+            "entity_ids": ["switch.a"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"] == []
+
+    for entity_id in ("switch.b", "switch.a"):
+        hass.states.async_set(entity_id, STATE_ON)
+        hass.states.async_set(entity_id, STATE_OFF)
+    logbook.async_log_entry(hass, "B", "is triggered", entity_id="switch.b")
+    logbook.async_log_entry(hass, "A", "is triggered", entity_id="switch.a")
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    _assert_entry(response["event"][0], entity_id="switch.a", state=STATE_OFF)
+    response = await client.receive_json()
+    _assert_entry(response["event"][0], name="A", entity_id="switch.a")
+
+    await client.send_json(
+        {"id": 2, "type": "logbook/event_stream", "start_time": "invalid"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 async def _async_fetch_logbook(client, params=None):
     if params is None:
         params = {}
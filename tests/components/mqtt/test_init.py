@@ -470,6 +470,55 @@ async def test_subscribe_topic_not_match(hass, mqtt_mock, calls, record_calls):
     assert len(calls) == 0
 
 
+async def test_receiving_messages_in_batches(hass, mqtt_mock, calls, record_calls):
+    """Test messages received by the paho thread are handed over in batches."""
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as mock_call_soon_threadsafe:
+        for idx in range(3):
+            mqtt_mock._mqtt_on_message(
+                None,
+                None,
+                mqtt.models.ReceiveMessage(
+                    f"test-topic/{idx}", f"payload {idx}".encode(), 0, False
+                ),
+            )
+
+    assert mock_call_soon_threadsafe.call_count == 1
+
+    await hass.async_block_till_done()
+    assert [recorded[0].payload for recorded in calls] == [
+        "payload 0",
+        "payload 1",
+        "payload 2",
+    ]
+
+
+async def test_receiving_messages_in_batches_with_failing_subscriber(
+    hass, mqtt_mock, calls, record_calls, caplog
+):
+    """Test a failing subscriber doesn't hold back the rest of the batch."""
+
+    @callback
+    def failing_callback(msg):
+        """Raise an error."""
+        raise ValueError("boom")
+
+    await mqtt.async_subscribe(hass, "test-topic/fail", failing_callback)
+    await mqtt.async_subscribe(hass, "test-topic/ok", record_calls)
+
+    for topic in ("test-topic/fail", "test-topic/ok"):
+        mqtt_mock._mqtt_on_message(
+            None, None, mqtt.models.ReceiveMessage(topic, b"payload", 0, False)
+        )
+
+    await hass.async_block_till_done()
+    assert [recorded[0].topic for recorded in calls] == ["test-topic/ok"]
+    assert "Error handling message on test-topic/fail" in caplog.text
+
+
 async def test_subscribe_topic_level_wildcard(hass, mqtt_mock, calls, record_calls):
     """Test the subscription of wildcard topics."""
     await mqtt.async_subscribe(hass, "test-topic/+/on", record_calls)
@@ -923,13 +972,9 @@ async def test_delayed_birth_message(hass, mqtt_client_mock, mqtt_config):
     assert result
     await hass.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
-    spec = dir(hass.data["mqtt"])
-    spec.remove("_matching_subscriptions")
-
     mqtt_component_mock = MagicMock(
         return_value=hass.data["mqtt"],
-        spec_set=spec,
+        spec_set=dir(hass.data["mqtt"]),
         wraps=hass.data["mqtt"],
     )
     mqtt_component_mock._mqttc = mqtt_client_mock
@@ -0,0 +1,67 @@
+"""The tests for the MQTT topic trie."""
+import pytest
+
+from homeassistant.components.mqtt.trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,matches",
+    [
+        ("test-topic", "test-topic", True),
+        ("test-topic", "test-topic/bier", False),
+        ("test-topic/+/on", "test-topic/bier/on", True),
+        ("test-topic/+/on", "test-topic/bier", False),
+        ("test-topic/+/on", "test-topic/bier/off", False),
+        ("+/test-topic", "/test-topic", True),
+        ("test-topic/#", "test-topic", True),
+        ("test-topic/#", "test-topic/bier/on", True),
+        ("test-topic/#", "test-topic-123", False),
+        ("#", "test-topic/bier/on", True),
+        ("#", "$SYS/broker/uptime", False),
+        ("+/broker/uptime", "$SYS/broker/uptime", False),
+        ("$SYS/#", "$SYS/broker/uptime", True),
+        ("$SYS/+/uptime", "$SYS/broker/uptime", True),
+    ],
+)
+def test_matches(topic_filter, topic, matches):
+    """Test matching topics against a topic filter."""
+    trie = TopicTrie()
+    trie.add(topic_filter, "value")
+
+    assert trie.matches(topic) == (["value"] if matches else [])
+
+
+def test_matches_in_order_added():
+    """Test the values of all matching topic filters are returned in order."""
+    trie = TopicTrie()
+    trie.add("zigbee2mqtt/#", "all")
+    trie.add("zigbee2mqtt/lamp", "lamp")
+    trie.add("zigbee2mqtt/+", "device")
+    trie.add("zigbee2mqtt/lamp", "lamp_2")
+    trie.add("zigbee2mqtt/lamp/set", "set")
+
+    assert trie.matches("zigbee2mqtt/lamp") == ["all", "lamp", "device", "lamp_2"]
+    assert trie.matches("zigbee2mqtt/lamp/set") == ["all", "set"]
+
+
+def test_remove():
+    """Test removing values."""
+    trie = TopicTrie()
+    value_1 = object()
+    value_2 = object()
+    trie.add("test-topic/+/on", value_1)
+    trie.add("test-topic/+/on", value_2)
+
+    trie.remove("test-topic/+/on", value_1)
+    assert trie.matches("test-topic/bier/on") == [value_2]
+
+    with pytest.raises(KeyError):
+        trie.remove("test-topic/+/on", value_1)
+
+    trie.remove("test-topic/+/on", value_2)
+    assert trie.matches("test-topic/bier/on") == []
+    # Unused levels are pruned
+    assert not trie._root.children
+
+    with pytest.raises(KeyError):
+        trie.remove("test-topic/+/on", value_2)
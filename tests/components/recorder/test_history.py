@@ -7,6 +7,7 @@ from unittest.mock import patch, sentinel
 
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -184,6 +185,41 @@ def test_get_significant_states(hass_recorder):
     assert states == hist
 
 
+def test_stream_significant_states(hass_recorder):
+    """Test streamed significant states match the fetched ones."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    with patch.object(history, "STREAM_YIELD_PER", 2), session_scope(
+        hass=hass
+    ) as session:
+        for minimal_response in (False, True):
+            start_time_states = history.get_start_time_states_with_session(
+                hass, session, zero
+            )
+            streamed = dict(
+                history.stream_significant_states_with_session(
+                    hass,
+                    session,
+                    zero,
+                    four,
+                    start_time_states=start_time_states,
+                    minimal_response=minimal_response,
+                )
+            )
+            streamed.update(
+                (entity_id, [state]) for entity_id, state in start_time_states.items()
+            )
+            assert streamed == history.get_significant_states(
+                hass, zero, four, minimal_response=minimal_response
+            )
+
+        entity_ids = sorted(states)
+        streamed = history.stream_significant_states_with_session(
+            hass, session, zero, four, after_entity_id=entity_ids[0]
+        )
+        assert [entity_id for entity_id, _ in streamed] == entity_ids[1:]
+
+
 def test_get_significant_states_minimal_response(hass_recorder):
     """Test that only significant states are returned.
 
@@ -1,10 +1,12 @@
 """The tests for the Recorder component."""
 # pylint: disable=protected-access
 from datetime import datetime, timedelta
+import json
 import sqlite3
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -28,6 +30,7 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -37,6 +40,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
@@ -830,6 +834,166 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_with_bulk_insert(hass_recorder, caplog):
+    """Test bulk inserts save events and link old states within a batch."""
+    hass = hass_recorder({"bulk_insert": True})
+
+    hass.bus.fire("bad_event", {"fail": CannotSerializeMe()})
+    hass.bus.fire("custom_event", {"some": "data"})
+    hass.states.set("test.one", "on", {"attr": 1})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", {"attr": 1})
+    hass.states.set("test.two", "on", {})
+    hass.states.set("test.one", "on", {"attr": 2})
+    hass.states.remove("test.two")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        events = list(
+            session.query(Events).filter(
+                Events.event_type.in_(["bad_event", "custom_event"])
+            )
+        )
+        assert [event.event_data for event in events] == ['{"some":"data"}']
+        assert (
+            session.query(Events)
+            .filter(Events.event_type == EVENT_STATE_CHANGED)
+            .count()
+        ) == 5
+        states = list(session.query(States))
+        assert [(state.entity_id, state.state) for state in states] == [
+            ("test.one", "on"),
+            ("test.one", "off"),
+            ("test.two", "on"),
+            ("test.one", "on"),
+            ("test.two", None),
+        ]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id == states[0].state_id
+        assert states[2].old_state_id is None
+        assert states[3].old_state_id == states[1].state_id
+        assert states[4].old_state_id == states[2].state_id
+        assert states[3].to_native().attributes == {"attr": 2}
+        assert all(state.event_id for state in states)
+
+    assert "Event is not JSON serializable" in caplog.text
+
+
+def test_bulk_insert_uses_executemany(hass_recorder):
+    """Test bulk inserts insert the rows of a table with one executemany."""
+    hass = hass_recorder({"bulk_insert": True})
+    inserts = []
+
+    def _before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        if statement.startswith("INSERT"):
+            rows = len(parameters) if executemany else 1
+            inserts.append((statement.split()[2], executemany, rows))
+
+    wait_recording_done(hass)
+    engine = hass.data[DATA_INSTANCE].engine
+    sqlalchemy_event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    for idx in range(3):
+        hass.states.set(f"test.entity_{idx}", "on", {"idx": idx})
+    hass.states.set("test.entity_0", "off", {"idx": 0})
+    wait_recording_done(hass)
+    sqlalchemy_event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+    assert inserts == [
+        ("events", True, 4),
+        ("state_attributes", True, 3),
+        ("states", True, 3),
+        # The state replacing a state of the same batch needs its id
+        ("states", False, 1),
+    ]
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert [state.state_id for state in states] == [1, 2, 3, 4]
+        assert states[3].old_state_id == states[0].state_id
+        assert states[3].attributes_id == states[0].attributes_id
+        assert [state.event_id for state in states] == [
+            event.event_id
+            for event in session.query(Events).filter(
+                Events.event_type == EVENT_STATE_CHANGED
+            )
+        ]
+
+
+def test_bulk_insert_one_row_at_a_time(hass_recorder):
+    """Test bulk inserts fall back to single rows when keys can't be matched."""
+    hass = hass_recorder({"bulk_insert": True})
+    inserts = []
+
+    def _before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        if statement.startswith("INSERT"):
+            inserts.append((statement.split()[2], executemany))
+
+    wait_recording_done(hass)
+    engine = hass.data[DATA_INSTANCE].engine
+    sqlalchemy_event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    with patch.object(engine.dialect, "name", "other"):
+        for idx in range(2):
+            hass.states.set(f"test.entity_{idx}", "on", {"idx": idx})
+        hass.states.set("test.entity_0", "off", {"idx": 0})
+        wait_recording_done(hass)
+    sqlalchemy_event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+    assert inserts == [
+        ("events", False),
+        ("events", False),
+        ("events", False),
+        ("state_attributes", False),
+        ("state_attributes", False),
+        ("states", False),
+        ("states", False),
+        ("states", False),
+    ]
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert states[2].old_state_id == states[0].state_id
+        assert states[2].attributes_id == states[0].attributes_id
+        assert [state.event_id for state in states] == [
+            event.event_id
+            for event in session.query(Events).filter(
+                Events.event_type == EVENT_STATE_CHANGED
+            )
+        ]
+
+
+@pytest.mark.parametrize("bulk_insert", [False, True])
+def test_saving_shares_state_attributes(hass_recorder, bulk_insert):
+    """Test states with the same attributes share one attributes row."""
+    hass = hass_recorder({"bulk_insert": bulk_insert})
+
+    hass.states.set("test.one", "on", {"attr": 1})
+    hass.states.set("test.one", "off", {"attr": 1})
+    hass.states.set("test.two", "on", {"attr": 1})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "on", {"attr": 1})
+    hass.states.set("test.two", "off", {"attr": 2})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        shared = {
+            attrs.attributes_id: json.loads(attrs.shared_attrs)
+            for attrs in session.query(StateAttributes)
+        }
+        assert sorted(shared.values(), key=json.dumps) == [{"attr": 1}, {"attr": 2}]
+        states = list(session.query(States))
+        assert [shared[state.attributes_id] for state in states] == [
+            {"attr": 1},
+            {"attr": 1},
+            {"attr": 1},
+            {"attr": 1},
+            {"attr": 2},
+        ]
+        assert all(state.attributes is None for state in states)
+        assert states[4].to_native().attributes == {"attr": 2}
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
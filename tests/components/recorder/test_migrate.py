@@ -301,6 +301,44 @@ def test_forgiving_add_index():
         migration._create_index(session, "states", "ix_states_context_id")
 
 
+def test_backfill_events_entity_id_domain():
+    """Test the entity_id and domain of stored events are extracted."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    models.Base.metadata.create_all(engine)
+    event_data = [
+        '{"name": "Kitchen", "entity_id": "switch.a", "domain": "switch"}',
+        '{"domain": "light", "service": "turn_on"}',
+        '{"entity_id": ["light.a", "light.b"]}',
+        "not json",
+        "{}",
+    ]
+    with Session(engine) as session:
+        for data in event_data:
+            session.add(models.Events(event_type="test_event", event_data=data))
+        session.add(
+            models.Events(
+                event_type="state_changed", event_data='{"entity_id": "light.a"}'
+            )
+        )
+        session.flush()
+
+        with patch.object(migration, "EVENTS_BACKFILL_BATCH_SIZE", 2):
+            migration._backfill_events_entity_id_domain(session)
+        session.expire_all()
+
+        assert [
+            (event.entity_id, event.domain)
+            for event in session.query(models.Events).order_by(models.Events.event_id)
+        ] == [
+            ("switch.a", "switch"),
+            (None, "light"),
+            (None, None),
+            (None, None),
+            (None, None),
+            (None, None),
+        ]
+
+
 @pytest.mark.parametrize(
     "exception_type", [OperationalError, ProgrammingError, InternalError]
 )
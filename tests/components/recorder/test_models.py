@@ -1,5 +1,7 @@
 """The tests for the Recorder component."""
 from datetime import datetime
+import json
+from unittest.mock import Mock
 
 import pytest
 from sqlalchemy import create_engine
@@ -8,6 +10,7 @@ from sqlalchemy.orm import scoped_session, sessionmaker
 from homeassistant.components.recorder.models import (
     Base,
     Events,
+    LazyState,
     RecorderRuns,
     States,
     process_timestamp,
@@ -16,6 +19,7 @@ from homeassistant.components.recorder.models import (
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt
 import homeassistant.util.dt as dt_util
 
@@ -26,6 +30,31 @@ def test_from_event_to_db_event():
     assert event == Events.from_event(event).to_native()
 
 
+def test_from_event_entity_id_and_domain():
+    """Test the entity_id and domain of the event data are extracted."""
+    db_event = Events.from_event(
+        ha.Event("logbook_entry", {"entity_id": "switch.a", "domain": "switch"})
+    )
+    assert db_event.entity_id == "switch.a"
+    assert db_event.domain == "switch"
+
+    db_event = Events.from_event(
+        ha.Event("call_service", {"domain": "light", "service_data": {}})
+    )
+    assert db_event.entity_id is None
+    assert db_event.domain == "light"
+
+    db_event = Events.from_event(ha.Event("test_event", {"entity_id": ["light.a"]}))
+    assert db_event.entity_id is None
+    assert db_event.domain is None
+
+    db_event = Events.from_event(
+        ha.Event(EVENT_STATE_CHANGED, {"entity_id": "sensor.temperature"}),
+        event_data="{}",
+    )
+    assert db_event.entity_id is None
+
+
 def test_from_event_to_db_state():
     """Test converting event to db state."""
     state = ha.State("sensor.temperature", "18")
@@ -215,3 +244,36 @@ async def test_event_to_db_model():
     native = Events.from_event(event, event_data="{}").to_native()
     event.data = {}
     assert native == event
+
+
+def test_lazy_state_attributes():
+    """Test LazyState reads attributes from the state or the shared row."""
+    row = Mock(entity_id="sensor.test", state="on")
+
+    row.attributes = '{"shared": false}'
+    row.shared_attrs = None
+    assert LazyState(row).attributes == {"shared": False}
+
+    row.attributes = None
+    row.shared_attrs = '{"shared": true}'
+    assert LazyState(row).attributes == {"shared": True}
+
+    row.shared_attrs = None
+    assert LazyState(row).attributes == {}
+
+
+def test_lazy_state_as_dict_json():
+    """Test LazyState can be serialized to json like a State."""
+    now = dt_util.utcnow()
+    row = Mock(
+        entity_id="sensor.test",
+        state="on",
+        attributes='{"unit": "W"}',
+        shared_attrs=None,
+        last_changed=now,
+        last_updated=now,
+    )
+    state = LazyState(row)
+    assert json.loads(state.as_dict_json()) == json.loads(
+        json.dumps(state.as_dict(), cls=JSONEncoder)
+    )
@@ -4,13 +4,19 @@ import json
 import sqlite3
 from unittest.mock import MagicMock, patch
 
+import pytest
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -61,6 +67,115 @@ async def test_purge_old_states(
         assert states.count() == 2
 
 
+async def test_purge_old_states_with_shared_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test purging states removes the attributes no state refers to anymore."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+
+    utcnow = dt_util.utcnow()
+    five_days_ago = utcnow - timedelta(days=5)
+    with session_scope(hass=hass) as session:
+        purged_attributes = StateAttributes(
+            **StateAttributes.row_from_shared_attrs('{"purged":true}')
+        )
+        kept_attributes = StateAttributes(
+            **StateAttributes.row_from_shared_attrs('{"purged":false}')
+        )
+        session.add_all([purged_attributes, kept_attributes])
+        for timestamp, attributes in (
+            (five_days_ago, purged_attributes),
+            (five_days_ago, kept_attributes),
+            (utcnow, kept_attributes),
+        ):
+            event = Events(
+                event_type="state_changed",
+                event_data="{}",
+                origin="LOCAL",
+                time_fired=timestamp,
+            )
+            session.add(
+                States(
+                    entity_id="test.recorder2",
+                    domain="test",
+                    state="on",
+                    last_changed=timestamp,
+                    last_updated=timestamp,
+                    event=event,
+                    state_attributes=attributes,
+                )
+            )
+        session.flush()
+        instance._state_attributes_ids[
+            '{"purged":true}'
+        ] = purged_attributes.attributes_id
+
+    purge_before = utcnow - timedelta(days=4)
+    with session_scope(hass=hass) as session:
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert session.query(States).count() == 1
+        assert [attrs.shared_attrs for attrs in session.query(StateAttributes)] == [
+            '{"purged":false}'
+        ]
+    assert '{"purged":true}' not in instance._state_attributes_ids
+
+
+@pytest.mark.parametrize("bulk_insert", [False, True])
+async def test_purge_keeps_attributes_of_pending_states(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    bulk_insert: bool,
+):
+    """Test purging keeps the attributes a state waiting to be committed shares."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_BULK_INSERT: bulk_insert}
+    )
+    await async_wait_recording_done(hass, instance)
+
+    five_days_ago = dt_util.utcnow() - timedelta(days=5)
+    with session_scope(hass=hass) as session:
+        attributes = StateAttributes(
+            **StateAttributes.row_from_shared_attrs('{"shared":true}')
+        )
+        session.add(
+            States(
+                entity_id="test.recorder2",
+                domain="test",
+                state="on",
+                last_changed=five_days_ago,
+                last_updated=five_days_ago,
+                event=Events(
+                    event_type="state_changed",
+                    event_data="{}",
+                    origin="LOCAL",
+                    time_fired=five_days_ago,
+                ),
+                state_attributes=attributes,
+            )
+        )
+        session.flush()
+        instance._state_attributes_ids['{"shared":true}'] = attributes.attributes_id
+
+    # The state is buffered with the stored attributes but not committed
+    # when the purge runs
+    hass.states.async_set("test.recorder2", "off", {"shared": True})
+    await hass.async_block_till_done()
+    instance.queue.put(PurgeTask(dt_util.utcnow() - timedelta(days=4), False, False))
+    await async_wait_purge_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States).all()
+        assert [state.state for state in states] == ["off"]
+        assert (
+            session.query(StateAttributes)
+            .filter(StateAttributes.attributes_id == states[0].attributes_id)
+            .one()
+            .shared_attrs
+            == '{"shared":true}'
+        )
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
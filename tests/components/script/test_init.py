@@ -33,7 +33,12 @@ from homeassistant.loader import bind_hass
 from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
 
-from tests.common import async_mock_service, get_test_home_assistant, mock_restore_cache
+from tests.common import (
+    async_capture_events,
+    async_mock_service,
+    get_test_home_assistant,
+    mock_restore_cache,
+)
 from tests.components.logbook.test_init import MockLazyEventPartialState
 
 ENTITY_ID = "script.test"
@@ -261,6 +266,40 @@ async def test_reload_service(hass, running):
         assert hass.services.has_service(script.DOMAIN, "test")
 
 
+async def test_reload_keeps_unchanged_scripts(hass):
+    """Test reloading only replaces the scripts of which the config changed."""
+    config = {
+        "script": {
+            "test": {"sequence": [{"event": "test_event"}]},
+            "test2": {"sequence": [{"event": "test_event2"}]},
+        }
+    }
+    assert await async_setup_component(hass, "script", config)
+    component = hass.data[DOMAIN]
+    test = component.get_entity("script.test")
+    test2 = component.get_entity("script.test2")
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        return_value={
+            "script": {
+                "test": {"sequence": [{"event": "test_event"}]},
+                "test2": {"sequence": [{"event": "test_event3"}]},
+            }
+        },
+    ):
+        await hass.services.async_call(DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert component.get_entity("script.test") is test
+    assert component.get_entity("script.test2") is not test2
+    assert hass.services.has_service(DOMAIN, "test")
+    assert hass.services.has_service(DOMAIN, "test2")
+
+    events = async_capture_events(hass, "test_event3")
+    await hass.services.async_call(DOMAIN, "test2", blocking=True)
+    assert len(events) == 1
+
+
 async def test_service_descriptions(hass):
     """Test that service descriptions are loaded and reloaded correctly."""
     # Test 1: has "description" but no "fields"
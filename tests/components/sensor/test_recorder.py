@@ -17,7 +17,11 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
     statistics_during_period,
 )
-from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.components.sensor.recorder import (
+    DATA_STATES_ACCUMULATOR,
+    StatesAccumulator,
+)
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
@@ -120,6 +124,114 @@ def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_hourly_statistics_from_accumulated_states(hass_recorder, caplog):
+    """Test compiling statistics from the states collected in memory."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    hass.block_till_done()
+    zero = dt_util.utcnow()
+    attributes = {
+        "device_class": None,
+        "state_class": "measurement",
+        "unit_of_measurement": "%",
+    }
+    record_states(hass, zero, "sensor.test1", attributes)
+
+    with patch(
+        "homeassistant.components.sensor.recorder.history.get_significant_states_with_session"
+    ) as mock_history:
+        recorder.do_adhoc_statistics(start=zero)
+        wait_recording_done(hass)
+        recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
+        wait_recording_done(hass)
+    assert not mock_history.called
+    # Only the start state of the next period is kept once the statistics are saved
+    accumulator = hass.data[DATA_STATES_ACCUMULATOR]
+    assert accumulator._states["sensor.test1"] == [hass.states.get("sensor.test1")]
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(zero),
+                "end": process_timestamp_to_utc_isoformat(zero + timedelta(minutes=5)),
+                "mean": approx(13.050847),
+                "min": approx(-10.0),
+                "max": approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
+                "end": process_timestamp_to_utc_isoformat(zero + timedelta(minutes=10)),
+                "mean": approx(30.0),
+                "min": approx(30.0),
+                "max": approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+        ]
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
+async def test_states_accumulator_only_collects_state_class(hass):
+    """Test the accumulator only collects the states of sensors with a state class."""
+    hass.states.async_set("sensor.initial", "1", {"state_class": "measurement"})
+    hass.states.async_set("sensor.initial_no_class", "1")
+    accumulator = StatesAccumulator(hass)
+    hass.bus.async_listen(EVENT_STATE_CHANGED, accumulator.async_state_changed)
+
+    hass.states.async_set("sensor.measured", "1", {"state_class": "measurement"})
+    hass.states.async_set("sensor.no_class", "1")
+    hass.states.async_set("sensor.initial", "2")
+    await hass.async_block_till_done()
+
+    assert (
+        accumulator.history(
+            accumulator.tracking_since,
+            dt_util.utcnow() + timedelta(minutes=5),
+            ["sensor.initial", "sensor.initial_no_class"],
+            ["sensor.measured", "sensor.no_class"],
+        )
+        == {"sensor.measured": [hass.states.get("sensor.measured")]}
+    )
+
+
+async def test_states_accumulator_history_until_pruned(hass):
+    """Test reading a period twice returns the same states until it is pruned."""
+    accumulator = StatesAccumulator(hass)
+    hass.bus.async_listen(EVENT_STATE_CHANGED, accumulator.async_state_changed)
+
+    for value in ("1", "2", "3"):
+        hass.states.async_set("sensor.power", value, {"state_class": "measurement"})
+    await hass.async_block_till_done()
+    last_state = hass.states.get("sensor.power")
+
+    end = dt_util.utcnow() + timedelta(minutes=5)
+    history_list = accumulator.history(
+        accumulator.tracking_since, end, ["sensor.power"], []
+    )
+    assert [state.state for state in history_list["sensor.power"]] == ["1", "2", "3"]
+    assert (
+        accumulator.history(accumulator.tracking_since, end, ["sensor.power"], [])
+        == history_list
+    )
+
+    accumulator.prune(end)
+    assert accumulator.history(
+        end, end + timedelta(minutes=5), ["sensor.power"], []
+    ) == {"sensor.power": [last_state]}
+    assert accumulator._states == {"sensor.power": [last_state]}
+
+
 @pytest.mark.parametrize(
     "device_class,unit,native_unit",
     [
@@ -250,6 +250,37 @@ async def test_reload_sensors_that_reference_other_template_sensors(hass, start_
     assert hass.states.get("sensor.test3").state == "2"
 
 
+@pytest.mark.parametrize("count,domain", [(1, "sensor")])
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "sensor": {
+                "platform": DOMAIN,
+                "sensors": {
+                    "state": {"value_template": "{{ 1 }}"},
+                },
+            }
+        },
+    ],
+)
+async def test_reload_unchanged_config_keeps_entities(hass, start_ha):
+    """Test reloading unchanged configuration keeps the template entities."""
+    await async_yaml_patch_helper(hass, "ref_configuration.yaml")
+    state = hass.states.get("sensor.test1")
+    assert state is not None
+
+    with patch(
+        "homeassistant.components.template.async_reload_integration_platforms"
+    ) as mock_reload:
+        await async_yaml_patch_helper(hass, "ref_configuration.yaml")
+    assert not mock_reload.called
+    assert hass.states.get("sensor.test1") is state
+
+    await async_yaml_patch_helper(hass, "sensor_configuration.yaml")
+    assert hass.states.get("sensor.test1") is None
+
+
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
 
@@ -1,8 +1,12 @@
 """Test Websocket API messages module."""
+import json
 
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
+    _cached_state_diff_message as lru_state_diff_cache,
     cached_event_message,
+    cached_state_diff_message,
+    event_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -47,6 +51,30 @@ async def test_cached_event_message(hass):
     assert cache_info.currsize == 2
 
 
+async def test_cached_state_changed_event_message_reuses_state_json(hass):
+    """Test state_changed event messages are built from the cached state JSON."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"color": "red"})
+    hass.states.async_set("light.window", "off")
+    await hass.async_block_till_done()
+
+    lru_event_cache.cache_clear()
+    for event in events:
+        assert json.loads(cached_event_message(1, event)) == json.loads(
+            message_to_json(event_message(1, event))
+        )
+
+    new_state = events[1].data["new_state"]
+    assert new_state.as_dict_json().decode() in cached_event_message(1, events[1])
+
+
 async def test_cached_event_message_with_different_idens(hass):
     """Test that we cache event messages when the subscrition idens differ."""
 
@@ -78,18 +106,63 @@ async def test_cached_event_message_with_different_idens(hass):
     assert cache_info.currsize == 1
 
 
+async def test_cached_state_diff_message(hass):
+    """Test that we cache state diff messages."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 10})
+    hass.states.async_set("light.window", "on", {"brightness": 10, "color": "red"})
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    lru_state_diff_cache.cache_clear()
+
+    msg0 = cached_state_diff_message(2, events[0])
+    assert msg0 == cached_state_diff_message(2, events[0])
+
+    msg1 = cached_state_diff_message(3, events[1])
+    assert cached_state_diff_message(4, events[1]) == msg1.replace('"id":3', '"id":4')
+    new_state = events[1].data["new_state"]
+    assert json.loads(msg1) == {
+        "id": 3,
+        "type": "event",
+        "event": {
+            "c": {
+                "light.window": {
+                    "+": {
+                        "a": {"color": "red"},
+                        "c": new_state.context.id,
+                        "lu": new_state.last_updated.timestamp(),
+                    }
+                }
+            }
+        },
+    }
+
+    cache_info = lru_state_diff_cache.cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 2
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
     json_str = message_to_json({"id": 1, "message": "xyz"})
 
-    assert json_str == '{"id": 1, "message": "xyz"}'
+    assert json_str == '{"id":1,"message":"xyz"}'
 
     json_str2 = message_to_json({"id": 1, "message": _Unserializeable()})
 
     assert (
         json_str2
-        == '{"id": 1, "type": "result", "success": false, "error": {"code": "unknown_error", "message": "Invalid JSON in response"}}'
+        == '{"id":1,"type":"result","success":false,"error":{"code":"unknown_error","message":"Invalid JSON in response"}}'
     )
     assert "Unable to serialize to JSON" in caplog.text
 
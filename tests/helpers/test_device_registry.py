@@ -681,6 +681,49 @@ async def test_update(registry):
     assert registry.async_get(updated_entry.id) is not None
 
 
+async def test_entries_indexes_follow_updates(registry):
+    """Test devices by area and config entry follow updates."""
+    device1 = registry.async_get_or_create(
+        config_entry_id="config-1", identifiers={("hue", "1")}
+    )
+    device2 = registry.async_get_or_create(
+        config_entry_id="config-1", identifiers={("hue", "2")}
+    )
+    device1 = registry.async_update_device(device1.id, area_id="area-1")
+    device2 = registry.async_update_device(device2.id, area_id="area-1")
+    device1 = registry.async_get_or_create(
+        config_entry_id="config-2", identifiers={("hue", "1")}
+    )
+
+    assert device_registry.async_entries_for_area(registry, "area-1") == [
+        device1,
+        device2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "config-1") == [
+        device1,
+        device2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "config-2") == [
+        device1
+    ]
+
+    device1 = registry.async_update_device(
+        device1.id, area_id="area-2", remove_config_entry_id="config-1"
+    )
+    assert device_registry.async_entries_for_area(registry, "area-1") == [device2]
+    assert device_registry.async_entries_for_area(registry, "area-2") == [device1]
+    assert device_registry.async_entries_for_config_entry(registry, "config-1") == [
+        device2
+    ]
+
+    registry.async_clear_area_id("area-1")
+    assert device_registry.async_entries_for_area(registry, "area-1") == []
+
+    registry.async_remove_device(device1.id)
+    assert device_registry.async_entries_for_area(registry, "area-2") == []
+    assert device_registry.async_entries_for_config_entry(registry, "config-2") == []
+
+
 async def test_update_remove_config_entries(hass, registry, update_events):
     """Make sure we do not get duplicate entries."""
     entry = registry.async_get_or_create(
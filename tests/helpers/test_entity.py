@@ -7,14 +7,22 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
-from homeassistant.const import ATTR_DEVICE_CLASS, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    EVENT_STATE_CHANGED,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
 from homeassistant.core import Context, HomeAssistantError
 from homeassistant.helpers import entity, entity_registry
+from homeassistant.util import dt as dt_util
 
 from tests.common import (
     MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
+    async_capture_events,
+    async_fire_time_changed,
     get_test_home_assistant,
     mock_registry,
 )
@@ -790,3 +798,143 @@ async def test_float_conversion(hass):
     state = hass.states.get("hello.world")
     assert state is not None
     assert state.state == "3.6"
+
+
+async def test_coalesce_state_writes(hass):
+    """Test state writes within one loop iteration are coalesced."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_state_write_window = timedelta(0)
+    # The initial state is written immediately
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == STATE_UNKNOWN
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    for value in ("1", "2", "3"):
+        ent._attr_state = value
+        ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == STATE_UNKNOWN
+
+    # Run the coalesced write, then the event listeners
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert hass.states.get("hello.world").state == "3"
+    assert entity.coalesced_state_writes(hass)["hello.world"] == 2
+
+    ent._attr_state = "4"
+    ent.async_write_ha_state()
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    assert entity.coalesced_state_writes(hass)["hello.world"] == 2
+
+
+async def test_coalesce_state_writes_window(hass):
+    """Test state writes within the window are coalesced."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_state_write_window = timedelta(seconds=1)
+    # The initial state is written immediately
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == STATE_UNKNOWN
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    ent._attr_state = "1"
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    ent._attr_state = "2"
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert hass.states.get("hello.world").state == STATE_UNKNOWN
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert hass.states.get("hello.world").state == "2"
+    assert entity.coalesced_state_writes(hass)["hello.world"] == 1
+
+
+async def test_coalesce_state_writes_superseded(hass):
+    """Test a direct state write cancels the coalesced write."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_state_write_window = timedelta(0)
+    # The initial state is written immediately
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == STATE_UNKNOWN
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    ent._attr_state = "1"
+    ent.async_write_ha_state()
+    ent._attr_state = "2"
+    await ent.async_update_ha_state()
+    assert hass.states.get("hello.world").state == "2"
+
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert ent._pending_write is None
+
+
+async def test_coalesce_state_writes_flushed_on_remove(hass):
+    """Test the coalesced write is made before the entity is removed."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_state_write_window = timedelta(seconds=1)
+    # The initial state is written immediately
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == STATE_UNKNOWN
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    ent._attr_state = "1"
+    ent.async_write_ha_state()
+    await ent.async_remove()
+    await hass.async_block_till_done()
+
+    assert [
+        event.data["new_state"] and event.data["new_state"].state for event in events
+    ] == ["1", None]
+    assert hass.states.get("hello.world") is None
+
+
+async def test_cache_static_attributes(hass):
+    """Test the static state attributes are cached until invalidated."""
+    entry = entity_registry.RegistryEntry(
+        entity_id="hello.world",
+        unique_id="test-unique-id",
+        platform="test-platform",
+    )
+    registry = mock_registry(hass, {"hello.world": entry})
+
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.registry_entry = entry
+    ent._attr_cache_static_attributes = True
+    ent._attr_icon = "mdi:one"
+    ent._attr_extra_state_attributes = {"value": 1}
+    ent.add_to_platform_start(hass, MagicMock(platform_name="test-platform"), None)
+    await ent.add_to_platform_finish()
+
+    ent._attr_icon = "mdi:two"
+    ent._attr_extra_state_attributes = {"value": 2}
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes["icon"] == "mdi:one"
+    assert state.attributes["value"] == 2
+
+    ent.async_invalidate_static_attributes()
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes["icon"] == "mdi:two"
+
+    registry.async_update_entity("hello.world", name="Registry name")
+    await hass.async_block_till_done()
+    assert hass.states.get("hello.world").attributes["friendly_name"] == "Registry name"
@@ -352,6 +352,59 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_indexes_follow_updates(registry):
+    """Test entries by device, area and config entry follow updates."""
+    entry1 = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=MockConfigEntry(entry_id="config-1")
+    )
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=MockConfigEntry(entry_id="config-1")
+    )
+    entry1 = registry._async_update_entity(
+        entry1.entity_id, device_id="device-1", area_id="area-1"
+    )
+    entry2 = registry._async_update_entity(entry2.entity_id, device_id="device-1")
+
+    assert er.async_entries_for_device(registry, "device-1") == [entry1, entry2]
+    assert er.async_entries_for_area(registry, "area-1") == [entry1]
+    assert er.async_entries_for_config_entry(registry, "config-1") == [
+        entry1,
+        entry2,
+    ]
+
+    # Updating an entry keeps its position
+    entry1 = registry.async_update_entity(entry1.entity_id, name="Renamed")
+    assert er.async_entries_for_device(registry, "device-1") == [entry1, entry2]
+
+    entry1 = registry.async_update_entity(
+        entry1.entity_id, area_id="area-2", new_entity_id="light.renamed"
+    )
+    entry2 = registry.async_update_entity(
+        entry2.entity_id, disabled_by=er.DISABLED_USER
+    )
+    assert er.async_entries_for_area(registry, "area-1") == []
+    assert er.async_entries_for_area(registry, "area-2") == [entry1]
+    assert er.async_entries_for_device(registry, "device-1") == [entry1]
+    # Renamed entries move to the end like in the registry
+    assert er.async_entries_for_device(
+        registry, "device-1", include_disabled_entities=True
+    ) == [entry2, entry1]
+    assert list(registry.entities.values()) == [entry2, entry1]
+
+    registry.async_remove(entry1.entity_id)
+    assert er.async_entries_for_area(registry, "area-2") == []
+    assert er.async_entries_for_config_entry(registry, "config-1") == [entry2]
+
+    registry.async_clear_config_entry("config-1")
+    assert (
+        er.async_entries_for_device(
+            registry, "device-1", include_disabled_entities=True
+        )
+        == []
+    )
+    assert registry.entities == {}
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_migration(hass):
     """Test migration from old data to new."""
@@ -2673,6 +2673,56 @@ async def test_async_track_time_change(hass):
     assert len(wildcard_runs) == 3
 
 
+async def test_time_patterns_share_one_timer(hass, caplog):
+    """Test time pattern listeners due together run from one timer."""
+    runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    @callback
+    def broken_listener(now):
+        raise ValueError("boom")
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        timers_before = len(hass.loop._scheduled)
+        unsub_broken = async_track_utc_time_change(hass, broken_listener, second=0)
+        unsub_first = async_track_utc_time_change(
+            hass, callback(lambda x: runs.append(("first", x))), second=0
+        )
+        unsub_second = async_track_utc_time_change(
+            hass, callback(lambda x: runs.append(("second", x))), minute=0, second=0
+        )
+        assert len(hass.loop._scheduled) == timers_before + 1
+
+    noon = datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    async_fire_time_changed(hass, noon)
+    await hass.async_block_till_done()
+    assert runs == [("first", noon), ("second", noon)]
+    assert "boom" in caplog.text
+
+    unsub_first()
+    unsub_broken()
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 1, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+
+    one_pm = datetime(now.year + 1, 5, 24, 13, 0, 0, 999999, tzinfo=dt_util.UTC)
+    async_fire_time_changed(hass, one_pm)
+    await hass.async_block_till_done()
+    assert runs[2:] == [("second", one_pm)]
+
+    unsub_second()
+
+
 async def test_periodic_task_minute(hass):
     """Test periodic tasks per minute."""
     specific_runs = []
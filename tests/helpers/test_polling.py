@@ -0,0 +1,112 @@
+"""Test the polling scheduler."""
+# pylint: disable=protected-access
+import asyncio
+from datetime import timedelta
+from unittest.mock import Mock
+
+from homeassistant.helpers import polling
+import homeassistant.util.dt as dt_util
+
+from tests.common import MockEntity, MockEntityPlatform, async_fire_time_changed
+
+SCAN_INTERVAL = timedelta(seconds=20)
+
+
+async def _async_fire_scan_interval(hass, intervals=1):
+    """Fire the time changed event after a number of scan intervals."""
+    async_fire_time_changed(hass, dt_util.utcnow() + SCAN_INTERVAL * intervals)
+    await hass.async_block_till_done()
+
+
+async def test_polls_are_spread(hass):
+    """Test entities added together are moved to different slots."""
+    platform = MockEntityPlatform(hass, scan_interval=SCAN_INTERVAL)
+    entities = [MockEntity(should_poll=True) for _ in range(10)]
+    for ent in entities:
+        ent.async_update = Mock()
+    await platform.async_add_entities(entities)
+
+    scheduler = polling.async_get_polling_scheduler(hass)
+    assert sum(scheduler._slots.values()) == 10
+
+    await _async_fire_scan_interval(hass)
+    assert all(len(ent.async_update.mock_calls) == 1 for ent in entities)
+    assert sorted(scheduler._slots.values()) == [1] * 10
+
+    await _async_fire_scan_interval(hass)
+    assert all(len(ent.async_update.mock_calls) == 2 for ent in entities)
+
+    stats = polling.async_get_polling_stats(hass)["test_domain.test_platform"]
+    assert stats.polls == 20
+    assert stats.failures == 0
+    assert stats.overruns == 0
+
+
+async def test_skip_poll_while_running(hass, caplog):
+    """Test an entity is not polled while the previous poll is running."""
+    platform = MockEntityPlatform(hass, scan_interval=SCAN_INTERVAL)
+    updating = asyncio.Event()
+    done = asyncio.Event()
+    ent = MockEntity(should_poll=True)
+    calls = []
+
+    async def async_update():
+        calls.append(None)
+        updating.set()
+        await done.wait()
+
+    ent.async_update = async_update
+    await platform.async_add_entities([ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + SCAN_INTERVAL)
+    await updating.wait()
+    async_fire_time_changed(hass, dt_util.utcnow() + SCAN_INTERVAL)
+    done.set()
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    stats = polling.async_get_polling_stats(hass)["test_domain.test_platform"]
+    assert stats.polls == 1
+    assert stats.overruns == 1
+    assert stats.max_latency > 0
+    assert "took longer than the scheduled update interval" in caplog.text
+
+
+async def test_backoff_failing_entity(hass):
+    """Test an entity which keeps failing is polled less often."""
+    platform = MockEntityPlatform(hass, scan_interval=SCAN_INTERVAL)
+    ent = MockEntity(should_poll=True)
+    ent.update = Mock(side_effect=ValueError)
+    await platform.async_add_entities([ent])
+
+    for _ in range(polling.BACKOFF_FAILURES):
+        await _async_fire_scan_interval(hass)
+    assert len(ent.update.mock_calls) == polling.BACKOFF_FAILURES
+
+    await _async_fire_scan_interval(hass)
+    assert len(ent.update.mock_calls) == polling.BACKOFF_FAILURES
+
+    ent.update = Mock()
+    await _async_fire_scan_interval(hass, 2)
+    assert len(ent.update.mock_calls) == 1
+
+    stats = polling.async_get_polling_stats(hass)["test_domain.test_platform"]
+    assert stats.failures == polling.BACKOFF_FAILURES
+
+
+async def test_removed_entity_not_polled(hass):
+    """Test removed entities and platforms which stopped polling aren't polled."""
+    platform = MockEntityPlatform(hass, scan_interval=SCAN_INTERVAL)
+    ent1 = MockEntity(should_poll=True)
+    ent1.async_update = Mock()
+    ent2 = MockEntity(should_poll=True)
+    ent2.async_update = Mock()
+    await platform.async_add_entities([ent1, ent2])
+
+    await platform.async_remove_entity(ent1.entity_id)
+    await _async_fire_scan_interval(hass)
+    assert not ent1.async_update.called
+    assert ent2.async_update.called
+
+    await platform.async_reset()
+    assert not polling.async_get_polling_scheduler(hass)._slots
@@ -1,13 +1,17 @@
 """The tests for the Restore component."""
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import restore_state
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.json import json_loads
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
+    STATE_COMPACT_INTERVAL,
+    STORAGE_JOURNAL_SUFFIX,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -74,7 +78,7 @@ async def test_periodic_write(hass):
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData._async_append_journal"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
@@ -82,7 +86,7 @@ async def test_periodic_write(hass):
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData._async_append_journal"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
@@ -90,7 +94,7 @@ async def test_periodic_write(hass):
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData._async_append_journal"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
         await hass.async_block_till_done()
@@ -121,7 +125,7 @@ async def test_save_persistent_states(hass):
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData._async_append_journal"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=10))
         await hass.async_block_till_done()
@@ -130,7 +134,7 @@ async def test_save_persistent_states(hass):
     assert not mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData._async_append_journal"
     ) as mock_write_data:
         await RestoreStateData.async_save_persistent_states(hass)
         await hass.async_block_till_done()
@@ -138,7 +142,7 @@ async def test_save_persistent_states(hass):
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData._async_append_journal"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
         await hass.async_block_till_done()
@@ -146,7 +150,7 @@ async def test_save_persistent_states(hass):
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData._async_append_journal"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
@@ -203,8 +207,10 @@ async def test_hass_starting(hass):
     assert mock_write_data.called
 
 
-async def test_dump_data(hass):
+async def test_dump_data(hass, hass_storage):
     """Test that we cache data."""
+    # Skip the dump at start so the first dump below compacts
+    hass.state = CoreState.not_running
     states = [
         State("input_boolean.b0", "on"),
         State("input_boolean.b1", "on"),
@@ -262,19 +268,48 @@ async def test_dump_data(hass):
     # Test that removed entities are not persisted
     await entity.async_remove()
 
+    journal_key = f"{STORAGE_KEY}{STORAGE_JOURNAL_SUFFIX}"
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
 
+    # Only the removal of b1 is appended to the journal
+    assert not mock_write_data.called
+    assert hass_storage[journal_key] == [
+        {"entity_id": "input_boolean.b1", "last_seen": ANY}
+    ]
+
+    # Changed states are appended to the journal
+    states[4:] = [State("input_boolean.b5", "on", {"restored": True})]
+    data.last_states["input_boolean.b5"] = StoredState(states[4], now)
+    with patch.object(hass.states, "async_all", return_value=states):
+        await data.async_dump_states()
+
+    assert len(hass_storage[journal_key]) == 2
+    assert hass_storage[journal_key][1]["state"]["entity_id"] == "input_boolean.b5"
+    assert hass_storage[journal_key][1]["state"]["state"] == "on"
+
+    # The journal is compacted into the store periodically
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data, patch.object(
+        hass.states, "async_all", return_value=states
+    ), patch(
+        "homeassistant.helpers.restore_state.dt_util.utcnow",
+        return_value=now + STATE_COMPACT_INTERVAL + timedelta(minutes=1),
+    ):
+        await data.async_dump_states()
+
     assert mock_write_data.called
+    assert journal_key not in hass_storage
     args = mock_write_data.mock_calls[0][1]
     written_states = args[0]
     assert len(written_states) == 2
     assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
     assert written_states[0]["state"]["state"] == "off"
     assert written_states[1]["state"]["entity_id"] == "input_boolean.b5"
-    assert written_states[1]["state"]["state"] == "off"
+    assert written_states[1]["state"]["state"] == "on"
 
 
 async def test_dump_error(hass):
@@ -376,3 +411,79 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_replaying_journal(hass, hass_storage):
+    """Test the journal is replayed over the stored states on load."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            StoredState(State(f"input_boolean.b{idx}", "off"), now).as_dict()
+            for idx in range(3)
+        ],
+    }
+    hass_storage[f"{STORAGE_KEY}{STORAGE_JOURNAL_SUFFIX}"] = [
+        # Written before the store was compacted
+        json_loads(
+            StoredState(
+                State("input_boolean.b0", "on"), now - timedelta(minutes=15)
+            ).as_json()
+        ),
+        json_loads(
+            StoredState(
+                State("input_boolean.b1", "on"), now + timedelta(minutes=15)
+            ).as_json()
+        ),
+        {"entity_id": "input_boolean.b2", "last_seen": now + timedelta(minutes=15)},
+        json_loads(
+            StoredState(
+                State("input_boolean.b3", "on"), now + timedelta(minutes=15)
+            ).as_json()
+        ),
+    ]
+    hass_storage[f"{STORAGE_KEY}{STORAGE_JOURNAL_SUFFIX}"][2]["last_seen"] = (
+        now + timedelta(minutes=15)
+    ).isoformat()
+
+    data = await RestoreStateData.async_get_instance(hass)
+
+    assert {
+        entity_id: stored_state.state.state
+        for entity_id, stored_state in data.last_states.items()
+    } == {
+        "input_boolean.b0": "off",
+        "input_boolean.b1": "on",
+        "input_boolean.b3": "on",
+    }
+
+
+def test_stored_state_as_json_with_nan():
+    """Test a stored state with NaN attributes can be written to the journal."""
+    now = dt_util.utcnow()
+    stored_state = StoredState(State("sensor.nan", "1", {"hello": float("NaN")}), now)
+
+    assert json_loads(stored_state.as_json())["state"]["entity_id"] == "sensor.nan"
+
+
+def test_journal_file(tmp_path):
+    """Test appending, loading and removing the journal file."""
+    path = str(tmp_path / ".storage" / "core.restore_state.journal")
+
+    assert restore_state._load_journal(path) == []
+
+    restore_state._append_journal(path, [b'{"entity_id":"input_boolean.b0"}'])
+    restore_state._append_journal(path, [b'{"entity_id":"input_boolean.b1"}'])
+    # A partially written entry is skipped
+    with open(path, "ab") as journal:
+        journal.write(b'{"entity_id":"inp')
+
+    assert restore_state._load_journal(path) == [
+        {"entity_id": "input_boolean.b0"},
+        {"entity_id": "input_boolean.b1"},
+    ]
+
+    restore_state._remove_journal(path)
+    restore_state._remove_journal(path)
+    assert restore_state._load_journal(path) == []
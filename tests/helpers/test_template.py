@@ -2662,35 +2662,49 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_cache(hass):
+    """Test identical templates are compiled once for each kind of environment."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
-    tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    template._COMPILED_CACHE.clear()  # pylint: disable=protected-access
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl = template.Template(template_string)
+    tpl.ensure_valid()
+    tpl2 = template.Template(template_string)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert tpl._compiled_code is tpl2._compiled_code
+    assert template.compiled_cache_info() == (1, 1, template.COMPILED_CACHE_SIZE, 1)
+
+    # The code is kept when the templates are gone
+    del tpl, tpl2
+    template.Template(template_string).ensure_valid()
+    assert template.compiled_cache_info().hits == 2
+
+    # Templates with hass are compiled in another kind of environment
+    tpl3 = template.Template(template_string, hass)
+    tpl3.ensure_valid()
+    tpl4 = template.Template(template_string, hass)
+    tpl4.ensure_valid()
+    assert tpl3._compiled_code is tpl4._compiled_code
+    assert template.compiled_cache_info() == (3, 2, template.COMPILED_CACHE_SIZE, 2)
+    assert tpl3.async_render() == tpl4.async_render() == "foo=x%26y&bar=42"
+
+
+async def test_compiled_cache_size():
+    """Test the least recently used code is dropped from the compiled cache."""
+    cache = template._CompiledCache(2)  # pylint: disable=protected-access
+    env = template._NO_HASS_ENV  # pylint: disable=protected-access
+    with patch.object(template, "_COMPILED_CACHE", cache):
+        first = env.compile("{{ 1 }}")
+        env.compile("{{ 2 }}")
+        assert env.compile("{{ 1 }}") is first
+        env.compile("{{ 3 }}")
+        assert env.compile("{{ 1 }}") is first
+        assert cache.info() == (2, 3, 2, 2)
+        env.compile("{{ 2 }}")
+
+    assert cache.info() == (2, 4, 2, 2)
 
 
 def test_is_template_string():
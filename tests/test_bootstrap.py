@@ -7,11 +7,12 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.setup import DATA_SETUP_STARTED, DATA_SETUP_TIME
 import homeassistant.util.dt as dt_util
 
 from tests.common import (
@@ -719,3 +720,44 @@ async def test_warning_logged_on_wrap_up_timeout(hass, caplog):
         await hass.async_block_till_done()
 
     assert "Setup timed out for bootstrap - moving forward" in caplog.text
+
+
+async def test_preimport_integrations(hass):
+    """Test integrations are imported in the executor in dependency order."""
+    root = loader.Integration(
+        hass,
+        "homeassistant.components.preimport_root",
+        None,
+        MockModule("preimport_root").mock_manifest(),
+    )
+    child = loader.Integration(
+        hass,
+        "homeassistant.components.preimport_child",
+        None,
+        MockModule("preimport_child", dependencies=["preimport_root"]).mock_manifest(),
+    )
+    hass.data[loader.DATA_INTEGRATIONS] = {
+        "preimport_root": root,
+        "preimport_child": child,
+    }
+    await child.resolve_dependencies()
+
+    imported = []
+
+    def mock_import_modules(integration, platform_names):
+        imported.append((integration.domain, set(platform_names)))
+        if integration.domain == "preimport_child":
+            raise ImportError("Mocked unable to import")
+
+    with patch.object(loader.Integration, "import_modules", mock_import_modules):
+        await bootstrap._async_preimport_integrations(
+            hass, {"preimport_child": child, "preimport_root": root}, {"light"}
+        )
+
+    assert imported == [
+        ("preimport_root", {"light"}),
+        ("preimport_child", {"light"}),
+    ]
+    assert "preimport_root" in hass.data[DATA_SETUP_TIME]
+    assert "preimport_child" in hass.data[DATA_SETUP_TIME]
+    assert not hass.data[DATA_SETUP_STARTED]
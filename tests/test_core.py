@@ -383,6 +383,27 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_dict_json():
+    """Test a State as JSON."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        context=ha.Context(id="01G0BMAE0TEKVFX0B5QQKTRYGK"),
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    expected = (
+        b'{"entity_id":"happy.happy","state":"on","attributes":{"pig":"dog"},'
+        b'"last_changed":"1984-12-08T12:00:00","last_updated":"1984-12-08T12:00:00",'
+        b'"context":{"id":"01G0BMAE0TEKVFX0B5QQKTRYGK","parent_id":null,"user_id":null}}'
+    )
+    assert state.as_dict_json() == expected
+    # 2nd time to verify cache
+    assert state.as_dict_json() is state.as_dict_json()
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -431,6 +452,94 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass):
+    """Test we can route events by an event data key."""
+    calls = []
+    all_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock match all listener."""
+        all_calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", listener, "entity_id", {"light.kitchen", "light.hall"}
+    )
+    unsub_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.hall"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == ["light.kitchen"]
+    assert len(all_calls) == 5
+
+    unsub_all()
+    hass.bus.async_fire("test", {"entity_id": "light.hall"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert len(all_calls) == 5
+
+    unsub()
+    hass.bus.async_fire("test", {"entity_id": "light.hall"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_dispatch_cache_does_not_grow(hass):
+    """Test only event types with own listeners get a cached dispatch."""
+    calls = []
+    all_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock match all listener."""
+        all_calls.append(event)
+
+    for index in range(10):
+        hass.bus.async_fire(f"unheard_{index}")
+    await hass.async_block_till_done()
+    assert not any(
+        event_type.startswith("unheard_") for event_type in hass.bus._dispatch
+    )
+
+    unsub_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_listen("test", listener)
+    for index in range(10):
+        hass.bus.async_fire(f"unheard_{index}")
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert not any(
+        event_type.startswith("unheard_") for event_type in hass.bus._dispatch
+    )
+    assert len(all_calls) == 11
+    assert len(calls) == 1
+
+    unsub_all()
+    hass.bus.async_fire("unheard_0")
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(all_calls) == 11
+    assert len(calls) == 2
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1547,6 +1656,33 @@ async def test_async_entity_ids_count(hass):
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_domain_index_follows_set_and_remove(hass):
+    """Test domain filtered lookups stay in sync with set and remove."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.bowl", "off", {"brightness": 10})
+
+    assert hass.states.async_entity_ids("light") == ["light.bowl", "light.frog"]
+    assert hass.states.async_all("LIGHT")[0].state == "off"
+    assert hass.states.async_entity_ids(["switch", "light", "switch"]) == [
+        "switch.link",
+        "light.bowl",
+        "light.frog",
+    ]
+    assert hass.states.async_entity_ids_count(["light", "light"]) == 2
+
+    hass.states.async_remove("light.bowl")
+    hass.states.async_remove("switch.link")
+
+    assert hass.states.async_entity_ids("light") == ["light.frog"]
+    assert hass.states.async_all("switch") == []
+    assert hass.states.async_entity_ids_count(["switch", "vacuum"]) == 0
+
+    hass.states.async_set("switch.link", "off")
+    assert hass.states.async_entity_ids("switch") == ["switch.link"]
+
+
 async def test_hassjob_forbid_coroutine():
     """Test hassjob forbids coroutines."""
 
@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+import asyncio
+import json
+import pathlib
 from unittest.mock import patch
 
 import pytest
@@ -160,6 +163,59 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_manifest_index(hass):
+    """Test built-in integrations are resolved from the manifest index."""
+    with patch("homeassistant.loader.Integration.resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "http")
+
+    assert not mock_resolve.called
+    assert integration.pkg_path == "homeassistant.components.http"
+    assert integration.file_path == pathlib.Path(http.__file__).parent
+    assert integration.is_built_in
+    assert integration.get_component() is http
+
+
+async def test_get_integration_without_manifest_index(hass):
+    """Test built-in integrations are resolved without a manifest index."""
+    with patch.object(loader, "MANIFEST_INDEX_PATH", pathlib.Path("/non/existing")):
+        integration = await loader.async_get_integration(hass, "http")
+
+    assert hass.data[loader.DATA_MANIFEST_INDEX] == {}
+    assert integration.get_component() is http
+
+
+async def test_manifest_index_version_mismatch(hass, tmp_path):
+    """Test a manifest index of another version is ignored."""
+    index_path = tmp_path / "manifests.json"
+    index_path.write_text(
+        json.dumps(
+            {
+                "version": loader.MANIFEST_INDEX_VERSION + 1,
+                "manifests": {"http": {"domain": "http", "name": "HTTP"}},
+            }
+        )
+    )
+
+    with patch.object(loader, "MANIFEST_INDEX_PATH", index_path):
+        assert await loader.async_get_manifest_index(hass) == {}
+
+
+async def test_manifest_index_loaded_once(hass):
+    """Test the manifest index is read once."""
+    with patch(
+        "homeassistant.loader._load_manifest_index",
+        return_value={"http": {"domain": "http", "name": "HTTP"}},
+    ) as mock_load:
+        await asyncio.gather(
+            loader.async_get_manifest_index(hass),
+            loader.async_get_manifest_index(hass),
+        )
+        index = await loader.async_get_manifest_index(hass)
+
+    assert index == {"http": {"domain": "http", "name": "HTTP"}}
+    assert len(mock_load.mock_calls) == 1
+
+
 async def test_get_integration_legacy(hass, enable_custom_integrations):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
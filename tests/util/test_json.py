@@ -1,18 +1,20 @@
 """Test Home Assistant json utility functions."""
 from datetime import datetime
 from functools import partial
+import importlib.util
 from json import JSONEncoder, dumps
 import math
 import os
 import sys
 from tempfile import mkdtemp
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.json import (
     SerializationError,
     find_paths_unserializable_data,
@@ -28,6 +30,23 @@ TEST_BAD_SERIALIED = "THIS IS NOT JSON\n"
 TMP_DIR = None
 
 
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request):
+    """Return the JSON utilities with the orjson or the json module backend."""
+    if request.param == "orjson":
+        if json_util.JSON_BACKEND != "orjson":
+            pytest.skip("orjson is not installed")
+        return json_util
+    spec = importlib.util.spec_from_file_location(
+        "json_util_stdlib", json_util.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"orjson": None}):
+        spec.loader.exec_module(module)
+    assert module.JSON_BACKEND == "json"
+    return module
+
+
 def setup():
     """Set up for tests."""
     global TMP_DIR
@@ -178,3 +197,44 @@ def test_find_unserializable_data():
         )
         == {"$(BadData).bla": bad_data}
     )
+
+
+def test_json_dumps(json_backend):
+    """Test the JSON encode and decode functions."""
+    now = dt_util.utcnow()
+    state = State("test.test", "hello", {"now": now}, now, now)
+    data = {"state": state, "when": now, "tags": {"milk"}}
+
+    json_str = json_backend.json_dumps(data)
+    assert " " not in json_str
+    assert json_backend.json_bytes(data) == json_str.encode("utf-8")
+    assert json_backend.json_loads(json_str) == {
+        "state": json_backend.json_loads(json_backend.json_dumps(state.as_dict())),
+        "when": now.isoformat(),
+        "tags": ["milk"],
+    }
+
+    with pytest.raises(TypeError):
+        json_backend.json_dumps({"bad": object()})
+
+
+def test_json_dumps_not_allows_nan(json_backend):
+    """Test NaN and infinite floats are rejected if not allowed."""
+    with pytest.raises(ValueError):
+        json_backend.json_dumps({"hello": [float("NaN")]}, allow_nan=False)
+    with pytest.raises(ValueError):
+        json_backend.json_bytes(
+            State("test.test", "hello", {"hello": float("inf")}), allow_nan=False
+        )
+    assert (
+        json_backend.json_dumps({"hello": None, "world": 1.5}, allow_nan=False)
+        == '{"hello":null,"world":1.5}'
+    )
+
+    value = json_backend.json_loads(json_backend.json_dumps(float("NaN")))
+    assert value is None or math.isnan(value)
+
+
+def test_json_loads_nan(json_backend):
+    """Test the NaN written by the json module can be loaded."""
+    assert math.isnan(json_backend.json_loads(dumps({"hello": float("NaN")}))["hello"])
@@ -0,0 +1,227 @@
+"""Test the cache of parsed YAML files."""
+from datetime import date, datetime
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.yaml import (
+    Input,
+    Secrets,
+    YamlCache,
+    load_yaml,
+    loader as yaml_loader,
+)
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Write a split configuration."""
+    (tmp_path / "configuration.yaml").write_text(
+        "homeassistant:\n"
+        "  name: !secret name\n"
+        "automation: !include automations.yaml\n"
+        "sensor: !include_dir_merge_list sensors\n"
+        "group: !include_dir_named groups\n"
+        "home: !env_var YAML_CACHE_TEST_HOME /default\n"
+    )
+    (tmp_path / "secrets.yaml").write_text("name: Home\npassword: pwd\n")
+    (tmp_path / "automations.yaml").write_text(
+        "- alias: Morning\n  trigger: []\n  action: []\n"
+    )
+    (tmp_path / "sensors").mkdir()
+    (tmp_path / "sensors" / "template.yaml").write_text(
+        "- platform: template\n  password: !secret password\n"
+    )
+    (tmp_path / "groups").mkdir()
+    (tmp_path / "groups" / "kitchen.yaml").write_text("entities:\n  - light.a\n")
+    _set_modified_before(tmp_path.glob("**/*.yaml"))
+    return tmp_path
+
+
+def _set_modified_before(paths):
+    """Set the modification time of files to before the recent interval."""
+    modified = time.time() - 60
+    for path in paths:
+        os.utime(path, (modified, modified))
+
+
+def _load(cache, config_dir):
+    """Load the configuration with the cache."""
+    return cache.load_yaml(str(config_dir / "configuration.yaml"), Secrets(config_dir))
+
+
+def test_cached_load_matches_load_yaml(config_dir, tmp_path):
+    """Test loading from the cache matches loading the YAML files."""
+    cache_path = str(tmp_path / ".storage" / "core.yaml_cache")
+    expected = load_yaml(str(config_dir / "configuration.yaml"), Secrets(config_dir))
+
+    parsed = _load(YamlCache(cache_path), config_dir)
+    assert os.path.isfile(cache_path)
+    cached = _load(YamlCache(cache_path), config_dir)
+
+    for conf in (parsed, cached):
+        assert conf == expected
+        assert conf["homeassistant"]["name"] == "Home"
+        assert conf["home"] == "/default"
+        assert conf["sensor"][0]["password"] == "pwd"
+        assert conf["group"]["kitchen"]["entities"] == ["light.a"]
+        assert conf["automation"].__config_file__ == str(
+            config_dir / "configuration.yaml"
+        )
+        assert conf["automation"].__line__ == 2
+        assert conf["automation"][0].__config_file__ == str(
+            config_dir / "automations.yaml"
+        )
+        assert conf["sensor"][0].__line__ == 0
+
+
+def test_unchanged_files_are_not_parsed(config_dir, tmp_path):
+    """Test only files which changed are parsed again."""
+    cache_path = str(tmp_path / "core.yaml_cache")
+    _load(YamlCache(cache_path), config_dir)
+
+    (config_dir / "automations.yaml").write_text(
+        "- alias: Evening\n  trigger: []\n  action: []\n"
+    )
+    (config_dir / "secrets.yaml").write_text("name: House\npassword: pwd\n")
+    _set_modified_before([config_dir / "automations.yaml"])
+    os.environ["YAML_CACHE_TEST_HOME"] = "/home"
+
+    # pylint: disable-next=protected-access
+    with patch.object(
+        yaml_loader, "_load_yaml", wraps=yaml_loader._load_yaml
+    ) as mock_load:
+        conf = _load(YamlCache(cache_path), config_dir)
+    del os.environ["YAML_CACHE_TEST_HOME"]
+
+    assert [
+        call[1][1]
+        for call in mock_load.mock_calls
+        if call[1][0] is not yaml_loader.FastSafeLoader
+    ] == [str(config_dir / "automations.yaml")]
+    assert conf["automation"][0]["alias"] == "Evening"
+    assert conf["homeassistant"]["name"] == "House"
+    assert conf["home"] == "/home"
+
+
+def test_cached_objects_are_not_shared(config_dir, tmp_path):
+    """Test each load returns new objects."""
+    cache = YamlCache(str(tmp_path / "core.yaml_cache"))
+    _load(cache, config_dir)["group"]["kitchen"]["entities"].append("light.b")
+
+    assert _load(cache, config_dir)["group"]["kitchen"]["entities"] == ["light.a"]
+
+
+def test_removed_files_are_dropped(config_dir, tmp_path):
+    """Test files which are no longer included are removed from the cache."""
+    cache = YamlCache(str(tmp_path / "core.yaml_cache"))
+    _load(cache, config_dir)
+    assert str(config_dir / "groups" / "kitchen.yaml") in cache._files
+
+    (config_dir / "groups" / "kitchen.yaml").unlink()
+    assert _load(cache, config_dir)["group"] == {}
+    assert str(config_dir / "groups" / "kitchen.yaml") not in cache._files
+
+
+def test_missing_include(config_dir, tmp_path):
+    """Test a missing included file raises like without the cache."""
+    cache = YamlCache(str(tmp_path / "core.yaml_cache"))
+    _load(cache, config_dir)
+    (config_dir / "automations.yaml").unlink()
+
+    with pytest.raises(HomeAssistantError, match="Unable to read file"):
+        _load(cache, config_dir)
+
+
+def test_recently_modified_files_are_not_cached(config_dir, tmp_path):
+    """Test files modified within the recent interval are parsed again."""
+    cache = YamlCache(str(tmp_path / "core.yaml_cache"))
+    (config_dir / "automations.yaml").write_text(
+        "- alias: Evening\n  trigger: []\n  action: []\n"
+    )
+    _load(cache, config_dir)
+
+    assert str(config_dir / "configuration.yaml") in cache._files
+    assert str(config_dir / "automations.yaml") not in cache._files
+
+
+def test_invalid_cache_file(config_dir, tmp_path, caplog):
+    """Test an invalid cache file is ignored."""
+    cache_path = tmp_path / "core.yaml_cache"
+    cache_path.write_bytes(b"not json")
+
+    conf = _load(YamlCache(str(cache_path)), config_dir)
+
+    assert conf["homeassistant"]["name"] == "Home"
+    assert "Unable to load YAML cache" in caplog.text
+    assert _load(YamlCache(str(cache_path)), config_dir) == conf
+
+
+def test_cached_types(tmp_path):
+    """Test the YAML types are kept by the cache."""
+    config_path = tmp_path / "blueprint.yaml"
+    config_path.write_text(
+        "day: 2021-12-01\n"
+        "time: 2021-12-01 10:00:00\n"
+        "binary: !!binary aGVsbG8=\n"
+        "set: !!set {a, b}\n"
+        "pairs: !!omap [a: 1, b: 2]\n"
+        "number: 1.5\n"
+        "nan: .nan\n"
+        "input: !input name\n"
+        "1: one\n"
+    )
+    _set_modified_before([config_path])
+    cache_path = str(tmp_path / "core.yaml_cache")
+    expected = load_yaml(str(config_path))
+
+    assert YamlCache(cache_path).load_yaml(str(config_path)).keys() == expected.keys()
+    cached = YamlCache(cache_path).load_yaml(str(config_path))
+
+    assert cached["day"] == date(2021, 12, 1)
+    assert cached["time"] == datetime(2021, 12, 1, 10)
+    assert cached["binary"] == b"hello"
+    assert cached["set"] == {"a", "b"}
+    assert cached["pairs"] == [("a", 1), ("b", 2)]
+    assert cached["number"] == 1.5
+    assert cached["nan"] != cached["nan"]
+    assert cached["input"] == Input("name")
+    assert cached[1] == "one"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"object": "evil"},
+        {"map": [["a"]]},
+        {"map": [[{"seq": []}, 1]]},
+        {"seq": [], "line": "0"},
+        {"date": "2021-12-01", "line": 0},
+        {"deferred": ["!python/name", "os.system", 0, 0]},
+        ["raw list"],
+    ],
+)
+def test_invalid_cache_entry(config_dir, tmp_path, data):
+    """Test a cache entry which doesn't decode is parsed again."""
+    cache_path = tmp_path / "core.yaml_cache"
+    _load(YamlCache(str(cache_path)), config_dir)
+    cache = json.loads(cache_path.read_text())
+    cache["files"][str(config_dir / "automations.yaml")][3] = data
+    cache_path.write_text(json.dumps(cache))
+
+    # pylint: disable-next=protected-access
+    with patch.object(
+        yaml_loader, "_load_yaml", wraps=yaml_loader._load_yaml
+    ) as mock_load:
+        conf = _load(YamlCache(str(cache_path)), config_dir)
+
+    assert [
+        call[1][1]
+        for call in mock_load.mock_calls
+        if call[1][0] is not yaml_loader.FastSafeLoader
+    ] == [str(config_dir / "automations.yaml")]
+    assert conf["automation"][0]["alias"] == "Morning"